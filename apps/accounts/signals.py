@@ -1,14 +1,20 @@
 from django.utils import timezone
 from django.contrib import messages
-from django.contrib.auth.signals import user_logged_in
+from django.contrib.auth.signals import user_logged_in, user_login_failed
 from django.dispatch import receiver
+from apps.study.metrics import ATTENDANCE_CHECKINS, LOGINS
 from .models import Attendance
 import logging
 
 logger = logging.getLogger(__name__)
 
+@receiver(user_login_failed)
+def count_failed_login(sender, credentials, request=None, **kwargs):
+    LOGINS.inc(result='failed')
+
 @receiver(user_logged_in)
 def check_attendance(sender, request, user, **kwargs):
+    LOGINS.inc(result='success')
     logger.debug("====== 출석 체크 시작 ======")
     logger.debug(f"사용자: {user.username}")
     
@@ -24,6 +30,7 @@ def check_attendance(sender, request, user, **kwargs):
     logger.debug(f"출석 기록 생성 여부: {created}")
     
     if created:
+        ATTENDANCE_CHECKINS.inc()
         logger.debug("새로운 출석 기록 생성됨")
         # 어제 날짜의 출석 기록 확인
         yesterday = today - timezone.timedelta(days=1)
@@ -13,6 +13,8 @@ import logging
 from apps.study.views import get_todays_word
 from django.contrib.admin.views.decorators import staff_member_required
 from apps.study.models import DailyMission, DailyMissionModalShown
+from apps.study.cache import get_user_fragment
+from apps.study.stats import get_today_stats, get_total_stats
 
 logger = logging.getLogger(__name__)
 
@@ -22,28 +24,16 @@ def home(request):
     context = {}
     
     if request.user.is_authenticated:
-        # 전체 학습 진도 조회
-        study_progress = StudyProgress.objects.filter(
-            user=request.user,
-            review_count__gt=0
-        )
-        
-        # 오늘의 학습 현황 (한국 시간 기준)
+        # 오늘의 학습 현황 (한국 시간 기준, 일일 통계에서 조회)
         current_time = timezone.localtime(timezone.now())
         today = current_time.date()
-        today_start = timezone.make_aware(datetime.combine(today, datetime.min.time()))
-        today_end = timezone.make_aware(datetime.combine(today, datetime.max.time()))
-        
-        # 한국 시간대로 변환
-        today_start = timezone.localtime(today_start)
-        today_end = timezone.localtime(today_end)
-        
-        today_progress = study_progress.filter(
-            last_reviewed__range=(today_start, today_end)
-        ).count()
-        
-        # 총 학습한 단어 수
-        total_studied_words = study_progress.count()
+        # 오늘/총 학습한 단어 수 (학습 기록이 바뀌면 signals 에서 무효화되는 사용자별 캐시)
+        home_stats = get_user_fragment(request.user, 'home', lambda: {
+            'today_progress': get_today_stats(request.user, today).words_studied,
+            'total_studied_words': get_total_stats(request.user)['words_studied'],
+        }, today)
+        today_progress = home_stats['today_progress']
+        total_studied_words = home_stats['total_studied_words']
         
         # 오늘의 단어 가져오기
         todays_word = get_todays_word()
@@ -287,16 +277,9 @@ def profile_view(request):
     
     logger.debug(f"생성된 주 데이터 수: {len(weeks)}")
     
-    # 오늘 학습한 단어 수 계산
-    today_words = StudyProgress.objects.filter(
-        user=user,
-        last_reviewed__date=today
-    ).count()
-
-    # 총 학습 단어 수 업데이트
-    total_studied = StudyProgress.objects.filter(user=user).count()
-    user.profile.total_studied_words = total_studied
-    user.profile.save()
+    # 오늘 학습한 단어 수 / 총 학습 단어 수 (일일 통계에서 조회)
+    today_words = get_today_stats(user, timezone.localtime().date()).words_studied
+    user.profile.total_studied_words = get_total_stats(user)['words_studied']
 
     context = {
         'user': user,
@@ -5,3 +5,6 @@ class QuizConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.quiz'
     verbose_name = '단어 테스트'
+
+    def ready(self):
+        import apps.quiz.signals
@@ -0,0 +1,117 @@
+"""객관식 오답 보기 생성을 위한 인메모리 단어 풀
+
+문제마다 ``Word.objects.exclude(id=...).order_by('?')[:3]`` 을 실행하면
+단어 테이블 전체를 무작위 정렬하게 되므로, 단어의 id/영어/뜻을 난이도와
+품사별로 묶은 배열을 프로세스 메모리에 한 번만 적재해 두고 보기를
+DB 조회 없이 뽑는다.
+"""
+import random
+import threading
+import time
+from collections import defaultdict, namedtuple
+
+from apps.vocabulary.models import Word
+
+PoolEntry = namedtuple('PoolEntry', ['id', 'english', 'korean', 'difficulty', 'part_of_speech'])
+
+
+class DistractorPool:
+    """난이도/품사별 단어 배열을 보관하는 버전 관리형 풀
+
+    Word 가 저장/삭제되면 signals 에서 ``invalidate()`` 로 버전을 올리고,
+    다음 ``sample()`` 호출 때 한 번의 쿼리로 다시 적재한다.
+    다른 워커 프로세스에서 변경된 단어는 ``MAX_AGE`` 가 지나면 반영된다.
+    """
+
+    MAX_AGE = 600  # 초
+    MAX_ATTEMPTS_PER_OPTION = 8
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._loaded_version = None
+        self._loaded_at = 0.0
+        self._state = ((), {}, {})
+
+    @property
+    def version(self):
+        return self._version
+
+    def invalidate(self):
+        """단어 변경 시 호출 - 다음 조회 때 풀을 다시 만든다."""
+        with self._lock:
+            self._version += 1
+
+    def _is_fresh(self):
+        return (
+            self._loaded_version == self._version
+            and time.monotonic() - self._loaded_at < self.MAX_AGE
+        )
+
+    def _ensure_loaded(self):
+        if self._is_fresh():
+            return self._state
+        with self._lock:
+            if self._is_fresh():
+                return self._state
+            version = self._version
+            rows = Word.objects.order_by().values_list(
+                'id', 'english', 'korean', 'difficulty', 'part_of_speech'
+            )
+            entries = tuple(PoolEntry(*row) for row in rows)
+            groups = defaultdict(list)
+            by_difficulty = defaultdict(list)
+            for position, entry in enumerate(entries):
+                groups[(entry.difficulty, entry.part_of_speech)].append(position)
+                by_difficulty[entry.difficulty].append(position)
+            # 참조를 한 번에 교체해 읽는 쪽에서 반쯤 만들어진 상태를 보지 않게 한다
+            self._state = (entries, dict(groups), dict(by_difficulty))
+            self._loaded_version = version
+            self._loaded_at = time.monotonic()
+            return self._state
+
+    def sample_entries(self, word, count=3, field='korean', rng=random):
+        """word 를 제외한 오답 단어 count 개를 PoolEntry 로 반환
+
+        같은 난이도+품사 그룹에서 먼저 뽑고, 부족하면 같은 난이도,
+        전체 단어 순으로 범위를 넓힌다. field 값(뜻/영어)이 정답이나
+        이미 뽑은 보기와 같은 단어는 건너뛴다.
+        """
+        entries, groups, by_difficulty = self._ensure_loaded()
+        if not entries:
+            return []
+
+        answer = getattr(word, field)
+        seen_ids = {word.id}
+        seen_values = {answer}
+        chosen = []
+
+        candidates = [
+            groups.get((word.difficulty, word.part_of_speech), ()),
+            by_difficulty.get(word.difficulty, ()),
+            range(len(entries)),
+        ]
+        for positions in candidates:
+            if not positions:
+                continue
+            attempts = 0
+            max_attempts = count * self.MAX_ATTEMPTS_PER_OPTION
+            while len(chosen) < count and attempts < max_attempts:
+                attempts += 1
+                entry = entries[positions[rng.randrange(len(positions))]]
+                value = getattr(entry, field)
+                if entry.id in seen_ids or value in seen_values:
+                    continue
+                seen_ids.add(entry.id)
+                seen_values.add(value)
+                chosen.append(entry)
+            if len(chosen) >= count:
+                break
+        return chosen
+
+    def sample(self, word, count=3, field='korean', rng=random):
+        """word 를 제외한 오답 보기 문자열(field 값) count 개를 반환"""
+        return [getattr(entry, field) for entry in self.sample_entries(word, count, field, rng)]
+
+
+distractor_pool = DistractorPool()
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.2 on 2026-10-18 02:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0009_alter_quizattempt_unique_together'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quizattempt',
+            index=models.Index(fields=['user', 'completed_at'], name='quiz_attempt_completed_idx'),
+        ),
+    ]
@@ -72,6 +72,10 @@ class QuizAttempt(models.Model):
         verbose_name_plural = '퀴즈 응시 기록 목록'
         ordering = ['-started_at']
         unique_together = ['user', 'quiz_type', 'mode', 'completed_at']  # 중복 기록 방지를 위한 제약조건 추가
+        indexes = [
+            # 완료된 응시 기록 최신순 조회
+            models.Index(fields=['user', 'completed_at'], name='quiz_attempt_completed_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}의 {self.quiz.title if self.quiz else self.get_type_display()} 응시"
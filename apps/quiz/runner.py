@@ -0,0 +1,228 @@
+"""퀴즈 응시 진행 상태 (quiz_start / quiz_submit)
+
+응시를 시작할 때 퀴즈의 문제와 단어를 한 번만 읽어 캐시에 두고 (캐시에서 밀려나면
+같은 순서로 다시 읽는다), 응시 id 별 진행 상황(제한 시각, 답안)은 워커가 바뀌어도
+이어지도록 세션에 둔다. 답안 제출마다 세션의 답안 목록에 하나를 더할 뿐이고,
+문제별 결과(QuizQuestion 답안, WordStudyHistory)는 마지막 문제를 풀었을 때
+응시 기록과 함께 한 트랜잭션으로 일괄 저장한다.
+"""
+import uuid
+from collections import namedtuple
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.study.models import WordStudyHistory
+from .models import Quiz, QuizAttempt, QuizQuestion
+from .submission import record_submission_metrics
+
+RUN_TIMEOUT = 60 * 60 * 2  # 문제 목록 캐시 보관 시간(초)
+DEFAULT_TIME_LIMIT = 30  # 분 (퀴즈에 제한 시간이 없을 때 화면 타이머용)
+
+QuizInfo = namedtuple('QuizInfo', ['id', 'title', 'quiz_type', 'quiz_type_display', 'time_limit'])
+RunQuestion = namedtuple(
+    'RunQuestion', ['id', 'word_id', 'english', 'korean', 'options', 'correct_option']
+)
+RunAnswer = namedtuple('RunAnswer', ['user_answer', 'is_correct'])
+
+
+def run_cache_key(user_id, run_id):
+    return f'quiz_run:{user_id}:{run_id}'
+
+
+def run_session_key(run_id):
+    return f'quiz_run:{run_id}'
+
+
+def quiz_mode(quiz_type):
+    """포인트 계산용 응시 방식 (객관식/주관식)"""
+    return 'multiple' if quiz_type == 'multiple' else 'typing'
+
+
+def quiz_snapshot(quiz):
+    """(QuizInfo, 문제 목록) - 문제와 단어를 한 번의 쿼리로 읽는다"""
+    rows = QuizQuestion.objects.filter(quiz=quiz).order_by('id').values_list(
+        'id', 'word_id', 'word__english', 'word__korean',
+        'option1', 'option2', 'option3', 'option4', 'correct_option'
+    )
+    questions = tuple(
+        RunQuestion(
+            question_id, word_id, english, korean,
+            tuple(option for option in options if option), correct_option
+        )
+        for question_id, word_id, english, korean, *options, correct_option in rows
+    )
+    info = QuizInfo(quiz.id, quiz.title, quiz.quiz_type, quiz.get_quiz_type_display(), quiz.time_limit)
+    return info, questions
+
+
+class QuizRun:
+    """한 번의 퀴즈 응시 상태 - 문제 목록과 지금까지의 답안"""
+
+    def __init__(self, session, run_id, user_id, quiz, questions, state):
+        self.session = session
+        self.run_id = run_id
+        self.user_id = user_id
+        self.quiz = quiz
+        self.questions = questions
+        self.state = state  # 세션에 저장되는 {'quiz_id', 'end_time', 'answers': [[답, 정답 여부], ...]}
+
+    @classmethod
+    def start(cls, request, quiz):
+        """문제와 단어를 읽어 캐시에 두고 새 응시 상태를 세션에 만든다
+
+        문제가 없으면 None 을 반환한다.
+        """
+        info, questions = quiz_snapshot(quiz)
+        if not questions:
+            return None
+
+        # 같은 퀴즈를 풀다 만 이전 응시는 세션에서 지운다
+        for key in [key for key in request.session.keys() if key.startswith(run_session_key(''))]:
+            if request.session[key].get('quiz_id') == quiz.id:
+                del request.session[key]
+
+        run_id = uuid.uuid4().hex
+        end_time = timezone.now() + timedelta(minutes=quiz.time_limit or DEFAULT_TIME_LIMIT)
+        state = {'quiz_id': quiz.id, 'end_time': end_time.isoformat(), 'answers': []}
+        request.session[run_session_key(run_id)] = state
+        cache.set(run_cache_key(request.user.pk, run_id), (info, questions), RUN_TIMEOUT)
+        return cls(request.session, run_id, request.user.pk, info, questions, state)
+
+    @classmethod
+    def load(cls, request, quiz_id, run_id):
+        """세션에서 응시 상태를 꺼낸다 (없거나 다른 퀴즈의 상태면 None)
+
+        문제 목록이 캐시에 없으면 (다른 워커의 로컬 캐시였거나 밀려난 경우) 다시 읽는다.
+        """
+        if not run_id:
+            return None
+        state = request.session.get(run_session_key(run_id))
+        if state is None or state['quiz_id'] != quiz_id:
+            return None
+        key = run_cache_key(request.user.pk, run_id)
+        snapshot = cache.get(key)
+        if snapshot is None:
+            quiz = Quiz.objects.filter(id=quiz_id).first()
+            if quiz is None:
+                return None
+            snapshot = quiz_snapshot(quiz)
+            cache.set(key, snapshot, RUN_TIMEOUT)
+        info, questions = snapshot
+        return cls(request.session, run_id, request.user.pk, info, questions, state)
+
+    def discard(self):
+        self.session.pop(run_session_key(self.run_id), None)
+        cache.delete(run_cache_key(self.user_id, self.run_id))
+
+    @property
+    def end_time(self):
+        return parse_datetime(self.state['end_time'])
+
+    @property
+    def answers(self):
+        return [RunAnswer(*answer) for answer in self.state['answers']]
+
+    @property
+    def total(self):
+        return len(self.questions)
+
+    @property
+    def finished(self):
+        return len(self.state['answers']) >= self.total
+
+    @property
+    def current_question(self):
+        return None if self.finished else self.questions[len(self.state['answers'])]
+
+    @property
+    def question_number(self):
+        return len(self.state['answers']) + 1
+
+    @property
+    def correct_count(self):
+        return sum(1 for _, is_correct in self.state['answers'] if is_correct)
+
+    def grade(self, question, answer):
+        """답안 채점 -> (저장할 답안, 정답 여부)"""
+        if self.quiz.quiz_type == 'multiple':
+            # 객관식은 보기 번호(1~4)가 넘어온다
+            index = int(answer) - 1 if answer.isdigit() else -1
+            chosen = question.options[index] if 0 <= index < len(question.options) else answer
+            return chosen, index + 1 == question.correct_option
+        expected = question.korean if self.quiz.quiz_type == 'en_to_ko' else question.english
+        return answer, answer.lower() == expected.strip().lower()
+
+    def submit(self, question_id, answer):
+        """현재 문제의 답안을 채점해 세션에 기록
+
+        이미 답한 문제가 다시 제출되면(새로고침/중복 전송) 무시한다.
+        반환값: 기록했으면 True
+        """
+        question = self.current_question
+        if question is None or str(question.id) != str(question_id):
+            return False
+        self.state['answers'].append(list(self.grade(question, answer)))
+        self.session.modified = True
+        return True
+
+    def finish(self, user, points, points_reason):
+        """문제별 답안/학습 이력/응시 기록을 한 트랜잭션으로 저장하고 상태를 지운다
+
+        반환값: (응시 기록, 이번에 저장했는지). QuizAttempt.quiz 는 OneToOne 이므로
+        마지막 답안이 두 번 제출되었거나 다른 탭에서 같은 퀴즈를 먼저 마쳤으면
+        아무것도 쓰지 않고 이미 있는 응시 기록을 돌려준다.
+        """
+        answers = self.answers
+        correct_count = self.correct_count
+        with transaction.atomic():
+            # 같은 퀴즈를 동시에 마치는 요청은 퀴즈 행 잠금으로 줄 세운다
+            Quiz.objects.select_for_update().filter(id=self.quiz.id).first()
+            existing = QuizAttempt.objects.filter(quiz_id=self.quiz.id).first()
+            if existing is not None:
+                created = False
+                attempt = existing
+            else:
+                created = True
+                QuizQuestion.objects.bulk_update(
+                    [
+                        QuizQuestion(id=question.id, user_answer=answer.user_answer, is_correct=answer.is_correct)
+                        for question, answer in zip(self.questions, answers)
+                    ],
+                    ['user_answer', 'is_correct'],
+                )
+                WordStudyHistory.objects.bulk_create([
+                    WordStudyHistory(user=user, word_id=question.word_id, is_correct=answer.is_correct)
+                    for question, answer in zip(self.questions, answers)
+                ])
+                attempt = QuizAttempt.objects.create(
+                    user=user,
+                    quiz_id=self.quiz.id,
+                    quiz_type=self.quiz.quiz_type,
+                    mode=quiz_mode(self.quiz.quiz_type),
+                    score=round(correct_count / self.total * 100),
+                    total_questions=self.total,
+                    correct_answers=correct_count,
+                    completed_at=timezone.now()
+                )
+                user.profile.add_points(points, points_reason)
+        self.discard()
+        if created:
+            record_submission_metrics(attempt.quiz_type, attempt.mode, self.total, correct_count)
+        return attempt, created
+
+    def results(self):
+        """결과 화면용 문제별 답안 목록"""
+        en_to_ko = self.quiz.quiz_type == 'en_to_ko'
+        return [
+            {
+                'question': question.english if en_to_ko else question.korean,
+                'correct_answer': question.korean if en_to_ko else question.english,
+                'user_answer': answer.user_answer,
+                'is_correct': answer.is_correct,
+            }
+            for question, answer in zip(self.questions, self.answers)
+        ]
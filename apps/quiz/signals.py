@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.vocabulary.models import Word
+from .distractors import distractor_pool
+
+
+@receiver(post_save, sender=Word)
+@receiver(post_delete, sender=Word)
+def invalidate_distractor_pool(sender, **kwargs):
+    """단어가 추가/수정/삭제되면 오답 보기 풀을 다시 만들도록 표시"""
+    distractor_pool.invalidate()
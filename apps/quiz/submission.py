@@ -0,0 +1,80 @@
+"""퀴즈 답안 제출 결과를 한 번에 저장하는 공용 처리 로직"""
+from collections import namedtuple
+
+from django.db import transaction
+from django.http import Http404
+from django.utils import timezone
+
+from apps.vocabulary.models import Word
+from apps.study.metrics import QUIZ_ANSWERS, QUIZ_SUBMISSIONS
+from apps.study.models import WordStudyHistory
+from .models import Quiz, QuizQuestion, QuizAttempt
+
+# 채점이 끝난 문제 하나 (단어 id, 사용자 답안, 정답 여부)
+GradedAnswer = namedtuple('GradedAnswer', ['word_id', 'user_answer', 'is_correct'])
+
+
+def record_submission_metrics(quiz_type, mode, total, correct):
+    """채점을 마친 퀴즈를 지표에 반영"""
+    QUIZ_SUBMISSIONS.inc(quiz_type=quiz_type, mode=mode or '-')
+    QUIZ_ANSWERS.inc(correct, result='correct')
+    QUIZ_ANSWERS.inc(total - correct, result='wrong')
+
+
+def save_quiz_submission(user, graded, *, title, quiz_type, score, points, points_reason,
+                         attempt_type=None, mode=None):
+    """채점된 답안 목록을 퀴즈/문제/학습 이력/응시 기록으로 저장
+
+    문제 수와 관계없이 단어 조회 1번, bulk_create 2번, 포인트 지급 1번으로
+    끝나며 전체가 하나의 트랜잭션으로 묶인다.
+    반환값: (attempt, {word_id: Word})
+    """
+    word_ids = [int(answer.word_id) for answer in graded]
+    words = Word.objects.in_bulk(word_ids)
+    if len(words) != len(set(word_ids)):
+        raise Http404('단어를 찾을 수 없습니다.')
+
+    with transaction.atomic():
+        quiz = Quiz.objects.create(
+            title=title,
+            quiz_type=quiz_type,
+            difficulty='medium',
+            created_by=user,
+            is_public=False
+        )
+
+        QuizQuestion.objects.bulk_create([
+            QuizQuestion(
+                quiz=quiz,
+                word=words[word_id],
+                order=i + 1,
+                user_answer=answer.user_answer,
+                is_correct=answer.is_correct
+            )
+            for i, (word_id, answer) in enumerate(zip(word_ids, graded))
+        ])
+
+        WordStudyHistory.objects.bulk_create([
+            WordStudyHistory(
+                user=user,
+                word=words[word_id],
+                is_correct=answer.is_correct
+            )
+            for word_id, answer in zip(word_ids, graded)
+        ])
+
+        attempt = QuizAttempt.objects.create(
+            user=user,
+            quiz=quiz,
+            quiz_type=attempt_type,
+            mode=mode,
+            score=score,
+            total_questions=len(graded),
+            correct_answers=sum(1 for answer in graded if answer.is_correct),
+            completed_at=timezone.now()
+        )
+
+        user.profile.add_points(points, points_reason)
+
+    record_submission_metrics(quiz_type, mode, attempt.total_questions, attempt.correct_answers)
+    return attempt, words
@@ -1,3 +1,150 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import Attendance
+from apps.study.models import WordStudyHistory
+from apps.vocabulary.lookup import word_lookup
+from apps.vocabulary.models import Word
+from .models import Quiz, QuizAttempt, QuizQuestion, WrongAnswerNote
+
+
+class QuizRunTests(TestCase):
+    """quiz_start -> quiz_submit 응시 흐름 (세션의 응시 상태, 마지막에 한 번 저장)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls._make_user('runner')
+        cls.other = cls._make_user('runner-other')
+        words = Word.objects.bulk_create([
+            Word(english=f'run{i}', english_key=f'run{i}', korean=f'뜻 {i}', difficulty='easy')
+            for i in range(3)
+        ])
+        cls.quiz = Quiz.objects.create(
+            title='응시 테스트', quiz_type='multiple', difficulty='easy', created_by=cls.user
+        )
+        QuizQuestion.objects.bulk_create([
+            QuizQuestion(quiz=cls.quiz, word=word, order=i, option1=word.korean, option2='오답',
+                         option3='오답 2', option4='오답 3', correct_option=1)
+            for i, word in enumerate(words)
+        ])
+
+    @staticmethod
+    def _make_user(username):
+        user = get_user_model().objects.create_user(
+            username, f'{username}@example.com', 'pw', level_test_completed=True
+        )
+        Attendance.objects.create(user=user, check_date=timezone.localdate())
+        return user
+
+    def setUp(self):
+        cache.clear()
+
+    def _start(self, client):
+        response = client.get(reverse('quiz:quiz_start', args=[self.quiz.id]))
+        self.assertEqual(response.status_code, 200)
+        return response.context['run_id'], response.context['question']
+
+    def _answer(self, client, run_id, question, option):
+        return client.post(reverse('quiz:quiz_submit', args=[self.quiz.id]), {
+            'run_id': run_id, 'question_id': question.id, 'answer': option,
+        })
+
+    def _answer_all(self, client, run_id, question):
+        """마지막 문제 전까지 답하고 (마지막 문제, 마지막 답안 응답) 반환"""
+        while True:
+            response = self._answer(client, run_id, question, '1')
+            if response.status_code != 200 or 'question' not in response.context:
+                return question, response
+            question = response.context['question']
+
+    def test_normal_run_writes_once_at_the_end(self):
+        self.client.force_login(self.user)
+        run_id, question = self._start(self.client)
+
+        response = self._answer(self.client, run_id, question, '2')
+        # 다른 워커로 가거나 캐시에서 밀려나도 세션의 답안으로 이어서 푼다
+        cache.clear()
+        self.assertEqual(response.context['question_number'], 2)
+        self.assertFalse(QuizAttempt.objects.exists())
+
+        _, response = self._answer_all(self.client, run_id, response.context['question'])
+        self.assertTemplateUsed(response, 'quiz/test_result.html')
+        attempt = QuizAttempt.objects.get(quiz=self.quiz)
+        self.assertEqual((attempt.total_questions, attempt.correct_answers), (3, 2))
+        self.assertEqual(WordStudyHistory.objects.filter(user=self.user).count(), 3)
+        self.assertEqual(
+            list(self.quiz.questions.order_by('id').values_list('is_correct', flat=True)), [False, True, True]
+        )
+
+    def test_missing_run_is_reported_as_expired(self):
+        self.client.force_login(self.user)
+        question = self.quiz.questions.order_by('id').first()
+
+        response = self._answer(self.client, 'no-such-run', question, '1')
+        self.assertRedirects(response, reverse('quiz:quiz_detail', args=[self.quiz.id]),
+                             fetch_redirect_response=False)
+        self.assertFalse(QuizAttempt.objects.exists())
+
+    def test_repeated_final_submit_saves_once(self):
+        self.client.force_login(self.user)
+        run_id, question = self._start(self.client)
+        last, _ = self._answer_all(self.client, run_id, question)
+
+        response = self._answer(self.client, run_id, last, '1')
+        attempt = QuizAttempt.objects.get(quiz=self.quiz)
+        self.assertRedirects(response, reverse('quiz:quiz_history_detail', args=[attempt.id]),
+                             fetch_redirect_response=False)
+        self.assertEqual(WordStudyHistory.objects.filter(user=self.user).count(), 3)
+
+    def test_second_run_of_finished_quiz_does_not_fail(self):
+        other_client = self.client_class()
+        self.client.force_login(self.user)
+        other_client.force_login(self.other)
+        run_id, question = self._start(self.client)
+        other_run_id, other_question = self._start(other_client)
+
+        self._answer_all(self.client, run_id, question)
+        _, response = self._answer_all(other_client, other_run_id, other_question)
+
+        self.assertRedirects(response, reverse('quiz:quiz_detail', args=[self.quiz.id]),
+                             fetch_redirect_response=False)
+        self.assertEqual(QuizAttempt.objects.filter(quiz=self.quiz).count(), 1)
+        self.assertFalse(WordStudyHistory.objects.filter(user=self.other).exists())
+
+
+class AddWrongAnswerTests(TestCase):
+    """오답 노트 추가 - 사전에 아직 없는 단어는 DB 에서 정확히 일치하는 단어로 찾는다"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = QuizRunTests._make_user('wrong-answer')
+
+    def _add(self, question):
+        return self.client.post(
+            reverse('quiz:add_wrong_answer'),
+            json.dumps({'question': question, 'answer': 'x', 'user_answer': 'y'}),
+            content_type='application/json',
+        ).json()
+
+    def test_words_missing_from_lookup_are_found_by_key_or_korean(self):
+        self.client.force_login(self.user)
+        word_lookup.invalidate()
+        word_lookup.find('')  # 사전 적재
+        # bulk_create 는 signals 를 거치지 않으므로 (다른 워커에서 추가된 단어처럼) 사전에 없다
+        apple, pear = Word.objects.bulk_create([
+            Word(english='apple', english_key='apple', korean='사과'),
+            Word(english='pear', english_key='pear', korean='배'),
+        ])
 
-# Create your tests here.
+        self.assertTrue(self._add('Apple')['success'])
+        self.assertTrue(self._add('배')['success'])
+        self.assertFalse(self._add('없는 단어')['success'])
+        self.assertEqual(
+            sorted(WrongAnswerNote.objects.filter(user=self.user).values_list('word_id', flat=True)),
+            sorted([apple.id, pear.id])
+        )
@@ -4,10 +4,16 @@ from django.contrib import messages
 from django.utils import timezone
 from django.db.models import Q, Count, Max
 from .models import Quiz, QuizQuestion, QuizAttempt, WrongAnswerNote
-from apps.vocabulary.models import Word
+from .distractors import distractor_pool
+from .submission import GradedAnswer, save_quiz_submission
+from .runner import QuizRun, quiz_mode
+from apps.vocabulary.models import Word, normalize_english
+from apps.vocabulary.lookup import word_lookup
 import random
 from django.urls import reverse
 from apps.study.models import StudyProgress, WordStudyHistory
+from apps.study.cache import get_user_fragment
+from apps.study.metrics import QUIZ_GENERATED
 from django.views.decorators.csrf import csrf_exempt
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST, require_http_methods
@@ -19,15 +25,23 @@ from django.core.paginator import Paginator
 @login_required
 def quiz_home(request):
     """퀴즈 홈 뷰"""
-    # 사용자의 학습 진행 상황 가져오기
-    total_words = Word.objects.count()
-    learned_words = StudyProgress.objects.filter(user=request.user).count()
+    def compute_counts():
+        # 사용자의 학습 진행 상황 가져오기
+        return {
+            'total_words': Word.objects.count(),
+            'learned_words': StudyProgress.objects.filter(user=request.user).count(),
+            # 학습한 단어들의 수 계산
+            'studied_words_count': StudyProgress.objects.filter(
+                user=request.user,
+                review_count__gt=0
+            ).count(),
+        }
     
-    # 학습한 단어들의 수 계산
-    studied_words_count = Word.objects.filter(
-        study_progress__user=request.user,
-        study_progress__review_count__gt=0
-    ).distinct().count()
+    # 학습 기록이 바뀌면 signals 에서 무효화되는 사용자별 캐시
+    counts = get_user_fragment(request.user, 'quiz_home', compute_counts)
+    total_words = counts['total_words']
+    learned_words = counts['learned_words']
+    studied_words_count = counts['studied_words_count']
     
     # 사용자가 생성한 퀴즈 또는 공개된 퀴즈 중 최근 5개
     recent_quizzes = Quiz.objects.filter(
@@ -45,7 +59,7 @@ def quiz_home(request):
     # 선택된 ID로 전체 레코드 조회
     recent_attempts_list = QuizAttempt.objects.filter(
         id__in=recent_attempts_list
-    ).order_by('-completed_at')
+    ).select_related('quiz').order_by('-completed_at')
     
     page_number = request.GET.get('page', 1)
     paginator = Paginator(recent_attempts_list, 5)
@@ -163,7 +177,7 @@ def word_test(request):
         messages.warning(request, '테스트를 위해서는 최소 10개의 단어를 학습해야 합니다.')
         return redirect('study:daily_words')
     
-    test_words = list(studied_words.order_by('?')[:10])
+    test_words = studied_words.sample(10)
     questions = []
     
     for i, word in enumerate(test_words):
@@ -187,6 +201,7 @@ def word_test(request):
             'type': question_type
         })
     
+    QUIZ_GENERATED.inc(quiz_type='word_test')
     return render(request, 'quiz/word_test.html', {
         'questions': questions,
         'bookmarked_only': bookmarked_only
@@ -266,7 +281,7 @@ def quiz_create(request):
             messages.error(request, f'퀴즈 생성을 위해서는 최소 {word_count}개의 단어를 학습해야 합니다.')
             return redirect('quiz:quiz_list')
         
-        words = list(studied_words.order_by('?')[:word_count])
+        words = studied_words.sample(word_count)
         print(f"[DEBUG] Selected {len(words)} words for quiz")
         
         for i, word in enumerate(words, 1):
@@ -275,8 +290,7 @@ def quiz_create(request):
             
             if quiz_type == 'multiple':
                 # 객관식 보기 생성
-                wrong_words = Word.objects.exclude(id=word.id).order_by('?')[:3]
-                options = [word.korean] + [w.korean for w in wrong_words]
+                options = [word.korean] + distractor_pool.sample(word, 3, 'korean')
                 random.shuffle(options)
                 
                 question.option1 = options[0]
@@ -291,6 +305,7 @@ def quiz_create(request):
         questions_count = QuizQuestion.objects.filter(quiz=quiz).count()
         print(f"[DEBUG] Total questions created for quiz: {questions_count}")
         
+        QUIZ_GENERATED.inc(quiz_type='custom')
         messages.success(request, '퀴즈가 생성되었습니다.')
         return redirect('quiz:quiz_detail', quiz_id=quiz.id)
     
@@ -330,25 +345,30 @@ def quiz_detail(request, quiz_id):
 
 @login_required
 def quiz_start(request, quiz_id):
-    """퀴즈 시작 뷰"""
+    """퀴즈 시작 뷰 - 문제를 한 번 읽어 캐시에 두고 응시 상태를 세션에 만든다"""
     quiz = get_object_or_404(Quiz, id=quiz_id)
-    questions = QuizQuestion.objects.filter(quiz=quiz).order_by('id')
     
-    if not questions.exists():
-        messages.error(request, '이 퀴즈에는 문제가 없습니다.')
+    # QuizAttempt.quiz 는 OneToOne 이므로 이미 응시 기록이 있는 퀴즈는 다시 풀 수 없다
+    if QuizAttempt.objects.filter(quiz=quiz).exists():
+        messages.error(request, '이미 응시한 퀴즈입니다.')
         return redirect('quiz:quiz_detail', quiz_id=quiz_id)
     
-    # 첫 번째 문제로 시작
-    first_question = questions.first()
+    run = QuizRun.start(request, quiz)
+    if run is None:
+        messages.error(request, '이 퀴즈에는 문제가 없습니다.')
+        return redirect('quiz:quiz_detail', quiz_id=quiz_id)
     
+    return _render_quiz_question(request, run)
+
+def _render_quiz_question(request, run):
     context = {
-        'quiz': quiz,
-        'question': first_question,
-        'question_number': 1,
-        'total_questions': questions.count(),
-        'end_time': timezone.now() + timezone.timedelta(minutes=30)  # 30분 제한시간
+        'quiz': run.quiz,
+        'run_id': run.run_id,
+        'question': run.current_question,
+        'question_number': run.question_number,
+        'total_questions': run.total,
+        'end_time': run.end_time
     }
-    
     return render(request, 'quiz/quiz_submit.html', context)
 
 def calculate_quiz_points(score, quiz_type, mode):
@@ -369,137 +389,91 @@ def calculate_quiz_points(score, quiz_type, mode):
 
 @login_required
 def quiz_submit(request, quiz_id):
-    """퀴즈 답안 제출 뷰"""
-    quiz = get_object_or_404(Quiz, id=quiz_id)
-    questions = QuizQuestion.objects.filter(quiz=quiz).order_by('id')
+    """퀴즈 답안 제출 뷰
+
+    답안마다 세션의 응시 상태만 읽고 쓰며, 마지막 문제에서 결과를 한 번에 저장한다.
+    """
+    if request.method != 'POST':
+        return redirect('quiz:quiz_start', quiz_id=quiz_id)
     
-    if request.method == 'POST':
-        # 답안 처리
-        answer = request.POST.get('answer', '').strip()
-        question_id = request.POST.get('question_id')
-        
-        try:
-            current_question = questions.get(id=question_id)
-        except QuizQuestion.DoesNotExist:
-            messages.error(request, '잘못된 문제 ID입니다.')
-            return redirect('quiz:quiz_detail', quiz_id=quiz_id)
-        
-        # 답안 정확도 확인
-        is_correct = False
-        if quiz.quiz_type == 'en_to_ko':
-            is_correct = answer.lower() == current_question.word.korean.lower()
-        else:
-            is_correct = answer.lower() == current_question.word.english.lower()
-        
-        # 답안 저장
-        current_question.user_answer = answer
-        current_question.is_correct = is_correct
-        current_question.save()
-        
-        print(f"[DEBUG] Saving answer - Question: {current_question.word.english}, User Answer: {answer}, Correct: {is_correct}")
-        
-        # 학습 기록 저장
-        study_history = WordStudyHistory.objects.create(
-            user=request.user,
-            word=current_question.word,
-            is_correct=is_correct,
-        )
-        print(f"[DEBUG] Created WordStudyHistory - ID: {study_history.id}, Word: {study_history.word.english}, Is Correct: {study_history.is_correct}")
-        
-        # 다음 문제 또는 결과 페이지로
-        next_question = questions.filter(id__gt=current_question.id).first()
-        if next_question:
-            context = {
-                'quiz': quiz,
-                'question': next_question,
-                'question_number': list(questions).index(next_question) + 1,
-                'total_questions': questions.count(),
-                'end_time': request.POST.get('end_time')
-            }
-            return render(request, 'quiz/quiz_submit.html', context)
-        else:
-            # 모든 문제를 다 풀었을 때
-            correct_count = questions.filter(is_correct=True).count()
-            score = (correct_count / questions.count()) * 100
-            
-            # 퀴즈 완료 시 포인트 지급
-            points = calculate_quiz_points(correct_count, quiz.quiz_type, quiz.mode)
-            request.user.profile.add_points(points, f"{quiz.get_quiz_type_display()} 퀴즈 완료")
-            
-            # 퀴즈 시도 기록 저장
-            attempt = QuizAttempt.objects.create(
-                user=request.user,
-                quiz=quiz,
-                score=score,
-                total_questions=questions.count(),
-                correct_answers=correct_count,
-                completed_at=timezone.now()
-            )
-            
-            # 결과 컨텍스트 준비
-            answers = []
-            for q in questions:
-                answers.append({
-                    'question': q.word.english if quiz.quiz_type == 'en_to_ko' else q.word.korean,
-                    'correct_answer': q.word.korean if quiz.quiz_type == 'en_to_ko' else q.word.english,
-                    'user_answer': q.user_answer,
-                    'is_correct': q.is_correct
-                })
-            
-            context = {
-                'quiz': quiz,
-                'score': score,
-                'correct_count': correct_count,
-                'total_questions': questions.count(),
-                'answers': answers,
-                'attempt': attempt
-            }
-            return render(request, 'quiz/test_result.html', context)
+    run = QuizRun.load(request, quiz_id, request.POST.get('run_id'))
+    if run is None:
+        # 마지막 답안을 두 번 보낸 경우 - 첫 제출이 응시 상태를 지웠다
+        attempt = QuizAttempt.objects.filter(quiz_id=quiz_id, user=request.user).first()
+        if attempt is not None:
+            messages.info(request, '이미 제출된 퀴즈입니다.')
+            return redirect('quiz:quiz_history_detail', attempt_id=attempt.id)
+        messages.error(request, '퀴즈 진행 정보가 만료되었습니다. 다시 시작해주세요.')
+        return redirect('quiz:quiz_detail', quiz_id=quiz_id)
     
-    # GET 요청 시 첫 문제로 시작
-    first_question = questions.first()
-    if not first_question:
-        messages.error(request, '이 퀴즈에는 문제가 없습니다.')
+    # 답안 채점 (현재 문제가 아닌 중복 제출은 무시)
+    answer = request.POST.get('answer', '').strip()
+    run.submit(request.POST.get('question_id'), answer)
+    
+    # 다음 문제 또는 결과 페이지로
+    if not run.finished:
+        return _render_quiz_question(request, run)
+    
+    # 모든 문제를 다 풀었을 때 - 퀴즈 완료 포인트와 함께 일괄 저장
+    correct_count = run.correct_count
+    points = calculate_quiz_points(correct_count, run.quiz.quiz_type, quiz_mode(run.quiz.quiz_type))
+    attempt, created = run.finish(request.user, points, f"{run.quiz.quiz_type_display} 퀴즈 완료")
+    if not created:
+        # 마지막 답안을 두 번 보냈거나 다른 탭에서 먼저 마친 경우
+        messages.info(request, '이미 제출된 퀴즈입니다.')
+        if attempt.user_id == request.user.id:
+            return redirect('quiz:quiz_history_detail', attempt_id=attempt.id)
         return redirect('quiz:quiz_detail', quiz_id=quiz_id)
-        
+    
     context = {
-        'quiz': quiz,
-        'question': first_question,
-        'question_number': 1,
-        'total_questions': questions.count(),
-        'end_time': timezone.now() + timezone.timedelta(minutes=30)
+        'quiz': run.quiz,
+        'score': attempt.score,
+        'correct_count': correct_count,
+        'total_questions': run.total,
+        'answers': run.results(),
+        'attempt': attempt
     }
-    return render(request, 'quiz/quiz_submit.html', context)
+    return render(request, 'quiz/test_result.html', context)
+
+PREVIOUS_ATTEMPT_WINDOW = 5  # 복습 화면에서 비교할 이전 응시 수
+
+def _previously_correct_word_ids(previous_attempts, word_ids):
+    """이전 응시들의 퀴즈에서 한 번이라도 맞힌 단어 id 집합 (쿼리 1번)"""
+    quiz_ids = [a.quiz_id for a in previous_attempts if a.quiz_id]
+    if not quiz_ids or not word_ids:
+        return set()
+    return set(QuizQuestion.objects.filter(
+        quiz_id__in=quiz_ids,
+        word_id__in=word_ids,
+        is_correct=True
+    ).values_list('word_id', flat=True).distinct())
 
 @login_required
 def quiz_history_detail(request, attempt_id):
     """퀴즈 응시 기록 상세 뷰"""
     attempt = get_object_or_404(QuizAttempt, id=attempt_id, user=request.user)
-    questions = QuizQuestion.objects.filter(quiz=attempt.quiz).select_related('word')
+    questions = list(QuizQuestion.objects.filter(quiz=attempt.quiz).select_related('word'))
     
-    # 이전 퀴즈 기록 가져오기
-    previous_attempts = QuizAttempt.objects.filter(
-        user=request.user,
-        completed_at__lt=attempt.completed_at
-    ).order_by('-completed_at')[:5]
+    # 이전 퀴즈 기록 가져오기 (한 번만 조회해 목록으로 재사용)
+    previous_attempts = []
+    if attempt.completed_at:
+        previous_attempts = list(QuizAttempt.objects.filter(
+            user=request.user,
+            completed_at__lt=attempt.completed_at
+        ).order_by('-completed_at')[:PREVIOUS_ATTEMPT_WINDOW])
+    
+    # 이전 퀴즈들에서 맞힌 단어 id 를 한 번의 쿼리로 가져온다 (문제마다 조회하지 않음)
+    previous_correct_ids = _previously_correct_word_ids(
+        previous_attempts, {question.word_id for question in questions}
+    )
     
     answer_history = []
     for question in questions:
-        # 이전 퀴즈에서의 정답 여부 확인
-        previous_correct = False
-        if previous_attempts.exists():
-            prev_questions = QuizQuestion.objects.filter(
-                quiz__in=[a.quiz for a in previous_attempts if a.quiz],
-                word=question.word,
-                is_correct=True
-            ).exists()
-            previous_correct = prev_questions
-        
         answer_history.append({
             'question': question,
             'user_answer': question.user_answer,
             'is_correct': question.is_correct,
-            'previous_correct': previous_correct
+            'previous_correct': question.word_id in previous_correct_ids
         })
     
     context = {
@@ -571,7 +545,7 @@ def quiz_timer(request):
         messages.warning(request, '타이머 퀴즈를 위해서는 최소 20개의 단어를 학습해야 합니다.')
         return redirect('study:daily_words')
     
-    test_words = list(studied_words.order_by('?')[:20])
+    test_words = studied_words.sample(20)
     questions = []
     
     for word in test_words:
@@ -586,6 +560,7 @@ def quiz_timer(request):
         'time_limit': 300,  # 5분(300초) 제한시간
     }
     
+    QUIZ_GENERATED.inc(quiz_type='timer')
     return render(request, 'quiz/timer_quiz.html', context)
 
 @login_required
@@ -608,41 +583,12 @@ def en_to_ko_multiple(request):
             return redirect('quiz:quiz_home')
             
         user_answers = [request.POST.get(f'answer_{i+1}') for i in range(len(questions))]
-        correct_count = 0
+        graded = []
         results = []
         
-        # 퀴즈 생성
-        quiz = Quiz.objects.create(
-            title="영어 → 한국어 객관식",
-            quiz_type='en_to_ko',
-            difficulty='medium',
-            created_by=request.user,
-            is_public=False
-        )
-        
         for i, q in enumerate(questions):
             correct = user_answers[i] == q['answer']
-            correct_count += int(correct)
-            
-            # 단어 찾기
-            word = Word.objects.get(id=q['word_id'])
-            
-            # 퀴즈 문제 생성
-            question = QuizQuestion.objects.create(
-                quiz=quiz,
-                word=word,
-                order=i+1,
-                user_answer=user_answers[i],
-                is_correct=correct
-            )
-            
-            # 학습 기록 저장
-            WordStudyHistory.objects.create(
-                user=request.user,
-                word=word,
-                is_correct=correct,
-            )
-            
+            graded.append(GradedAnswer(q['word_id'], user_answers[i], correct))
             results.append({
                 'question': q['question'],
                 'answer': q['answer'],
@@ -650,25 +596,22 @@ def en_to_ko_multiple(request):
                 'user_answer': user_answers[i],
                 'is_correct': correct
             })
-            
+        
+        correct_count = sum(1 for answer in graded if answer.is_correct)
         score = int(correct_count / len(questions) * 100)
         
-        # 퀴즈 시도 기록 저장
-        attempt = QuizAttempt.objects.create(
-            user=request.user,
-            quiz=quiz,
+        # 퀴즈/문제/학습 기록/응시 기록 일괄 저장 및 포인트 지급
+        attempt, _ = save_quiz_submission(
+            request.user, graded,
+            title="영어 → 한국어 객관식",
             quiz_type='en_to_ko',
+            attempt_type='en_to_ko',
             mode='multiple',
             score=score,
-            total_questions=len(questions),
-            correct_answers=correct_count,
-            completed_at=timezone.now()
+            points=calculate_quiz_points(correct_count, 'en_to_ko', 'multiple'),
+            points_reason="영→한 객관식 퀴즈 완료"
         )
         
-        # 포인트 지급
-        points = calculate_quiz_points(correct_count, 'en_to_ko', 'multiple')
-        request.user.profile.add_points(points, "영→한 객관식 퀴즈 완료")
-        
         # 세션 데이터 삭제
         if 'en_to_ko_multiple_questions' in request.session:
             del request.session['en_to_ko_multiple_questions']
@@ -686,11 +629,10 @@ def en_to_ko_multiple(request):
             del request.session['en_to_ko_multiple_questions']
             
         import random
-        words = list(studied_words.order_by('?')[:15])
+        words = studied_words.sample(15)
         questions = []
         for word in words:
-            wrongs = list(Word.objects.exclude(id=word.id).order_by('?')[:3])
-            options = [word.korean] + [w.korean for w in wrongs]
+            options = [word.korean] + distractor_pool.sample(word, 3, 'korean')
             random.shuffle(options)
             questions.append({
                 'word_id': word.id,
@@ -699,6 +641,7 @@ def en_to_ko_multiple(request):
                 'options': options
             })
         request.session['en_to_ko_multiple_questions'] = questions
+        QUIZ_GENERATED.inc(quiz_type='en_to_ko_multiple')
         return render(request, 'quiz/en_to_ko_multiple.html', {
             'questions': questions
         })
@@ -723,66 +666,34 @@ def en_to_ko_typing(request):
             return redirect('quiz:quiz_home')
             
         user_answers = [request.POST.get(f'answer_{i+1}', '').strip() for i in range(len(questions))]
-        correct_count = 0
+        graded = []
         results = []
         
-        # 퀴즈 생성
-        quiz = Quiz.objects.create(
-            title="영어 → 한국어 주관식",
-            quiz_type='en_to_ko',
-            difficulty='medium',
-            created_by=request.user,
-            is_public=False
-        )
-        
         for i, q in enumerate(questions):
             correct = user_answers[i] == q['answer']
-            correct_count += int(correct)
-            
-            # 단어 찾기
-            word = Word.objects.get(id=q['word_id'])
-            
-            # 퀴즈 문제 생성
-            question = QuizQuestion.objects.create(
-                quiz=quiz,
-                word=word,
-                order=i+1,
-                user_answer=user_answers[i],
-                is_correct=correct
-            )
-            
-            # 학습 기록 저장
-            WordStudyHistory.objects.create(
-                user=request.user,
-                word=word,
-                is_correct=correct,
-            )
-            
+            graded.append(GradedAnswer(q['word_id'], user_answers[i], correct))
             results.append({
                 'question': q['question'],
                 'answer': q['answer'],
                 'user_answer': user_answers[i],
                 'is_correct': correct
             })
-            
+        
+        correct_count = sum(1 for answer in graded if answer.is_correct)
         score = int(correct_count / len(questions) * 100)
         
-        # 퀴즈 시도 기록 저장
-        attempt = QuizAttempt.objects.create(
-            user=request.user,
-            quiz=quiz,
+        # 퀴즈/문제/학습 기록/응시 기록 일괄 저장 및 포인트 지급
+        attempt, _ = save_quiz_submission(
+            request.user, graded,
+            title="영어 → 한국어 주관식",
             quiz_type='en_to_ko',
+            attempt_type='en_to_ko',
             mode='typing',
             score=score,
-            total_questions=len(questions),
-            correct_answers=correct_count,
-            completed_at=timezone.now()
+            points=calculate_quiz_points(correct_count, 'en_to_ko', 'typing'),
+            points_reason="영→한 주관식 퀴즈 완료"
         )
         
-        # 포인트 지급
-        points = calculate_quiz_points(correct_count, 'en_to_ko', 'typing')
-        request.user.profile.add_points(points, "영→한 주관식 퀴즈 완료")
-        
         return render(request, 'quiz/en_to_ko_typing_result.html', {
             'results': results,
             'score': score,
@@ -796,7 +707,7 @@ def en_to_ko_typing(request):
             del request.session['en_to_ko_typing_questions']
             
         import random
-        words = list(studied_words.order_by('?')[:15])
+        words = studied_words.sample(15)
         questions = []
         for word in words:
             questions.append({
@@ -805,6 +716,7 @@ def en_to_ko_typing(request):
                 'answer': word.korean
             })
         request.session['en_to_ko_typing_questions'] = questions
+        QUIZ_GENERATED.inc(quiz_type='en_to_ko_typing')
         return render(request, 'quiz/en_to_ko_typing.html', {
             'questions': questions
         })
@@ -829,41 +741,12 @@ def ko_to_en_multiple(request):
             return redirect('quiz:quiz_home')
             
         user_answers = [request.POST.get(f'answer_{i+1}', '') for i in range(len(questions))]
-        correct_count = 0
+        graded = []
         results = []
         
-        # 퀴즈 생성
-        quiz = Quiz.objects.create(
-            title="한국어 → 영어 객관식",
-            quiz_type='ko_to_en',
-            difficulty='medium',
-            created_by=request.user,
-            is_public=False
-        )
-        
         for i, q in enumerate(questions):
             correct = user_answers[i] == q['answer']
-            correct_count += int(correct)
-            
-            # 단어 찾기
-            word = Word.objects.get(id=q['word_id'])
-            
-            # 퀴즈 문제 생성
-            question = QuizQuestion.objects.create(
-                quiz=quiz,
-                word=word,
-                order=i+1,
-                user_answer=user_answers[i],
-                is_correct=correct
-            )
-            
-            # 학습 기록 저장
-            WordStudyHistory.objects.create(
-                user=request.user,
-                word=word,
-                is_correct=correct,
-            )
-            
+            graded.append(GradedAnswer(q['word_id'], user_answers[i], correct))
             results.append({
                 'question': q['question'],
                 'answer': q['answer'],
@@ -871,25 +754,22 @@ def ko_to_en_multiple(request):
                 'user_answer': user_answers[i],
                 'is_correct': correct
             })
-            
+        
+        correct_count = sum(1 for answer in graded if answer.is_correct)
         score = int(correct_count / len(questions) * 100)
         
-        # 퀴즈 시도 기록 저장
-        attempt = QuizAttempt.objects.create(
-            user=request.user,
-            quiz=quiz,
+        # 퀴즈/문제/학습 기록/응시 기록 일괄 저장 및 포인트 지급
+        attempt, _ = save_quiz_submission(
+            request.user, graded,
+            title="한국어 → 영어 객관식",
             quiz_type='ko_to_en',
+            attempt_type='ko_to_en',
             mode='multiple',
             score=score,
-            total_questions=len(questions),
-            correct_answers=correct_count,
-            completed_at=timezone.now()
+            points=calculate_quiz_points(correct_count, 'ko_to_en', 'multiple'),
+            points_reason="한→영 객관식 퀴즈 완료"
         )
         
-        # 포인트 지급
-        points = calculate_quiz_points(correct_count, 'ko_to_en', 'multiple')
-        request.user.profile.add_points(points, "한→영 객관식 퀴즈 완료")
-        
         # 세션 데이터 삭제
         if 'ko_to_en_multiple_questions' in request.session:
             del request.session['ko_to_en_multiple_questions']
@@ -907,19 +787,19 @@ def ko_to_en_multiple(request):
             del request.session['ko_to_en_multiple_questions']
             
         import random
-        words = list(studied_words.order_by('?')[:15])
+        words = studied_words.sample(15)
         questions = []
         for word in words:
-            options = list(studied_words.exclude(id=word.id).order_by('?')[:3])
-            options.append(word)
+            options = [word.english] + distractor_pool.sample(word, 3, 'english')
             random.shuffle(options)
             questions.append({
                 'word_id': word.id,
                 'question': word.korean,
                 'answer': word.english,
-                'options': [w.english for w in options]
+                'options': options
             })
         request.session['ko_to_en_multiple_questions'] = questions
+        QUIZ_GENERATED.inc(quiz_type='ko_to_en_multiple')
         return render(request, 'quiz/ko_to_en_multiple.html', {
             'questions': questions
         })
@@ -944,66 +824,34 @@ def ko_to_en_typing(request):
             return redirect('quiz:quiz_home')
             
         user_answers = [request.POST.get(f'answer_{i+1}', '').strip() for i in range(len(questions))]
-        correct_count = 0
+        graded = []
         results = []
         
-        # 퀴즈 생성
-        quiz = Quiz.objects.create(
-            title="한국어 → 영어 주관식",
-            quiz_type='ko_to_en',
-            difficulty='medium',
-            created_by=request.user,
-            is_public=False
-        )
-        
         for i, q in enumerate(questions):
             correct = user_answers[i] == q['answer']
-            correct_count += int(correct)
-            
-            # 단어 찾기
-            word = Word.objects.get(id=q['word_id'])
-            
-            # 퀴즈 문제 생성
-            question = QuizQuestion.objects.create(
-                quiz=quiz,
-                word=word,
-                order=i+1,
-                user_answer=user_answers[i],
-                is_correct=correct
-            )
-            
-            # 학습 기록 저장
-            WordStudyHistory.objects.create(
-                user=request.user,
-                word=word,
-                is_correct=correct,
-            )
-            
+            graded.append(GradedAnswer(q['word_id'], user_answers[i], correct))
             results.append({
                 'question': q['question'],
                 'answer': q['answer'],
                 'user_answer': user_answers[i],
                 'is_correct': correct
             })
-            
+        
+        correct_count = sum(1 for answer in graded if answer.is_correct)
         score = int(correct_count / len(questions) * 100)
         
-        # 퀴즈 시도 기록 저장
-        attempt = QuizAttempt.objects.create(
-            user=request.user,
-            quiz=quiz,
+        # 퀴즈/문제/학습 기록/응시 기록 일괄 저장 및 포인트 지급
+        attempt, _ = save_quiz_submission(
+            request.user, graded,
+            title="한국어 → 영어 주관식",
             quiz_type='ko_to_en',
+            attempt_type='ko_to_en',
             mode='typing',
             score=score,
-            total_questions=len(questions),
-            correct_answers=correct_count,
-            completed_at=timezone.now()
+            points=calculate_quiz_points(correct_count, 'ko_to_en', 'typing'),
+            points_reason="한→영 주관식 퀴즈 완료"
         )
         
-        # 포인트 지급
-        points = calculate_quiz_points(correct_count, 'ko_to_en', 'typing')
-        request.user.profile.add_points(points, "한→영 주관식 퀴즈 완료")
-        
         return render(request, 'quiz/ko_to_en_typing_result.html', {
             'results': results,
             'score': score,
@@ -1017,7 +865,7 @@ def ko_to_en_typing(request):
             del request.session['ko_to_en_typing_questions']
             
         import random
-        words = list(studied_words.order_by('?')[:15])
+        words = studied_words.sample(15)
         questions = []
         for word in words:
             questions.append({
@@ -1026,6 +874,7 @@ def ko_to_en_typing(request):
                 'answer': word.english
             })
         request.session['ko_to_en_typing_questions'] = questions
+        QUIZ_GENERATED.inc(quiz_type='ko_to_en_typing')
         return render(request, 'quiz/ko_to_en_typing.html', {
             'questions': questions
         })
@@ -1036,63 +885,26 @@ def bookmark_multiple(request):
     """즐겨찾기 단어 객관식 퀴즈"""
     if request.method == 'POST':
         data = json.loads(request.body)
-        score = 0
-        results = []
+        graded = [
+            GradedAnswer(
+                answer['word_id'],
+                answer['selected_answer'],
+                answer['selected_answer'] == answer['correct_answer']
+            )
+            for answer in data['answers']
+        ]
+        score = sum(1 for answer in graded if answer.is_correct)
         
-        # 퀴즈 생성
-        quiz = Quiz.objects.create(
+        # 퀴즈/문제/학습 기록/응시 기록 일괄 저장 및 포인트 지급
+        attempt, _ = save_quiz_submission(
+            request.user, graded,
             title="즐겨찾기 객관식",
             quiz_type='bookmark',
-            difficulty='medium',
-            created_by=request.user,
-            is_public=False
-        )
-        
-        for i, answer in enumerate(data['answers']):
-            word = get_object_or_404(Word, id=answer['word_id'])
-            is_correct = answer['selected_answer'] == answer['correct_answer']
-            
-            if is_correct:
-                score += 1
-            
-            # 퀴즈 문제 생성
-            question = QuizQuestion.objects.create(
-                quiz=quiz,
-                word=word,
-                order=i+1,
-                user_answer=answer['selected_answer'],
-                is_correct=is_correct
-            )
-            
-            # 학습 기록 저장
-            WordStudyHistory.objects.create(
-                user=request.user,
-                word=word,
-                is_correct=is_correct,
-            )
-            
-            results.append({
-                'word': word.english,
-                'meaning': word.korean,
-                'user_answer': answer['selected_answer'],
-                'correct_answer': answer['correct_answer'],
-                'is_correct': is_correct
-            })
-        
-        # 퀴즈 시도 기록 저장
-        attempt = QuizAttempt.objects.create(
-            user=request.user,
-            quiz=quiz,
             score=score * 10,  # 100점 만점
-            total_questions=len(data['answers']),
-            correct_answers=score,
-            completed_at=timezone.now()
+            points=calculate_quiz_points(score, 'bookmark', 'multiple'),
+            points_reason="즐겨찾기 객관식 퀴즈 완료"
         )
         
-        # 포인트 지급
-        points = calculate_quiz_points(score, 'bookmark', 'multiple')
-        request.user.profile.add_points(points, "즐겨찾기 객관식 퀴즈 완료")
-        
         return JsonResponse({
             'success': True,
             'attempt_id': attempt.id
@@ -1109,7 +921,7 @@ def bookmark_multiple(request):
         return redirect('quiz:quiz_home')
     
     # 랜덤하게 10개의 단어 선택
-    test_words = list(bookmarked_words.order_by('?')[:10])
+    test_words = bookmarked_words.sample(10)
     questions = []
     
     for word in test_words:
@@ -1126,8 +938,7 @@ def bookmark_multiple(request):
             question_type = 'ko_to_en'
         
         # 오답 선택지 생성
-        wrong_answers = Word.objects.exclude(id=word.id).order_by('?')[:3]
-        options = [answer] + [w.korean if is_en_to_ko else w.english for w in wrong_answers]
+        options = [answer] + distractor_pool.sample(word, 3, 'korean' if is_en_to_ko else 'english')
         random.shuffle(options)
         
         questions.append({
@@ -1138,6 +949,7 @@ def bookmark_multiple(request):
             'type': question_type
         })
     
+    QUIZ_GENERATED.inc(quiz_type='bookmark_multiple')
     return render(request, 'quiz/bookmark_multiple.html', {
         'questions': questions
     })
@@ -1148,63 +960,26 @@ def bookmark_typing(request):
     """즐겨찾기 단어 주관식 퀴즈"""
     if request.method == 'POST':
         data = json.loads(request.body)
-        score = 0
-        results = []
+        graded = [
+            GradedAnswer(
+                answer['word_id'],
+                answer['user_answer'],
+                answer['user_answer'].strip().lower() == answer['correct_answer'].lower()
+            )
+            for answer in data['answers']
+        ]
+        score = sum(1 for answer in graded if answer.is_correct)
         
-        # 퀴즈 생성
-        quiz = Quiz.objects.create(
+        # 퀴즈/문제/학습 기록/응시 기록 일괄 저장 및 포인트 지급
+        attempt, _ = save_quiz_submission(
+            request.user, graded,
             title="즐겨찾기 주관식",
             quiz_type='bookmark',
-            difficulty='medium',
-            created_by=request.user,
-            is_public=False
-        )
-        
-        for i, answer in enumerate(data['answers']):
-            word = get_object_or_404(Word, id=answer['word_id'])
-            is_correct = answer['user_answer'].strip().lower() == answer['correct_answer'].lower()
-            
-            if is_correct:
-                score += 1
-            
-            # 퀴즈 문제 생성
-            question = QuizQuestion.objects.create(
-                quiz=quiz,
-                word=word,
-                order=i+1,
-                user_answer=answer['user_answer'],
-                is_correct=is_correct
-            )
-            
-            # 학습 기록 저장
-            WordStudyHistory.objects.create(
-                user=request.user,
-                word=word,
-                is_correct=is_correct,
-            )
-            
-            results.append({
-                'word': word.english,
-                'meaning': word.korean,
-                'user_answer': answer['user_answer'],
-                'correct_answer': answer['correct_answer'],
-                'is_correct': is_correct
-            })
-        
-        # 퀴즈 시도 기록 저장
-        attempt = QuizAttempt.objects.create(
-            user=request.user,
-            quiz=quiz,
             score=score * 10,  # 100점 만점
-            total_questions=len(data['answers']),
-            correct_answers=score,
-            completed_at=timezone.now()
+            points=calculate_quiz_points(score, 'bookmark', 'typing'),
+            points_reason="즐겨찾기 주관식 퀴즈 완료"
         )
         
-        # 포인트 지급
-        points = calculate_quiz_points(score, 'bookmark', 'typing')
-        request.user.profile.add_points(points, "즐겨찾기 주관식 퀴즈 완료")
-        
         return JsonResponse({
             'success': True,
             'attempt_id': attempt.id
@@ -1221,7 +996,7 @@ def bookmark_typing(request):
         return redirect('quiz:quiz_home')
     
     # 랜덤하게 10개의 단어 선택
-    test_words = list(bookmarked_words.order_by('?')[:10])
+    test_words = bookmarked_words.sample(10)
     questions = []
     
     for word in test_words:
@@ -1244,6 +1019,7 @@ def bookmark_typing(request):
             'type': question_type
         })
     
+    QUIZ_GENERATED.inc(quiz_type='bookmark_typing')
     return render(request, 'quiz/bookmark_typing.html', {
         'questions': questions
     })
@@ -1302,23 +1078,27 @@ def add_wrong_answer(request):
         answer = data.get('answer')
         user_answer = data.get('user_answer')
 
-        # 단어 찾기 (정확한 매칭)
-        word = None
-        if question in [w.english for w in Word.objects.all()]:
-            word = Word.objects.get(english=question)
-        elif question in [w.korean for w in Word.objects.all()]:
-            word = Word.objects.get(korean=question)
-        
-        if not word:
+        # 단어 찾기 (정확한 매칭, 인메모리 사전 조회 - 단어 테이블을 읽지 않음)
+        word_id = word_lookup.find(question or '')
+        if word_id is None:
+            # 다른 워커에서 방금 추가된 단어일 수 있으므로 DB 에서 확인
+            # (english_key 유일 인덱스, 없으면 한글 뜻 인덱스 - 각각 정확히 일치)
+            word_id = Word.objects.filter(
+                english_key=normalize_english(question or '')
+            ).values_list('id', flat=True).first()
+            if word_id is None and question:
+                word_id = Word.objects.filter(korean=question).order_by('id').values_list('id', flat=True).first()
+        
+        if word_id is None:
             return JsonResponse({'success': False, 'error': '단어를 찾을 수 없습니다.'})
 
         # 이미 오답 노트에 있는지 확인
         existing_note = WrongAnswerNote.objects.filter(
             user=request.user,
-            word=word,
+            word_id=word_id,
             question=question,
             correct_answer=answer
-        ).first()
+        ).exists()
 
         if existing_note:
             return JsonResponse({'success': True, 'message': '이미 오답노트에 있는 단어입니다.'})
@@ -1326,7 +1106,7 @@ def add_wrong_answer(request):
         # 새로운 오답노트 생성
         WrongAnswerNote.objects.create(
             user=request.user,
-            word=word,
+            word_id=word_id,
             question=question,
             correct_answer=answer,
             user_answer=user_answer
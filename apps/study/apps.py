@@ -5,3 +5,6 @@ class StudyConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.study'
     verbose_name = '학습 관리'
+
+    def ready(self):
+        import apps.study.signals
@@ -0,0 +1,223 @@
+"""TTS 음성 파일 저장소
+
+텍스트+언어의 해시로 파일 이름을 정하고(``audio/tts/ab/cd/<hash>.mp3``),
+이미 만들어진 파일은 잠금 없이 바로 돌려준다. 없는 파일은 백그라운드
+스레드에서 한 번만 합성하며, 같은 텍스트를 동시에 요청한 쪽은 같은 작업을
+기다린다. 다른 프로세스와는 잠금 파일로 중복 합성을 막는다.
+
+합성기는 ``settings.TTS_SYNTHESIZER`` 경로로 바꿀 수 있다 (테스트용 FakeSynthesizer).
+"""
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.module_loading import import_string
+
+AUDIO_CONTENT_TYPE = 'audio/mpeg'
+MAX_TEXT_LENGTH = 500
+LOCK_STALE_SECONDS = 60
+GENERATION_TIMEOUT = 30
+CHUNK_SIZE = 8192
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class GTTSSynthesizer:
+    """Google TTS(gTTS)로 mp3 를 만든다 (네트워크 필요)"""
+
+    def synthesize(self, text, lang, path):
+        from gtts import gTTS
+
+        gTTS(text=text, lang=lang).save(path)
+
+
+class FakeSynthesizer:
+    """네트워크 없이 텍스트로부터 결정적인 바이트를 쓰는 테스트용 합성기"""
+
+    def synthesize(self, text, lang, path):
+        with open(path, 'wb') as f:
+            f.write(b'ID3FAKE\n' + f'{lang}:{text}'.encode('utf-8'))
+
+
+def get_synthesizer(path=None):
+    path = path or getattr(settings, 'TTS_SYNTHESIZER', 'apps.study.audio.GTTSSynthesizer')
+    return import_string(path)()
+
+
+def normalize_text(text):
+    return ' '.join((text or '').split())
+
+
+def audio_key(text, lang='en'):
+    """텍스트+언어의 sha256 (파일 이름이자 ETag)"""
+    return hashlib.sha256(f'{lang}\0{normalize_text(text)}'.encode('utf-8')).hexdigest()
+
+
+class AudioStore:
+    """해시 기반 디렉터리에 음성 파일을 저장/조회"""
+
+    def __init__(self, root=None, synthesizer=None, max_workers=2):
+        self.root = root or os.path.join(settings.MEDIA_ROOT, 'audio', 'tts')
+        self._synthesizer = synthesizer
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tts')
+        self._lock = threading.Lock()
+        self._pending = {}  # key -> Future (같은 텍스트 동시 합성 방지)
+
+    @property
+    def synthesizer(self):
+        if self._synthesizer is None:
+            self._synthesizer = get_synthesizer()
+        return self._synthesizer
+
+    def path_for_key(self, key):
+        return os.path.join(self.root, key[:2], key[2:4], f'{key}.mp3')
+
+    def path_for(self, text, lang='en'):
+        return self.path_for_key(audio_key(text, lang))
+
+    def lookup(self, text, lang='en'):
+        """이미 만들어진 파일 경로 (없으면 None) - 잠금/합성 없음"""
+        path = self.path_for(text, lang)
+        return path if os.path.exists(path) else None
+
+    def submit(self, text, lang='en'):
+        """합성 작업을 예약하고 Future 를 반환 (이미 진행 중이면 같은 Future)"""
+        key = audio_key(text, lang)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._executor.submit(self._generate, key, normalize_text(text), lang)
+                self._pending[key] = future
+                future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def _forget(self, key):
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def get_or_create(self, text, lang='en', timeout=GENERATION_TIMEOUT):
+        """파일 경로를 반환 - 캐시에 있으면 즉시, 없으면 합성이 끝날 때까지 기다림"""
+        path = self.lookup(text, lang)
+        if path:
+            return path
+        return self.submit(text, lang).result(timeout=timeout)
+
+    def generate(self, text, lang='en', synthesizer=None):
+        """현재 스레드에서 바로 합성 (관리 명령용). 반환값: (경로, 새로 만들었는지)"""
+        key = audio_key(text, lang)
+        path = self.path_for_key(key)
+        if os.path.exists(path):
+            return path, False
+        self._generate(key, normalize_text(text), lang, synthesizer)
+        return path, True
+
+    def _generate(self, key, text, lang, synthesizer=None):
+        path = self.path_for_key(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        lock_path = f'{path}.lock'
+
+        deadline = time.monotonic() + GENERATION_TIMEOUT
+        while not self._acquire_file_lock(lock_path):
+            # 다른 프로세스가 만드는 중 - 파일이 생기면 그대로 사용
+            if os.path.exists(path):
+                return path
+            if time.monotonic() > deadline:
+                raise TimeoutError(f'음성 파일 생성 대기 시간 초과: {key}')
+            time.sleep(0.1)
+
+        try:
+            if os.path.exists(path):
+                return path
+            # 임시 파일에 쓴 뒤 rename 해서 읽는 쪽이 반쯤 쓰인 파일을 보지 않게 한다
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            os.close(fd)
+            try:
+                (synthesizer or self.synthesizer).synthesize(text, lang, tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            return path
+        finally:
+            os.remove(lock_path)
+
+    @staticmethod
+    def _acquire_file_lock(lock_path):
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                # 비정상 종료로 남은 잠금 파일은 정리
+                if time.time() - os.path.getmtime(lock_path) > LOCK_STALE_SECONDS:
+                    os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+            return False
+        os.close(fd)
+        return True
+
+
+def _iter_file_range(f, length):
+    try:
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        f.close()
+
+
+def audio_response(request, path, key):
+    """ETag/Range 를 지원하는 음성 파일 응답"""
+    etag = f'"{key}"'
+    if etag in request.headers.get('If-None-Match', ''):
+        response = HttpResponseNotModified()
+        response['ETag'] = etag
+        return response
+
+    size = os.path.getsize(path)
+    range_header = request.headers.get('Range', '').strip()
+    if_range = request.headers.get('If-Range')
+    match = RANGE_RE.match(range_header) if range_header else None
+
+    if match and any(match.groups()) and (not if_range or if_range == etag):
+        start_text, end_text = match.groups()
+        if start_text:
+            start = int(start_text)
+            end = min(int(end_text), size - 1) if end_text else size - 1
+        else:
+            # bytes=-N : 마지막 N 바이트
+            start = max(size - int(end_text), 0)
+            end = size - 1
+        if start > end or start >= size:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+        f = open(path, 'rb')
+        f.seek(start)
+        length = end - start + 1
+        response = StreamingHttpResponse(
+            _iter_file_range(f, length), status=206, content_type=AUDIO_CONTENT_TYPE
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(length)
+    else:
+        response = FileResponse(open(path, 'rb'), content_type=AUDIO_CONTENT_TYPE)
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Cache-Control'] = 'public, max-age=86400'
+    return response
+
+
+audio_store = AudioStore()
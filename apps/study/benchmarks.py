@@ -0,0 +1,345 @@
+"""뷰 쿼리 수/응답 시간 벤치마크
+
+테스트 클라이언트로 각 앱 urls.py 의 URL 을 로그인한 사용자로 호출해 쿼리 수,
+SQL 시간, 전체 응답 시간을 재고 저장된 기준값과 비교한다. 같은 뷰를 데이터를
+늘린 뒤 다시 호출해 쿼리 수가 늘어나면 N+1 로 표시한다.
+
+사용자별 캐시(apps/study/cache.py)가 결과를 가리지 않도록 요청마다 캐시를 비운다.
+운영 중인 공유 캐시(파일/redis)의 다른 데이터(학습 시간 버퍼, 퀴즈/레벨 테스트 문제 등)를
+지우지 않도록 측정하는 동안은 이 프로세스 전용 로컬 메모리 캐시(BENCHMARK_CACHES)를 쓴다.
+오류 응답(4xx/5xx)은 기준값이 될 수 없으므로 측정 결과에 있으면 실패로 본다.
+데이터를 만들고 URL 을 호출하므로 트랜잭션 안에서 실행하고 롤백해야 한다
+(``benchmark_views`` 명령, 테스트의 TestCase).
+"""
+import json
+import os
+import random
+import statistics
+import time
+from collections import namedtuple
+from datetime import timedelta
+from importlib import import_module
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import NoReverseMatch, reverse
+from django.utils import timezone
+
+from apps.accounts.models import Attendance
+from apps.quiz.models import Quiz, QuizAttempt, QuizQuestion, WrongAnswerNote
+from apps.vocabulary.models import PersonalWordList, Word, WordBookmark
+from .models import (
+    Friendship, StudyNotification, StudyPlan, StudyProgress, StudySession, WordStudyHistory
+)
+from .daily_sets import DailySetBuilder
+from .missions import build_daily_missions
+from .stats import rebuild_daily_stats
+from .streaks import rebuild_streaks
+
+APP_URLCONFS = ['apps.accounts.urls', 'apps.vocabulary.urls', 'apps.quiz.urls', 'apps.study.urls']
+
+# GET 으로도 데이터를 바꾸거나 외부 서비스를 호출하는 URL (벤치마크에서 제외)
+SKIP_URLS = {
+    'accounts:logout', 'accounts:delete_account', 'accounts:sync_nicknames',
+    'accounts:password_reset_confirm',
+    'vocabulary:word_delete', 'vocabulary:toggle_bookmark', 'vocabulary:toggle_personal_word',
+    'quiz:quiz_delete', 'quiz:quiz_submit', 'quiz:add_wrong_answer', 'quiz:toggle_mastered',
+    'study:submit_daily_mission', 'study:daily_mission_modal_shown',
+    'study:plan_delete', 'study:session_start', 'study:session_end', 'study:session_save_time',
+    'study:word_progress_update', 'study:save_study_time', 'study:bookmark_toggle',
+    'study:schedule_update', 'study:mark_notification_read', 'study:mark_all_notifications_read',
+    'study:delete_notification', 'study:delete_all_notifications', 'study:review_start',
+    'study:text_to_speech', 'study:level_test_start', 'study:level_test_question',
+    'study:level_test_complete', 'study:send_friend_request', 'study:accept_friend_request',
+    'study:reject_friend_request', 'study:delete_friendship', 'study:reset_today_sessions',
+}
+
+# POST 로만 호출하는 URL (GET 은 405)
+POST_ONLY_URLS = {'study:friend_search'}
+
+# 기존 결함으로 GET 이 항상 실패하는 URL - 고칠 때까지 측정하지 않는다
+BROKEN_URLS = {
+    'study:flashcard': 'plan_id 없이 flashcard_study 호출 (TypeError)',
+    'study:notification_settings': "템플릿의 'notifications' URL 이름이 없음 (NoReverseMatch)",
+    'study:review': 'study/review_list.html 템플릿 없음',
+    'study:schedule_list': 'study/schedule_list.html 템플릿 없음',
+}
+
+# 측정 중에만 쓰는 전용 캐시 (요청마다 비워도 운영 캐시에 영향 없음)
+BENCHMARK_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'view-benchmark',
+    }
+}
+
+# N+1 회귀를 반드시 잡아야 하는 주요 화면
+KEY_VIEWS = [
+    'vocabulary:word_list', 'study:study_home', 'study:statistics', 'quiz:quiz_home', 'study:friend_list',
+]
+
+BENCH_USERNAME = 'bench-user'
+
+ViewResult = namedtuple('ViewResult', ['name', 'url', 'status', 'queries', 'sql_ms', 'wall_ms'])
+
+
+def _top_up(model, existing, target, build):
+    """model 행이 target 개가 되도록 build(i) 로 부족한 만큼 만든다"""
+    if existing < target:
+        model.objects.bulk_create([build(i) for i in range(existing, target)])
+
+
+def seed_dataset(scale=1, seed=0):
+    """벤치마크 사용자와 scale 에 비례하는 학습 데이터를 만든다 (여러 번 호출하면 부족한 만큼만 추가)
+
+    반환값: URL 인자를 채울 때 쓰는 {인자 이름: 값}
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    User = get_user_model()
+
+    user = User.objects.filter(username=BENCH_USERNAME).first()
+    if user is None:
+        user = User.objects.create_user(
+            BENCH_USERNAME, 'bench@example.com', 'bench-password', level_test_completed=True
+        )
+
+    word_target = 200 * scale
+    word_count = Word.objects.count()
+    if word_count < word_target:
+        difficulties = [choice for choice, _ in Word.DIFFICULTY_CHOICES]
+        Word.objects.bulk_create([
+            Word(english=f'benchview{i}', english_key=f'benchview{i}', korean=f'벤치 단어 {i}',
+                 difficulty=rng.choice(difficulties), part_of_speech='noun',
+                 example_sentence=f'This is bench word {i}.')
+            for i in range(word_count, word_target)
+        ])
+    words = list(Word.objects.order_by('id')[:word_target])
+
+    studied = StudyProgress.objects.filter(user=user).count()
+    _top_up(StudyProgress, studied, 50 * scale, lambda i: StudyProgress(
+        user=user, word=words[i], proficiency=1 + i % 5, review_count=1 + i % 3,
+        last_reviewed=now - timedelta(days=i % 30, hours=i % 7),
+        due_at=now + timedelta(days=i % 10 - 5), interval_days=1 + i % 10,
+    ))
+    _top_up(WordBookmark, WordBookmark.objects.filter(user=user).count(), 20 * scale,
+            lambda i: WordBookmark(user=user, word=words[i]))
+    _top_up(PersonalWordList, PersonalWordList.objects.filter(user=user).count(), 20 * scale,
+            lambda i: PersonalWordList(user=user, word=words[i]))
+    _top_up(WordStudyHistory, WordStudyHistory.objects.filter(user=user).count(), 30 * scale,
+            lambda i: WordStudyHistory(user=user, word=words[i % len(words)], is_correct=i % 3 != 0))
+    _top_up(WrongAnswerNote, WrongAnswerNote.objects.filter(user=user).count(), 10 * scale,
+            lambda i: WrongAnswerNote(user=user, word=words[i], question=words[i].korean,
+                                      correct_answer=words[i].english, user_answer='wrong'))
+    _top_up(StudyNotification, StudyNotification.objects.filter(user=user).count(), 10 * scale,
+            lambda i: StudyNotification(user=user, notification_type='goal', message=f'알림 {i}',
+                                        is_read=i % 2 == 0))
+
+    plan = StudyPlan.objects.filter(user=user).first() or StudyPlan.objects.create(user=user, title='벤치마크 계획')
+
+    # start_time 이 auto_now_add 라 하나씩 만든 뒤 날짜를 옮긴다
+    sessions = StudySession.objects.filter(user=user).count()
+    for i in range(sessions, 10 * scale):
+        session = StudySession.objects.create(user=user, study_plan=plan, study_minutes=5 + i % 20)
+        StudySession.objects.filter(pk=session.pk).update(
+            start_time=now - timedelta(days=i, minutes=i), end_time=now - timedelta(days=i)
+        )
+
+    attempts = QuizAttempt.objects.filter(user=user).count()
+    for i in range(attempts, 3 * scale):
+        quiz = Quiz.objects.create(title=f'벤치 퀴즈 {i}', quiz_type='en_to_ko', difficulty='easy', created_by=user)
+        QuizQuestion.objects.bulk_create([
+            QuizQuestion(quiz=quiz, word=words[(i * 10 + j) % len(words)], order=j + 1,
+                         user_answer='x', is_correct=j % 2 == 0)
+            for j in range(10)
+        ])
+        QuizAttempt.objects.create(
+            user=user, quiz=quiz, quiz_type='en_to_ko', mode='typing', score=50,
+            total_questions=10, correct_answers=5, completed_at=now - timedelta(days=i, minutes=i)
+        )
+    # 응시 기록이 없는 퀴즈 (quiz_start/quiz_detail 용)
+    open_quiz = Quiz.objects.filter(created_by=user, attempt__isnull=True).first()
+    if open_quiz is None:
+        open_quiz = Quiz.objects.create(title='벤치 퀴즈', quiz_type='en_to_ko', difficulty='easy', created_by=user)
+        QuizQuestion.objects.bulk_create([
+            QuizQuestion(quiz=open_quiz, word=words[j], order=j + 1) for j in range(10)
+        ])
+
+    friends = Friendship.objects.filter(user1=user).count()
+    for i in range(friends, 3 * scale):
+        friend = User.objects.create_user(
+            f'bench-friend-{i}', f'bench-friend-{i}@example.com', 'bench-password', level_test_completed=True
+        )
+        Friendship.objects.create(user1=user, user2=friend)
+        StudyProgress.objects.bulk_create([
+            StudyProgress(user=friend, word=words[j], review_count=1, proficiency=3) for j in range(5)
+        ])
+
+    # 오늘 출석까지 있어야 로그인 시 출석 처리(메시지 추가)를 건너뛴다
+    attended = Attendance.objects.filter(user=user).count()
+    _top_up(Attendance, attended, 7 * scale, lambda i: Attendance(
+        user=user, check_date=(now - timedelta(days=i)).date(), streak_days=7 * scale - i
+    ))
+
+    rebuild_daily_stats(user)
+    rebuild_streaks(User.objects.filter(pk=user.pk))
+    # 오늘의 단어 목록과 데일리 미션은 매일 밤 배치 작업(run_jobs)이 미리 만들어 둔다
+    DailySetBuilder(timezone.localdate(), rebuild=True).run(User.objects.filter(pk=user.pk))
+    build_daily_missions(timezone.localdate(), users=User.objects.filter(pk=user.pk))
+
+    friendship = Friendship.objects.filter(user1=user).first()
+    return {
+        'user': user,
+        'plan_id': plan.id,
+        'word_id': words[0].id,
+        'quiz_id': open_quiz.id,
+        'attempt_id': QuizAttempt.objects.filter(user=user).order_by('id').first().id,
+        'session_id': StudySession.objects.filter(user=user).order_by('id').first().id,
+        'friend_id': friendship.user2_id,
+        'user_id': friendship.user2_id,
+        'friendship_id': friendship.id,
+        'note_id': WrongAnswerNote.objects.filter(user=user).order_by('id').first().id,
+        'notification_id': StudyNotification.objects.filter(user=user).order_by('id').first().id,
+    }
+
+
+def discover_urls(fixtures, names=None):
+    """앱 urls.py 의 이름 있는 URL 을 (이름, 경로) 목록으로 (인자는 fixtures 로 채움)
+
+    반환값: (호출할 목록, [(이름, 건너뛴 이유)])
+    """
+    targets, skipped = [], []
+    for urlconf in APP_URLCONFS:
+        module = import_module(urlconf)
+        for pattern in module.urlpatterns:
+            if not pattern.name:
+                continue
+            name = f'{module.app_name}:{pattern.name}'
+            if names and name not in names:
+                continue
+            if name in SKIP_URLS:
+                skipped.append((name, '데이터 변경/외부 호출'))
+                continue
+            if name in POST_ONLY_URLS:
+                skipped.append((name, 'POST 전용'))
+                continue
+            if name in BROKEN_URLS:
+                skipped.append((name, f'알려진 오류: {BROKEN_URLS[name]}'))
+                continue
+            arg_names = list(pattern.pattern.converters)
+            missing = [arg for arg in arg_names if arg not in fixtures]
+            if missing:
+                skipped.append((name, f'인자 없음: {", ".join(missing)}'))
+                continue
+            try:
+                url = reverse(name, kwargs={arg: fixtures[arg] for arg in arg_names})
+            except NoReverseMatch:
+                skipped.append((name, 'reverse 실패'))
+                continue
+            if (name, url) not in targets:
+                targets.append((name, url))
+    return targets, skipped
+
+
+def measure(client, name, url, repeat=3):
+    """캐시를 비운 상태로 repeat 번 호출해 쿼리 수는 최댓값, 시간은 중앙값을 구한다
+
+    run_benchmark 의 전용 캐시(BENCHMARK_CACHES) 안에서 호출해야 한다.
+    """
+    queries, sql_times, wall_times = [], [], []
+    status = None
+    for _ in range(repeat):
+        cache.clear()
+        # 요청마다 세이브포인트로 감싸 되돌린다 (GET 에서 행을 만드는 뷰, 뷰 안에서 잡힌 DB 오류 격리)
+        with transaction.atomic(), CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = client.get(url)
+            wall = time.perf_counter() - start
+            transaction.set_rollback(True)
+        status = response.status_code
+        queries.append(len(captured))
+        sql_times.append(sum(float(query['time'] or 0) for query in captured.captured_queries))
+        wall_times.append(wall)
+    return ViewResult(
+        name, url, status, max(queries),
+        round(statistics.median(sql_times) * 1000, 2), round(statistics.median(wall_times) * 1000, 2)
+    )
+
+
+def run_benchmark(fixtures, names=None, repeat=3):
+    """fixtures 의 사용자로 로그인해 URL 을 모두 호출 -> ({이름: ViewResult}, 건너뛴 목록)"""
+    # 뷰에서 예외가 나도 멈추지 않고 500 으로 기록한다
+    client = Client(raise_request_exception=False)
+    client.force_login(fixtures['user'])
+    targets, skipped = discover_urls(fixtures, names)
+    results = {}
+    with override_settings(CACHES=BENCHMARK_CACHES):
+        for name, url in targets:
+            results[name] = measure(client, name, url, repeat)
+    return results, skipped
+
+
+def error_responses(results):
+    """오류 응답(4xx/5xx)을 낸 뷰 [(이름, 상태 코드)] - 기준값으로 저장하면 안 된다"""
+    return [(name, result.status) for name, result in sorted(results.items()) if result.status >= 400]
+
+
+def query_growth(small, large):
+    """데이터를 늘렸을 때 쿼리 수가 늘어난 뷰 [(이름, 이전, 이후)] - N+1 후보
+
+    오류 응답(5xx)은 디버그 오류 페이지의 쿼리가 섞이므로 비교하지 않는다.
+    """
+    return [
+        (name, small[name].queries, large[name].queries)
+        for name in small
+        if name in large and small[name].status < 500 and large[name].status < 500
+        and large[name].queries > small[name].queries
+    ]
+
+
+def compare_with_baseline(results, baseline, time_ratio=1.5, min_time_ms=20):
+    """기준값 대비 회귀 -> (쿼리 수 증가 목록, 응답 시간 증가 목록, 상태 코드 변경 목록)
+
+    쿼리 수는 하나라도 늘면 회귀로 보고, 시간은 기계마다 다르므로
+    time_ratio 배 이상이면서 min_time_ms 이상 느려졌을 때만 표시한다.
+    상태 코드가 바뀐 뷰는 쿼리 수/시간을 비교하지 않는다.
+    """
+    query_regressions, time_regressions, status_changes = [], [], []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if result.status != expected.get('status', result.status):
+            status_changes.append((name, expected['status'], result.status))
+            continue
+        if result.queries > expected['queries']:
+            query_regressions.append((name, expected['queries'], result.queries))
+        slower = result.wall_ms - expected['wall_ms']
+        if result.wall_ms > expected['wall_ms'] * time_ratio and slower > min_time_ms:
+            time_regressions.append((name, expected['wall_ms'], result.wall_ms))
+    return query_regressions, time_regressions, status_changes
+
+
+def load_baseline(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path, results, previous=None):
+    """측정값을 기준값 파일로 저장 (previous 가 있으면 측정하지 않은 URL 의 기준값을 유지)"""
+    data = dict(previous or {})
+    data.update({
+        name: {'url': result.url, 'status': result.status, 'queries': result.queries,
+               'sql_ms': result.sql_ms, 'wall_ms': result.wall_ms}
+        for name, result in results.items()
+    })
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(data.items())), f, ensure_ascii=False, indent=2)
+        f.write('\n')
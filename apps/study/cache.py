@@ -0,0 +1,54 @@
+"""사용자별 캐시 조각
+
+같은 사용자가 반복해서 여는 대시보드(홈 통계, 학습 통계 차트, 퀴즈 홈 숫자,
+친구 목록)의 계산 결과를 캐시에 보관한다. 키에 사용자별 버전 값을 넣어 두고,
+학습/퀴즈/출석/친구 데이터가 바뀌면(signals) 버전만 바꿔 그 사용자의 조각
+전체를 한 번에 무효화한다. 로컬 메모리/파일 캐시 어느 쪽에서도 동작한다.
+"""
+import time
+
+from django.core.cache import cache
+
+DEFAULT_TIMEOUT = 300  # 초
+
+
+def _version_key(user_id):
+    return f'user_cache:{user_id}:version'
+
+
+def _new_version():
+    # 버전 키가 캐시에서 밀려나 다시 만들어져도 예전 조각 키와 겹치지 않도록 시간 기반 값 사용
+    return time.time_ns()
+
+
+def get_user_version(user_id):
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), None)
+        version = cache.get(key)
+    return version
+
+
+def user_cache_key(user_id, name, *parts):
+    suffix = ':'.join(str(part) for part in parts)
+    return f'user_cache:{user_id}:{get_user_version(user_id)}:{name}:{suffix}'
+
+
+def get_user_fragment(user, name, compute, *parts, timeout=DEFAULT_TIMEOUT):
+    """user 의 name 조각을 캐시에서 가져오고, 없으면 compute() 결과를 저장해 반환
+
+    parts 는 키에 덧붙일 값 (예: 오늘 날짜) - 날짜가 바뀌면 자연히 새 키가 된다.
+    """
+    key = user_cache_key(user.pk, name, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value, timeout)
+    return value
+
+
+def invalidate_user(*user_ids):
+    """사용자들의 캐시 조각을 모두 무효화"""
+    version = _new_version()
+    cache.set_many({_version_key(user_id): version for user_id in user_ids if user_id}, None)
@@ -0,0 +1,182 @@
+"""사용자별 오늘의 단어 목록
+
+build_daily_sets 명령이 매일 밤 활성 사용자마다 다음 날의 단어 목록을 골라
+DailyWordAssignment 에 한꺼번에 넣어 두고, daily_words 화면은 (user, date) 인덱스로
+그 목록을 읽기만 한다. 목록 크기는 활성 학습 계획의 target_words_per_day, 난이도는
+레벨 테스트 결과(없으면 학습 계획의 난이도)를 따르고, 이미 학습한 단어는 뺀다.
+해당 난이도 단어가 부족하면 가까운 난이도에서 채운다.
+
+명령 실행 후 가입했거나 오래 접속하지 않아 목록이 없는 사용자는 화면을 처음 열 때
+그 사용자 목록만 만든다. 오래된 날짜의 목록은 명령이 KEEP_DAYS 일이 지나면 지운다.
+"""
+import random
+from collections import defaultdict
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from apps.vocabulary.models import Word
+
+from .metrics import DAILY_GENERATION_SECONDS
+from .models import DailyWordAssignment, StudyPlan, StudyProgress, UserLevel
+
+DEFAULT_TARGET = 10  # 활성 학습 계획이 없을 때 목록 크기
+ACTIVE_DAYS = 30  # 이 기간 안에 로그인한 사용자만 미리 만든다
+KEEP_DAYS = 7  # 지난 목록 보관 기간
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+LEVEL_DIFFICULTY = {1: 'easy', 2: 'easy', 3: 'medium', 4: 'medium', 5: 'hard'}
+
+
+def difficulty_order(difficulty):
+    """difficulty 부터 가까운 난이도 순서 (예: medium -> medium, easy, hard)"""
+    start = DIFFICULTIES.index(difficulty) if difficulty in DIFFICULTIES else 0
+    return sorted(DIFFICULTIES, key=lambda name: (abs(DIFFICULTIES.index(name) - start), DIFFICULTIES.index(name)))
+
+
+def active_users():
+    """미리 만들 대상 - ACTIVE_DAYS 안에 로그인한 활성 사용자 (배치 작업 공통)"""
+    since = timezone.now() - timedelta(days=ACTIVE_DAYS)
+    return get_user_model().objects.filter(is_active=True, last_login__gte=since)
+
+
+def user_id_chunks(users, chunk_size):
+    """users 쿼리셋의 id 를 chunk_size 개씩 (id 순서) 나눠 돌려준다"""
+    chunk = []
+    for user_id in users.order_by('pk').values_list('pk', flat=True).iterator(chunk_size=chunk_size):
+        chunk.append(user_id)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def user_rng(user_id, day):
+    return random.Random(f'daily-set:{day.isoformat()}:{user_id}')
+
+
+def _sample_ids(rng, ids, n, skip):
+    """ids 에서 skip 에 없는 id 를 n 개까지 무작위로 뽑는다 (skip 이 적으면 재추첨으로 바로 끝남)"""
+    chosen = []
+    if not ids or n <= 0:
+        return chosen
+    seen = set()
+    for _ in range(n * 3):
+        pk = ids[rng.randrange(len(ids))]
+        if pk not in skip and pk not in seen:
+            seen.add(pk)
+            chosen.append(pk)
+            if len(chosen) == n:
+                return chosen
+    rest = [pk for pk in ids if pk not in skip and pk not in seen]
+    return chosen + rng.sample(rest, min(n - len(chosen), len(rest)))
+
+
+class DailySetBuilder:
+    """day 의 사용자별 단어 목록을 만드는 일괄 작업
+
+    난이도별 단어 id 배열을 한 번만 읽고, 사용자는 chunk_size 명씩 학습 계획/레벨/학습한
+    단어를 한 번에 조회해 bulk_create 한다.
+    """
+
+    def __init__(self, day, chunk_size=500, batch_size=1000, rebuild=False):
+        self.day = day
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.rebuild = rebuild
+        self._pools = None
+
+    @property
+    def pools(self):
+        if self._pools is None:
+            pools = defaultdict(list)
+            for pk, difficulty in Word.objects.order_by('id').values_list('id', 'difficulty'):
+                pools[difficulty].append(pk)
+            self._pools = dict(pools)
+        return self._pools
+
+    def run(self, users=None):
+        """users(기본: 활성 사용자)의 목록을 만들고 (사용자 수, 단어 행 수) 반환"""
+        built = rows = 0
+        for chunk in user_id_chunks(active_users() if users is None else users, self.chunk_size):
+            chunk_users, chunk_rows = self._build_chunk(chunk)
+            built, rows = built + chunk_users, rows + chunk_rows
+        return built, rows
+
+    def _build_chunk(self, user_ids):
+        with transaction.atomic():
+            existing = DailyWordAssignment.objects.filter(user_id__in=user_ids, date=self.day)
+            if self.rebuild:
+                existing.delete()
+            else:
+                done = set(existing.order_by().values_list('user_id', flat=True).distinct())
+                user_ids = [user_id for user_id in user_ids if user_id not in done]
+            if not user_ids:
+                return 0, 0
+
+            targets = {}
+            plan_difficulty = {}
+            # 학습 계획 목록의 기본 정렬(-created_at)과 같이 가장 최근 활성 계획을 사용
+            plans = StudyPlan.objects.filter(user_id__in=user_ids, is_active=True).order_by('user_id', '-created_at')
+            for user_id, target, difficulty in plans.values_list('user_id', 'target_words_per_day', 'difficulty'):
+                targets.setdefault(user_id, target)
+                plan_difficulty.setdefault(user_id, difficulty)
+            levels = dict(UserLevel.objects.filter(user_id__in=user_ids).values_list('user_id', 'current_level'))
+            learned = defaultdict(set)
+            progress = StudyProgress.objects.filter(user_id__in=user_ids, review_count__gt=0)
+            for user_id, word_id in progress.values_list('user_id', 'word_id').iterator():
+                learned[user_id].add(word_id)
+
+            assignments = []
+            for user_id in user_ids:
+                difficulty = LEVEL_DIFFICULTY.get(levels.get(user_id)) or plan_difficulty.get(user_id)
+                word_ids = self.pick(user_id, targets.get(user_id, DEFAULT_TARGET), difficulty, learned[user_id])
+                assignments.extend(
+                    DailyWordAssignment(user_id=user_id, date=self.day, word_id=word_id, position=position)
+                    for position, word_id in enumerate(word_ids)
+                )
+            # 같은 사용자의 목록을 화면에서 동시에 만든 경우 먼저 들어간 목록을 남긴다
+            DailyWordAssignment.objects.bulk_create(assignments, batch_size=self.batch_size, ignore_conflicts=True)
+            return len(user_ids), len(assignments)
+
+    def pick(self, user_id, n, difficulty, learned):
+        """난이도가 가까운 순서로 학습하지 않은 단어 id 를 n 개까지 고른다"""
+        rng = user_rng(user_id, self.day)
+        chosen = []
+        for name in difficulty_order(difficulty):
+            if len(chosen) >= n:
+                break
+            chosen += self.sample(rng, name, n - len(chosen), learned)
+        return chosen
+
+    def sample(self, rng, difficulty, n, learned):
+        return _sample_ids(rng, self.pools.get(difficulty, ()), n, learned)
+
+
+class SingleUserSetBuilder(DailySetBuilder):
+    """화면에서 한 사용자 목록만 만들 때 - 난이도별 id 배열 전체 대신 WordQuerySet.sample() 로 뽑는다"""
+
+    def sample(self, rng, difficulty, n, learned):
+        return [word.pk for word in Word.objects.filter(difficulty=difficulty).sample(n, exclude_ids=learned, rng=rng)]
+
+
+def get_daily_words(user, day=None):
+    """user 의 day(기본: 오늘) 단어 목록 - 없으면 이 사용자 목록만 만들어 반환"""
+    day = day or timezone.localdate()
+    assignments = DailyWordAssignment.objects.filter(user=user, date=day).select_related('word').order_by('position')
+    words = [assignment.word for assignment in assignments]
+    if words:
+        return words
+
+    with DAILY_GENERATION_SECONDS.time(kind='daily_words'):
+        SingleUserSetBuilder(day).run(get_user_model().objects.filter(pk=user.pk))
+    return [assignment.word for assignment in assignments.all()]
+
+
+def purge_old_sets(day, keep_days=KEEP_DAYS):
+    """day 기준 keep_days 일보다 오래된 목록을 지우고 지운 행 수 반환"""
+    deleted, _ = DailyWordAssignment.objects.filter(date__lt=day - timedelta(days=keep_days)).delete()
+    return deleted
@@ -0,0 +1,85 @@
+"""학습 시간 하트비트 쓰기 지연(write-behind) 버퍼
+
+flashcard/review 화면은 10초마다, 그리고 blur/unload 때마다 세션의 누적 학습 시간(초)을
+보낸다. 하트비트는 캐시의 세션별 버퍼에 가장 큰 값만 남기고, 마지막 DB 반영 후
+STUDY_HEARTBEAT_FLUSH_INTERVAL 초가 지났거나 페이지를 떠날 때 보내는 마지막 하트비트
+(final)일 때만 StudySession 과 일일 학습 통계에 쓴다.
+
+DB 에는 항상 누적 시간(절대값)을 더 큰 경우에만 쓰므로, 워커마다 캐시가 따로인
+로컬 메모리 캐시에서 같은 세션의 버퍼가 여러 개 생겨도 값이 줄거나 두 번 더해지지 않는다.
+브라우저가 마지막 하트비트 없이 종료되면 최대 FLUSH_INTERVAL 만큼의 시간이 반영되지 않는다.
+"""
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .metrics import STUDY_MINUTES
+from .models import StudySession
+from .stats import get_total_study_minutes, record_study_minutes
+
+BUFFER_TIMEOUT = 60 * 60 * 6  # 초
+
+HeartbeatResult = namedtuple('HeartbeatResult', ['flushed', 'total_minutes'])
+
+
+def buffer_key(session_id):
+    return f'study_heartbeat:{session_id}'
+
+
+def flush_interval():
+    return getattr(settings, 'STUDY_HEARTBEAT_FLUSH_INTERVAL', 120)
+
+
+def record_heartbeat(user, session_id, seconds, final=False):
+    """세션의 누적 학습 시간(초) 하트비트를 버퍼에 반영하고 필요하면 DB 에 쓴다
+
+    세션이 없거나 다른 사용자의 세션이면 StudySession.DoesNotExist 를 일으킨다.
+    반환값의 total_minutes 는 DB 에 반영된 전체 학습 시간에 버퍼에만 있는 시간을 더한 값이다.
+    """
+    key = buffer_key(session_id)
+    now = time.time()
+    buffer = cache.get(key)
+    if buffer is None or buffer['user_id'] != user.pk:
+        # 이 세션의 첫 하트비트 (또는 캐시에서 밀려남) - 소유자 확인과 현재 저장값을 한 번만 읽는다
+        session = StudySession.objects.only('study_minutes').get(id=session_id, user=user)
+        stored = round(session.study_minutes * 60)
+        buffer = {'user_id': user.pk, 'seconds': stored, 'flushed_seconds': stored, 'flushed_at': now}
+
+    buffer['seconds'] = max(buffer['seconds'], int(seconds))
+    pending = buffer['seconds'] > buffer['flushed_seconds']
+    flushed = pending and (final or now - buffer['flushed_at'] >= flush_interval())
+    if flushed:
+        _flush(user, session_id, buffer['seconds'])
+        buffer['flushed_seconds'] = buffer['seconds']
+        buffer['flushed_at'] = now
+    cache.set(key, buffer, BUFFER_TIMEOUT)
+
+    pending_minutes = (buffer['seconds'] - buffer['flushed_seconds']) / 60
+    return HeartbeatResult(flushed, get_total_study_minutes(user) + pending_minutes)
+
+
+def _flush(user, session_id, seconds):
+    """버퍼의 누적 시간을 세션과 일일 통계에 쓴다 (저장된 값보다 클 때만, 종료된 세션은 제외)"""
+    minutes = round(seconds / 60, 2)
+    with transaction.atomic():
+        session = StudySession.objects.select_for_update().only(
+            'user_id', 'start_time', 'end_time', 'study_minutes'
+        ).filter(id=session_id, user=user).first()
+        # 종료된 세션의 학습 시간은 study_session_end 가 경과 시간으로 확정한다
+        if session is None or session.end_time is not None or minutes <= session.study_minutes:
+            return
+        delta = minutes - session.study_minutes
+        StudySession.objects.filter(pk=session.pk).update(
+            study_minutes=minutes, daily_study_minutes=minutes, updated_at=timezone.now()
+        )
+        record_study_minutes(user, session, delta)
+    STUDY_MINUTES.inc(delta)
+
+
+def discard(session_id):
+    """세션 종료/초기화 시 버퍼를 버린다 (종료 처리가 학습 시간을 직접 확정함)"""
+    cache.delete(buffer_key(session_id))
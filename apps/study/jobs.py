@@ -0,0 +1,225 @@
+"""배치 작업 등록소와 cron 형식 스케줄러
+
+아침 접속이 몰릴 때 읽기만 하도록 사용자별 데이터(오늘의 단어 목록, 데일리 미션과 보기,
+복습 대기열, 복습/학습 독려 알림)를 전날 밤이나 이른 아침에 사용자 묶음 단위로
+bulk_create/bulk_update 해 두고, 가입 직후 레벨 테스트가 쓰는 문제 은행도 매주 새로 만든다.
+
+작업은 이 모듈 아래쪽에 ``@register_job(이름, 'cron 식', day_offset=...)`` 으로 등록하고,
+``run_jobs`` 명령이 실행한다. 시스템 cron 에서 1분마다 ``run_jobs`` 를 부르거나,
+``run_jobs --loop`` 를 별도 프로세스로 띄운다. 예약 시각(분 단위)마다 JobRun 행을 먼저
+만들고 (name, scheduled_for) 가 유일하므로, 스케줄러가 여러 개 떠 있어도 한 번만 실행된다.
+실행 시간과 처리한 행 수는 JobRun 과 지표(job_duration_seconds, job_rows_total)에 남는다.
+
+예약 시각은 settings.JOB_SCHEDULES = {'작업 이름': 'cron 식'} 로 바꿀 수 있다
+(빈 문자열이면 예약 실행 안 함). cron 식은 ``분 시 일 월 요일`` 다섯 칸이며 ``*``, ``5``,
+``1-5``, ``*/15``, ``1,15`` 형식과 요일 0(또는 7)=일요일을 지원한다.
+"""
+import logging
+import time
+import traceback
+from collections import namedtuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .daily_sets import DailySetBuilder
+from .level_test import build_question_bank
+from .metrics import JOB_ROWS, JOB_SECONDS
+from .missions import build_daily_missions
+from .models import JobRun
+from .srs import refresh_due_queues
+from .utils import create_reminder_notifications, create_review_notifications
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_CATCH_UP_MINUTES = 60  # 스케줄러가 늦어졌을 때 거슬러 확인할 최대 분
+
+Job = namedtuple('Job', ['name', 'func', 'schedule', 'day_offset', 'description'])
+
+JOBS = {}
+
+
+def register_job(name, schedule, day_offset=0):
+    """func(day, chunk_size) -> {항목: 행 수} 를 name 작업으로 등록하는 데코레이터
+
+    day_offset 은 실행한 날짜(TIME_ZONE 기준)에서 작업 대상 날짜까지의 일 수
+    (밤에 다음 날 데이터를 만드는 작업은 1).
+    """
+    parse_cron(schedule)
+
+    def decorator(func):
+        if name in JOBS:
+            raise ValueError(f'{name} 작업이 이미 등록되어 있습니다.')
+        JOBS[name] = Job(name, func, schedule, day_offset, (func.__doc__ or '').strip().splitlines()[0])
+        return func
+    return decorator
+
+
+def get_job(name):
+    try:
+        return JOBS[name]
+    except KeyError:
+        raise KeyError(f'등록되지 않은 작업입니다: {name} (가능: {", ".join(sorted(JOBS))})') from None
+
+
+def schedule_of(job):
+    """settings.JOB_SCHEDULES 로 바꾼 예약 시각 (없으면 등록할 때의 값)"""
+    return getattr(settings, 'JOB_SCHEDULES', {}).get(job.name, job.schedule)
+
+
+# --- cron 식 ---
+
+CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+def _parse_field(text, low, high):
+    values = set()
+    for part in text.split(','):
+        value_range, _, step = part.partition('/')
+        if value_range == '*':
+            start, end = low, high
+        elif '-' in value_range:
+            start, end = (int(value) for value in value_range.split('-', 1))
+        else:
+            start = end = int(value_range)
+        if start < low or end > high or start > end:
+            raise ValueError(f'cron 값 범위({low}-{high})를 벗어났습니다: {part}')
+        values.update(range(start, end + 1, int(step) if step else 1))
+    return frozenset(values)
+
+
+def parse_cron(expression):
+    """'분 시 일 월 요일' -> (분, 시, 일, 월, 요일) 값 집합과 일/요일 제한 여부"""
+    fields = expression.split()
+    if len(fields) != 5:
+        raise ValueError(f'cron 식은 다섯 칸이어야 합니다: {expression!r}')
+    minutes, hours, days, months, weekdays = (
+        _parse_field(text, low, high) for text, (low, high) in zip(fields, CRON_FIELDS)
+    )
+    if 7 in weekdays:
+        weekdays = weekdays | {0}
+    return minutes, hours, days, months, weekdays, fields[2] != '*', fields[4] != '*'
+
+
+def cron_matches(expression, moment):
+    """moment(현지 시각)가 cron 식에 맞는지 - 일과 요일이 둘 다 제한되면 둘 중 하나만 맞아도 됨"""
+    minutes, hours, days, months, weekdays, days_limited, weekdays_limited = parse_cron(expression)
+    if moment.minute not in minutes or moment.hour not in hours or moment.month not in months:
+        return False
+    day_ok = moment.day in days
+    weekday_ok = (moment.weekday() + 1) % 7 in weekdays
+    if days_limited and weekdays_limited:
+        return day_ok or weekday_ok
+    return day_ok and weekday_ok
+
+
+def due_jobs(moment):
+    """moment(분 단위로 자른 현지 시각)에 예약된 작업"""
+    return [job for job in JOBS.values() if schedule_of(job) and cron_matches(schedule_of(job), moment)]
+
+
+# --- 실행 ---
+
+def run_job(name, day=None, scheduled_for=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """작업 하나를 실행하고 JobRun 을 반환 (같은 예약 시각을 다른 프로세스가 이미 맡았으면 None)
+
+    day 를 주지 않으면 오늘(예약 실행은 예약 시각의 날짜)에 작업의 day_offset 을 더한 날짜.
+    작업에서 난 예외는 JobRun 에 기록하고 다시 일으키지 않는다.
+    """
+    job = get_job(name)
+    if day is None:
+        day = timezone.localtime(scheduled_for).date() + timedelta(days=job.day_offset)
+    try:
+        with transaction.atomic():
+            run = JobRun.objects.create(name=name, scheduled_for=scheduled_for, target_date=day)
+    except IntegrityError:
+        return None
+
+    start = time.perf_counter()
+    try:
+        run.rows = job.func(day, chunk_size) or {}
+        run.status = 'success'
+    except Exception:
+        logger.exception('%s 작업 실패 (%s)', name, day)
+        run.status = 'failed'
+        run.error = traceback.format_exc()
+    run.duration_seconds = round(time.perf_counter() - start, 3)
+    run.finished_at = timezone.now()
+    run.save(update_fields=['rows', 'status', 'error', 'duration_seconds', 'finished_at'])
+
+    JOB_SECONDS.observe(run.duration_seconds, job=name, status=run.status)
+    JOB_ROWS.inc(sum(run.rows.values()), job=name)
+    logger.info('%s 작업 %s (%s, %.1f초): %s', name, run.status, day, run.duration_seconds, run.rows)
+    return run
+
+
+def run_due(now=None, since=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """since 다음 분부터 now 까지 예약된 작업을 실행하고 실행한 JobRun 목록을 반환
+
+    since 가 없으면 now 가 속한 분만 확인한다. 너무 오래 멈춰 있었던 경우 MAX_CATCH_UP_MINUTES
+    분 전까지만 거슬러 확인한다.
+    """
+    now = timezone.localtime(now).replace(second=0, microsecond=0)
+    earliest = now - timedelta(minutes=MAX_CATCH_UP_MINUTES)
+    moment = now if since is None else max(timezone.localtime(since).replace(second=0, microsecond=0), earliest)
+    if since is not None:
+        moment += timedelta(minutes=1)
+
+    runs = []
+    while moment <= now:
+        for job in due_jobs(moment):
+            run = run_job(job.name, scheduled_for=moment, chunk_size=chunk_size)
+            if run is not None:
+                runs.append(run)
+        moment += timedelta(minutes=1)
+    return runs
+
+
+def last_runs():
+    """{작업 이름: 마지막 JobRun}"""
+    return {
+        name: JobRun.objects.filter(name=name).order_by('-started_at').first()
+        for name in JOBS
+    }
+
+
+# --- 등록된 작업 ---
+
+@register_job('daily_sets', '30 23 * * *', day_offset=1)
+def daily_sets_job(day, chunk_size):
+    """활성 사용자별 다음 날 단어 목록 (DailyWordAssignment)"""
+    users, rows = DailySetBuilder(day, chunk_size=chunk_size).run()
+    return {'users': users, 'DailyWordAssignment': rows}
+
+
+@register_job('daily_missions', '40 23 * * *', day_offset=1)
+def daily_missions_job(day, chunk_size):
+    """북마크가 5개 이상인 활성 사용자의 다음 날 데일리 미션과 보기"""
+    return build_daily_missions(day, chunk_size=chunk_size)
+
+
+@register_job('review_queues', '50 5 * * *')
+def review_queues_job(day, chunk_size):
+    """학습했지만 SRS 상태가 없는 진도를 복습 대기열에 넣기"""
+    return {'StudyProgress': refresh_due_queues(batch_size=chunk_size)}
+
+
+@register_job('review_notifications', '0 6 * * *')
+def review_notifications_job(day, chunk_size):
+    """오늘 복습할 카드가 있는 사용자에게 복습 알림 (review_queues 다음에 실행)"""
+    return create_review_notifications(day, chunk_size=chunk_size)
+
+
+@register_job('study_reminders', '10 6 * * *')
+def study_reminders_job(day, chunk_size):
+    """마지막 학습 후 3/7/14일째인 사용자에게 학습 독려 알림"""
+    return create_reminder_notifications(day, chunk_size=chunk_size)
+
+
+@register_job('question_bank', '0 4 * * 1')
+def question_bank_job(day, chunk_size):
+    """레벨 테스트 문제 은행을 새 단어/보기로 다시 만들기 (매주)"""
+    return {f'TestQuestion.{difficulty}': count for difficulty, count in build_question_bank(rebuild=True).items()}
@@ -0,0 +1,326 @@
+"""레벨 테스트 문제 은행과 테스트 생성
+
+단어 난이도(easy/medium/hard)마다 문제 은행용 LevelTest(is_question_bank) 에 보기까지
+만든 TestQuestion 을 BANK_SIZE 개씩 미리 만들어 둔다 (build_question_bank 명령,
+run_jobs 의 question_bank 작업). 사용자가 레벨 테스트를 시작하면 프로세스 메모리에
+적재한 은행에서 난이도별 QUESTIONS_PER_DIFFICULTY 문제를 뽑아 섞고, 사용자 테스트의
+문제 행을 한 번의 bulk_create 로 복사한다.
+
+은행은 build_question_bank 가 바뀐 프로세스에서 ``invalidate()`` 로 다시 적재하고,
+다른 워커 프로세스에는 ``MAX_AGE`` 후 반영된다. 복사한 문제는 은행 행을 참조하지 않으므로
+은행을 다시 만들어도 진행 중인 테스트에는 영향이 없다.
+
+테스트를 푸는 동안 바뀌지 않는 문제 목록(순서, 보기, 정답)은 캐시에 두고, 캐시에서
+밀려나면 DB 에서 같은 순서로 다시 읽는다. 진행 상황(문제 번호별 답안과 LevelScorer 의
+난이도별 집계)은 워커가 바뀌어도 이어지도록 세션에 두고 답안마다 그 문제 칸과 집계만
+바꾼다. UserTestResult 에는 모든 문제에 답한 뒤 완료할 때 점수/레벨과 답안 기록을 한 번만 쓴다.
+"""
+import random
+import threading
+import time
+from collections import namedtuple
+
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.quiz.distractors import distractor_pool
+from apps.vocabulary.models import Word
+
+from .models import LevelTest, TestQuestion, UserTestResult
+
+BANK_SIZE = 200  # 난이도별 은행 문제 수
+QUESTIONS_PER_DIFFICULTY = 20
+
+# 단어 난이도 -> 레벨 테스트 난이도
+BANK_DIFFICULTIES = {'easy': 'beginner', 'medium': 'intermediate', 'hard': 'advanced'}
+
+RUN_TIMEOUT = 60 * 60 * 24  # 문제 목록 캐시 보관 시간(초)
+
+BankQuestion = namedtuple('BankQuestion', ['word_id', 'question_text', 'correct_answer', 'options'])
+RunQuestion = namedtuple(
+    'RunQuestion', ['id', 'word_id', 'difficulty', 'question_text', 'correct_answer', 'options']
+)
+LevelResult = namedtuple(
+    'LevelResult', ['score', 'level', 'difficulty', 'accuracy_rates', 'total_correct', 'total_questions']
+)
+
+
+class QuestionBank:
+    """난이도별 은행 문제 목록을 보관하는 버전 관리형 풀"""
+
+    MAX_AGE = 600  # 초
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._loaded_version = None
+        self._loaded_at = 0.0
+        self._state = {}
+
+    def invalidate(self):
+        """은행을 다시 만든 뒤 호출 - 다음 조회 때 다시 적재한다."""
+        with self._lock:
+            self._version += 1
+
+    def _is_fresh(self):
+        return (
+            self._loaded_version == self._version
+            and time.monotonic() - self._loaded_at < self.MAX_AGE
+        )
+
+    def questions(self):
+        """{단어 난이도: (BankQuestion, ...)}"""
+        if self._is_fresh():
+            return self._state
+        with self._lock:
+            if self._is_fresh():
+                return self._state
+            version = self._version
+            difficulty_of = {bank: word for word, bank in BANK_DIFFICULTIES.items()}
+            groups = {difficulty: [] for difficulty in BANK_DIFFICULTIES}
+            rows = TestQuestion.objects.filter(test__is_question_bank=True).order_by('id').values_list(
+                'test__difficulty', 'word_id', 'question_text', 'correct_answer', 'options'
+            )
+            for bank_difficulty, *fields in rows:
+                difficulty = difficulty_of.get(bank_difficulty)
+                if difficulty:
+                    groups[difficulty].append(BankQuestion(*fields))
+            self._state = {difficulty: tuple(questions) for difficulty, questions in groups.items()}
+            self._loaded_version = version
+            self._loaded_at = time.monotonic()
+            return self._state
+
+
+question_bank = QuestionBank()
+
+
+def make_question(word, rng=random):
+    """word 의 객관식 문제 (보기 4개, 정답 포함) - TestQuestion 의 필드 값 dict"""
+    options = distractor_pool.sample(word, 3, 'korean', rng=rng) + [word.korean]
+    rng.shuffle(options)
+    return {
+        'question_type': 'multiple_choice',
+        'word_id': word.id,
+        'question_text': f"다음 단어의 뜻으로 알맞은 것은? - {word.english}",
+        'correct_answer': word.korean,
+        'options': options,
+        'points': 1,
+    }
+
+
+def build_question_bank(size=BANK_SIZE, rebuild=False, rng=random):
+    """난이도별 은행을 size 문제까지 채우고 (rebuild 면 새로 만들고) {난이도: 추가한 문제 수} 반환"""
+    added = {}
+    with transaction.atomic():
+        for difficulty, bank_difficulty in BANK_DIFFICULTIES.items():
+            bank, _ = LevelTest.objects.get_or_create(
+                is_question_bank=True, difficulty=bank_difficulty,
+                defaults={
+                    'title': f'레벨 테스트 문제 은행 ({difficulty})',
+                    'description': '사용자 레벨 테스트 문제를 뽑는 문제 은행입니다.',
+                },
+            )
+            if rebuild:
+                bank.questions.all().delete()
+            existing = set(bank.questions.values_list('word_id', flat=True))
+            words = Word.objects.filter(difficulty=difficulty).sample(
+                max(0, size - len(existing)), exclude_ids=existing, rng=rng
+            )
+            TestQuestion.objects.bulk_create([TestQuestion(test=bank, **make_question(word, rng)) for word in words])
+            added[difficulty] = len(words)
+    question_bank.invalidate()
+    return added
+
+
+def create_level_test(user, rng=random):
+    """은행에서 문제를 뽑아 user 의 레벨 테스트를 만든다 (문제가 하나도 없으면 None)
+
+    은행이 비어 있으면 (build_question_bank 를 아직 실행하지 않은 경우) 한 번 만든다.
+    """
+    bank = question_bank.questions()
+    if not any(bank.values()):
+        build_question_bank(rng=rng)
+        bank = question_bank.questions()
+
+    picked = []
+    for difficulty in BANK_DIFFICULTIES:
+        pool = bank.get(difficulty, ())
+        picked += rng.sample(pool, min(QUESTIONS_PER_DIFFICULTY, len(pool)))
+    if not picked:
+        return None
+    rng.shuffle(picked)
+
+    with transaction.atomic():
+        test = LevelTest.objects.create(
+            title=f"{user.username}의 레벨 테스트",
+            description="사용자 레벨을 측정하기 위한 테스트입니다."
+        )
+        TestQuestion.objects.bulk_create([
+            TestQuestion(
+                test=test, question_type='multiple_choice', word_id=question.word_id,
+                question_text=question.question_text, correct_answer=question.correct_answer,
+                # 같은 은행 문제를 받은 사용자끼리도 보기 순서는 다르게
+                options=rng.sample(question.options, len(question.options)), points=1
+            )
+            for question in picked
+        ])
+        UserTestResult.objects.create(user=user, test=test, score=0, level=1, answers={})
+    return test
+
+
+def questions_cache_key(user_id, test_id):
+    return f'level_test_questions:{user_id}:{test_id}'
+
+
+def progress_session_key(test_id):
+    return f'level_test_progress:{test_id}'
+
+
+class LevelScorer:
+    """단어 난이도별 [정답 수, 답한 수] 를 답안마다 갱신하는 채점기
+
+    tallies 를 넘기면 그 dict 를 그대로 갱신한다 (세션에 저장된 집계).
+    """
+
+    def __init__(self, tallies=None):
+        self.tallies = tallies if tallies is not None else {}
+        for difficulty in BANK_DIFFICULTIES:
+            self.tallies.setdefault(difficulty, [0, 0])
+
+    def add(self, difficulty, correct):
+        tally = self.tallies.setdefault(difficulty, [0, 0])
+        tally[0] += int(correct)
+        tally[1] += 1
+
+    def remove(self, difficulty, correct):
+        tally = self.tallies[difficulty]
+        tally[0] -= int(correct)
+        tally[1] -= 1
+
+    def accuracy_rates(self):
+        """{난이도: 정답률(%)} - 답한 문제가 없는 난이도는 0"""
+        return {
+            difficulty: (correct / total) * 100 if total else 0
+            for difficulty, (correct, total) in self.tallies.items()
+        }
+
+    def result(self):
+        rates = self.accuracy_rates()
+        if rates['hard'] >= 70:
+            level, difficulty = 5, 'hard'  # 고급
+        elif rates['hard'] >= 50:
+            level, difficulty = 4, 'hard'  # 중상급
+        elif rates['medium'] >= 70:
+            level, difficulty = 3, 'medium'  # 중급
+        elif rates['medium'] >= 50:
+            level, difficulty = 2, 'easy'  # 초급
+        else:
+            level, difficulty = 1, 'easy'  # 기초
+
+        total_correct = sum(correct for correct, _ in self.tallies.values())
+        total_questions = sum(total for _, total in self.tallies.values())
+        score = int((total_correct / total_questions) * 100) if total_questions else 0
+        return LevelResult(score, level, difficulty, rates, total_correct, total_questions)
+
+
+class LevelTestRun:
+    """한 사용자의 레벨 테스트 진행 상태 - 문제 목록, 문제 번호별 답안, 채점 집계"""
+
+    def __init__(self, session, user_id, test_id, questions, progress):
+        self.session = session
+        self.user_id = user_id
+        self.test_id = test_id
+        self.questions = questions
+        self.answers = progress['answers']  # '문제 번호' -> [답, 정답 여부]
+        self.scorer = LevelScorer(progress['tallies'])
+
+    @classmethod
+    def load(cls, request, test_id):
+        """캐시의 문제 목록과 세션의 진행 상황을 꺼낸다 (request.user 의 테스트가 아니면 None)
+
+        문제 목록이 캐시에 없으면 한 번의 쿼리로 다시 읽고, 세션에 진행 상황이 없으면
+        (이 테스트를 처음 열거나 이미 완료한 경우) UserTestResult 에 저장된 답안으로 만든다.
+        """
+        user = request.user
+        key = questions_cache_key(user.pk, test_id)
+        questions = cache.get(key)
+        progress = request.session.get(progress_session_key(test_id))
+        stored_answers = {}
+        if questions is None or progress is None:
+            result = UserTestResult.objects.filter(user=user, test_id=test_id).only('answers').first()
+            if result is None:
+                return None
+            if questions is None:
+                rows = TestQuestion.objects.filter(test_id=test_id).order_by('id').values_list(
+                    'id', 'word_id', 'word__difficulty', 'question_text', 'correct_answer', 'options'
+                )
+                questions = tuple(RunQuestion(*row) for row in rows)
+                cache.set(key, questions, RUN_TIMEOUT)
+            if progress is None:
+                progress = {'answers': {}, 'tallies': {}}
+                request.session[progress_session_key(test_id)] = progress
+                stored_answers = result.answers or {}
+
+        run = cls(request.session, user.pk, test_id, questions, progress)
+        for number, answer in stored_answers.items():
+            if number.isdigit() and 1 <= int(number) <= run.total:
+                run._set(int(number), answer['answer'], answer['correct'])
+        return run
+
+    @property
+    def total(self):
+        return len(self.questions)
+
+    def question(self, number):
+        """1부터 세는 number 번째 문제"""
+        return self.questions[number - 1]
+
+    def first_unanswered(self):
+        """아직 답하지 않은 첫 문제 번호 (모두 답했으면 None)"""
+        for number in range(1, self.total + 1):
+            if str(number) not in self.answers:
+                return number
+        return None
+
+    def _set(self, number, answer, correct):
+        difficulty = self.question(number).difficulty
+        previous = self.answers.get(str(number))
+        if previous is not None:
+            self.scorer.remove(difficulty, previous[1])
+        self.answers[str(number)] = [answer, correct]
+        self.scorer.add(difficulty, correct)
+        self.session.modified = True
+
+    def record(self, number, answer):
+        """number 번 문제의 답안을 채점해 세션에 기록
+
+        이전 문제로 돌아가 다시 답하면 그 문제의 답안과 집계만 바꾼다. 반환값: 정답 여부
+        """
+        correct = answer == self.question(number).correct_answer
+        if self.answers.get(str(number)) != [answer, correct]:
+            self._set(number, answer, correct)
+        return correct
+
+    def finish(self):
+        """점수/레벨과 답안 기록을 UserTestResult 에 한 번 쓰고 세션의 진행 상황을 지운 뒤 LevelResult 반환
+
+        답하지 않은 문제가 있으면 ValueError 를 일으킨다 (first_unanswered 로 먼저 확인).
+        """
+        if self.first_unanswered() is not None:
+            raise ValueError('아직 답하지 않은 문제가 있습니다.')
+        result = self.scorer.result()
+        answers = {}
+        for number in range(1, self.total + 1):
+            question = self.question(number)
+            answer, correct = self.answers[str(number)]
+            answers[str(number)] = {
+                'word_id': question.word_id,
+                'answer': answer,
+                'correct': correct,
+                'difficulty': question.difficulty,
+            }
+        UserTestResult.objects.filter(user_id=self.user_id, test_id=self.test_id).update(
+            score=result.score, level=result.level, answers=answers
+        )
+        self.session.pop(progress_session_key(self.test_id), None)
+        return result
@@ -0,0 +1,434 @@
+"""용량 계획/부하 테스트용 대량 데이터 생성기 (``seed_load`` 명령)
+
+사용자 N명과 단어 M개, 그리고 사용자별 학습 기록(진도, 세션, 학습 기록, 퀴즈,
+출석, 알림)과 친구 관계를 만든다. 모든 값은 seed 와 마지막 날짜(end_date)로만
+정해지므로 같은 인자로 다시 만들면 같은 데이터가 나온다. 사용자마다 따로
+``random.Random`` 을 두어 청크 크기를 바꿔도 결과가 같다.
+
+분포는 실제 서비스와 비슷하게 잡는다.
+
+- 단어 인기도는 Zipf 분포 (순위가 높은 단어를 많은 사용자가 학습)
+- 사용자의 약 15%는 가입만 한 휴면 사용자, 나머지의 활동일 수는 한쪽으로 치우친 베타 분포
+- 레벨이 높을수록 하루 학습량과 정답률이 높음
+
+행은 ``bulk_create`` 로만 쓰며, MySQL 은 bulk_create 후 pk 를 돌려주지 않으므로
+부모 행의 id 는 고유한 값(사용자명, 영어 키, 퀴즈 제목)으로 다시 조회한다.
+"""
+import itertools
+import math
+import random
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from apps.accounts.models import Attendance, UserProfile
+from apps.quiz.distractors import distractor_pool
+from apps.quiz.models import Quiz, QuizAttempt, QuizQuestion
+from apps.quiz.runner import quiz_mode
+from apps.vocabulary.lookup import word_lookup
+from apps.vocabulary.models import Word, normalize_english
+from apps.vocabulary.search import word_search_index
+from .models import (
+    Friendship, StudyNotification, StudyProgress, StudySession, UserLevel, WordStudyHistory
+)
+from .srs import DEFAULT_EASE, MIN_EASE
+
+LOAD_PASSWORD = 'load-password'
+
+# 레벨 테스트 결과 분포 (1~5)
+LEVEL_WEIGHTS = [30, 30, 20, 12, 8]
+DORMANT_RATIO = 0.15
+QUIZ_QUESTIONS = 10
+ZIPF_EXPONENT = 0.9
+MAX_FRIENDS = 8
+
+ENGLISH_ONSETS = ['b', 'c', 'd', 'f', 'g', 'h', 'l', 'm', 'n', 'p', 'r', 's', 't', 'v', 'w',
+                  'br', 'cl', 'dr', 'gr', 'pl', 'st', 'tr', 'sh', 'th', 'ch']
+ENGLISH_VOWELS = ['a', 'e', 'i', 'o', 'u', 'ea', 'ou', 'ai']
+ENGLISH_CODAS = ['', '', 'n', 'r', 't', 'l', 'st', 'nd', 'ck', 'ng']
+KOREAN_SYLLABLES = '가나다라마바사아자차카타파하고노도로모보소오조호구누두루무부수우주후기니디리미비시이지히'
+
+# 학습 시작 시각 분포 (저녁에 몰림)
+STUDY_HOURS = list(range(6, 24))
+STUDY_HOUR_WEIGHTS = [1, 2, 3, 2, 2, 2, 3, 2, 2, 2, 2, 3, 4, 6, 8, 8, 6, 3]
+
+NOTIFICATION_MESSAGES = {
+    'goal': '오늘의 학습 목표를 달성했습니다!',
+    'streak': '연속 학습 기록을 이어가고 있습니다!',
+    'mastery': '단어를 완벽하게 암기했습니다!',
+    'level': '레벨이 올랐습니다!',
+}
+
+# 생성 시각을 직접 정하는 auto_now_add 필드가 있는 모델
+TIMESTAMPED_MODELS = [
+    Word, UserProfile, Attendance, StudySession, StudyProgress, WordStudyHistory,
+    Quiz, QuizAttempt, StudyNotification, Friendship,
+]
+
+
+@contextmanager
+def explicit_timestamps(models):
+    """auto_now_add 를 잠시 꺼서 bulk_create 에 넘긴 created_at 등을 그대로 저장한다"""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now_add', False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def _chunks(items, size):
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _srs_interval(repetitions):
+    """SM-2 와 같은 모양의 간격 (일) - 생성 데이터용 근사값"""
+    if repetitions <= 0:
+        return 1
+    if repetitions == 1:
+        return 6
+    return min(365, round(6 * DEFAULT_EASE ** (repetitions - 2)))
+
+
+class LoadGenerator:
+    """seed_load 명령의 데이터 생성기
+
+    run() 은 모델 이름별로 만든 행 수(Counter)를 돌려준다.
+    """
+
+    def __init__(self, users, words, days=90, seed=0, prefix='load', end_date=None,
+                 batch_size=1000, chunk_users=200, log=None):
+        self.user_count = users
+        self.word_count = words
+        self.days = days
+        self.seed = seed
+        self.prefix = prefix
+        self.end_date = end_date or timezone.localdate()
+        self.batch_size = batch_size
+        self.chunk_users = chunk_users
+        self.log = log or (lambda message: None)
+        self.counts = Counter()
+        self.tz = timezone.get_current_timezone()
+
+    # --- 공통 ---
+
+    def _rng(self, *parts):
+        return random.Random(':'.join(str(part) for part in (self.seed, *parts)))
+
+    def _at(self, day, hour=0, minute=0):
+        return timezone.make_aware(datetime.combine(day, time(hour, minute)), self.tz)
+
+    def _bulk(self, model, rows):
+        model.objects.bulk_create(rows, batch_size=self.batch_size)
+        self.counts[model.__name__] += len(rows)
+
+    def username(self, index):
+        return f'{self.prefix}{self.seed}_{index:07d}'
+
+    def generated_users(self):
+        return get_user_model().objects.filter(username__startswith=f'{self.prefix}{self.seed}_')
+
+    # --- 단어 ---
+
+    def _word_spellings(self):
+        """인기 순위 순서의 (영어, 한글 뜻) M개 - 같은 seed 면 항상 같은 목록"""
+        rng = self._rng('words')
+        seen = set()
+        while len(seen) < self.word_count:
+            syllables = rng.choice([1, 2, 2, 3, 3, 4])
+            english = ''.join(
+                rng.choice(ENGLISH_ONSETS) + rng.choice(ENGLISH_VOWELS) for _ in range(syllables)
+            ) + rng.choice(ENGLISH_CODAS)
+            if english in seen:
+                continue
+            seen.add(english)
+            korean = ''.join(rng.choice(KOREAN_SYLLABLES) for _ in range(rng.randint(2, 4)))
+            yield english, korean
+
+    def create_words(self):
+        """없는 단어만 만들고 인기 순위 순서의 단어 id 목록을 돌려준다 (다시 실행해도 중복 없음)"""
+        rng = self._rng('word-fields')
+        difficulties = [choice for choice, _ in Word.DIFFICULTY_CHOICES]
+        parts = [choice for choice, _ in Word.PART_OF_SPEECH_CHOICES]
+        existing = word_lookup.english_ids()
+        created_at = self._at(self.end_date - timedelta(days=self.days))
+
+        spellings = list(self._word_spellings())
+        keys = []
+        new_words = []
+        for rank, (english, korean) in enumerate(spellings):
+            key = normalize_english(english)
+            keys.append(key)
+            # 인기 순위가 낮을수록 어려운 단어
+            difficulty = difficulties[min(2, rank * 3 // len(spellings))]
+            part = rng.choice(parts)
+            if key in existing:
+                continue
+            new_words.append(Word(
+                english=english, english_key=key, korean=korean, difficulty=difficulty,
+                part_of_speech=part, example_sentence=f'This is an example with {english}.',
+                example_translation=f'{korean}(이)가 들어간 예문입니다.', created_at=created_at,
+            ))
+
+        for chunk in _chunks(new_words, self.batch_size * 5):
+            with transaction.atomic():
+                self._bulk(Word, chunk)
+
+        # bulk 작업은 signals 를 거치지 않으므로 단어 캐시를 직접 무효화
+        if new_words:
+            word_search_index.invalidate()
+            word_lookup.invalidate()
+            distractor_pool.invalidate()
+        ids = word_lookup.english_ids()
+        return [ids[key] for key in keys]
+
+    # --- 사용자 ---
+
+    def _user_plan(self, index):
+        """사용자 index 의 레벨/활동일 - 사용자 행과 학습 기록이 같은 값을 쓰도록 한곳에서 정한다"""
+        rng = self._rng('user', index)
+        level = rng.choices(range(1, 6), weights=LEVEL_WEIGHTS)[0]
+        if rng.random() < DORMANT_RATIO:
+            active_days = []
+            joined_ago = rng.randint(0, self.days)
+        else:
+            count = max(1, round(self.days * rng.betavariate(1.2, 3)))
+            # 활동일은 가입일 이후 - 최근에 가입한 사용자일수록 활동일이 적다
+            joined_ago = rng.randint(count - 1, self.days - 1) if count < self.days else self.days - 1
+            offsets = rng.sample(range(joined_ago + 1), count)
+            active_days = sorted(self.end_date - timedelta(days=offset) for offset in offsets)
+        return {
+            'level': level,
+            'joined': self.end_date - timedelta(days=joined_ago),
+            'active_days': active_days,
+            'level_test_completed': bool(active_days) or rng.random() < 0.5,
+        }
+
+    def create_users(self, indexes, password):
+        User = get_user_model()
+        plans = {index: self._user_plan(index) for index in indexes}
+        users = []
+        for index in indexes:
+            rng = self._rng('profile', index)
+            username = self.username(index)
+            users.append(User(
+                username=username, email=f'{username}@load.example.com', password=password,
+                nickname=''.join(rng.choice(KOREAN_SYLLABLES) for _ in range(3)) + str(index),
+                is_student=True, level_test_completed=plans[index]['level_test_completed'],
+                date_joined=self._at(plans[index]['joined'], rng.randint(8, 22), rng.randint(0, 59)),
+            ))
+        self._bulk(User, users)
+        ids = dict(User.objects.filter(username__in=[user.username for user in users])
+                   .values_list('username', 'id'))
+        return {index: (ids[self.username(index)], plans[index]) for index in indexes}
+
+    # --- 사용자별 학습 기록 ---
+
+    def _activity(self, rng, index, user_id, plan, word_ids, cum_weights):
+        """한 사용자의 학습 기록 행들 -> {모델: [행]}, [(퀴즈 제목, 퀴즈 행, 문제 단어, 정답 여부, 응시 행)]"""
+        level = plan['level']
+        accuracy = 0.45 + 0.09 * level
+        rows = {model: [] for model in (StudySession, WordStudyHistory, Attendance, StudyNotification)}
+        quizzes = []
+        # 단어 id -> [학습 횟수, 정답 수, 연속 정답, 오답 수, 마지막 학습 시각]
+        studied = {}
+        studied_order = []
+        streak = 0
+        previous_day = None
+        points = 0
+
+        for day in plan['active_days']:
+            streak = streak + 1 if previous_day == day - timedelta(days=1) else 1
+            previous_day = day
+            hour = rng.choices(STUDY_HOURS, weights=STUDY_HOUR_WEIGHTS)[0]
+            start = self._at(day, hour, rng.randint(0, 59))
+            rows[Attendance].append(Attendance(
+                user_id=user_id, check_date=day, streak_days=streak, created_at=start
+            ))
+
+            # 학습 세션 (하루 1~2번)
+            moment = start
+            for _ in range(1 if rng.random() < 0.7 else 2):
+                minutes = round(min(120.0, rng.lognormvariate(2.3, 0.6)), 1)
+                end = moment + timedelta(minutes=minutes)
+                rows[StudySession].append(StudySession(
+                    user_id=user_id, study_type=rng.choice(['flashcard', 'flashcard', 'word_list', 'review']),
+                    start_time=moment, end_time=end, study_minutes=minutes, daily_study_minutes=minutes,
+                    created_at=moment,
+                ))
+                moment = end + timedelta(minutes=rng.randint(5, 180))
+
+            # 단어 학습 기록 - 새 단어(인기 단어 위주)와 복습 단어를 섞는다
+            words_today = max(1, min(80, round(rng.lognormvariate(math.log(8 + 3 * level), 0.5))))
+            for position in range(words_today):
+                if studied_order and rng.random() < 0.4:
+                    word_id = rng.choice(studied_order)
+                else:
+                    word_id = rng.choices(word_ids, cum_weights=cum_weights)[0]
+                    if word_id not in studied:
+                        studied[word_id] = [0, 0, 0, 0, None]
+                        studied_order.append(word_id)
+                is_correct = rng.random() < accuracy
+                at = start + timedelta(seconds=20 * position)
+                state = studied[word_id]
+                state[0] += 1
+                if is_correct:
+                    state[1] += 1
+                    state[2] += 1
+                else:
+                    state[2] = 0
+                    state[3] += 1
+                state[4] = at
+                rows[WordStudyHistory].append(WordStudyHistory(
+                    user_id=user_id, word_id=word_id, is_correct=is_correct, created_at=at
+                ))
+
+            # 퀴즈 (레벨이 높을수록 자주)
+            if len(studied_order) >= QUIZ_QUESTIONS and rng.random() < 0.2 + 0.05 * level:
+                quiz_type = rng.choice([choice for choice, _ in Quiz.QUIZ_TYPES])
+                question_words = rng.sample(studied_order, QUIZ_QUESTIONS)
+                results = [rng.random() < accuracy for _ in question_words]
+                taken_at = moment + timedelta(minutes=rng.randint(1, 30))
+                correct = sum(results)
+                title = f'{self.username(index)} 퀴즈 {len(quizzes) + 1}'
+                quiz = Quiz(
+                    title=title, quiz_type=quiz_type, difficulty=rng.choice(['easy', 'medium', 'hard']),
+                    created_by_id=user_id, created_at=taken_at, is_public=False,
+                )
+                attempt = QuizAttempt(
+                    user_id=user_id, quiz_type=quiz_type, mode=quiz_mode(quiz_type),
+                    started_at=taken_at, completed_at=taken_at + timedelta(minutes=rng.randint(2, 10)),
+                    score=correct * 100 // QUIZ_QUESTIONS, total_questions=QUIZ_QUESTIONS,
+                    correct_answers=correct,
+                )
+                quizzes.append((title, quiz, question_words, results, attempt))
+                points += correct * 10
+
+            # 알림 - 오래된 알림일수록 읽음
+            if rng.random() < 0.1:
+                notification_type = rng.choice(list(NOTIFICATION_MESSAGES))
+                rows[StudyNotification].append(StudyNotification(
+                    user_id=user_id, notification_type=notification_type,
+                    message=NOTIFICATION_MESSAGES[notification_type],
+                    is_read=(self.end_date - day).days > 3 and rng.random() < 0.8, created_at=moment,
+                ))
+
+        rows[StudyProgress] = [
+            self._progress(user_id, word_id, *studied[word_id]) for word_id in studied_order
+        ]
+        points += 5 * sum(state[1] for state in studied.values())
+        return rows, quizzes, points
+
+    def _progress(self, user_id, word_id, count, correct, repetitions, lapses, last):
+        """누적 학습 결과로 숙련도와 SRS 상태를 채운 StudyProgress"""
+        interval = _srs_interval(repetitions)
+        due_at = last + timedelta(days=interval)
+        return StudyProgress(
+            user_id=user_id, word_id=word_id, review_count=count,
+            proficiency=max(1, min(5, 1 + round(4 * correct / count) - (1 if repetitions == 0 else 0))),
+            last_reviewed=last, next_review_date=timezone.localtime(due_at).date(),
+            ease_factor=max(MIN_EASE, round(DEFAULT_EASE - 0.15 * lapses, 2)),
+            interval_days=interval, repetitions=repetitions, lapses=lapses, due_at=due_at,
+            created_at=last,
+        )
+
+    def create_activity(self, users, word_ids, cum_weights):
+        """청크의 사용자들에 대한 프로필/레벨/학습 기록을 쓴다"""
+        rows = {model: [] for model in (StudySession, WordStudyHistory, Attendance, StudyNotification,
+                                         StudyProgress)}
+        profiles, levels, quizzes = [], [], []
+        for index, (user_id, plan) in users.items():
+            rng = self._rng('activity', index)
+            user_rows, user_quizzes, points = self._activity(rng, index, user_id, plan, word_ids, cum_weights)
+            for model, model_rows in user_rows.items():
+                rows[model].extend(model_rows)
+            quizzes.extend(user_quizzes)
+            profiles.append(UserProfile(
+                user_id=user_id, points=points, level=1 + points // 1000, experience=min(100, points),
+                daily_goal=rng.choice([10, 15, 15, 20, 30]), created_at=self._at(plan['joined']),
+            ))
+            if plan['level_test_completed']:
+                levels.append(UserLevel(
+                    user_id=user_id, current_level=plan['level'], recommended_words_per_day=10 + 5 * plan['level']
+                ))
+
+        self._bulk(UserProfile, profiles)
+        self._bulk(UserLevel, levels)
+        for model, model_rows in rows.items():
+            self._bulk(model, model_rows)
+
+        # 퀴즈 -> (제목으로 id 조회) -> 문제/응시 기록
+        self._bulk(Quiz, [quiz for _, quiz, _, _, _ in quizzes])
+        quiz_ids = dict(Quiz.objects.filter(
+            created_by_id__in=[user_id for user_id, _ in users.values()]
+        ).values_list('title', 'id'))
+        questions, attempts = [], []
+        for title, _, question_words, results, attempt in quizzes:
+            quiz_id = quiz_ids[title]
+            attempt.quiz_id = quiz_id
+            attempts.append(attempt)
+            questions.extend(
+                QuizQuestion(quiz_id=quiz_id, word_id=word_id, order=order, is_correct=ok)
+                for order, (word_id, ok) in enumerate(zip(question_words, results), start=1)
+            )
+        self._bulk(QuizQuestion, questions)
+        self._bulk(QuizAttempt, attempts)
+
+    # --- 친구 ---
+
+    def create_friendships(self, user_ids):
+        """가까운 번호의 사용자끼리 친구가 되기 쉽게 (작은 모임) 친구 관계를 만든다"""
+        pairs = set()
+        rows = []
+        count = len(user_ids)
+        for index, user_id in enumerate(user_ids):
+            rng = self._rng('friends', index)
+            for _ in range(rng.randint(0, MAX_FRIENDS // 2)):
+                other = index + rng.choice([-1, 1]) * rng.randint(1, 50)
+                if not 0 <= other < count or other == index:
+                    continue
+                pair = (min(index, other), max(index, other))
+                if pair in pairs:
+                    continue
+                pairs.add(pair)
+                rows.append(Friendship(
+                    user1_id=user_ids[pair[0]], user2_id=user_ids[pair[1]],
+                    created_at=self._at(self.end_date - timedelta(days=rng.randint(0, self.days)), 12),
+                ))
+        for chunk in _chunks(rows, self.batch_size * 5):
+            with transaction.atomic():
+                self._bulk(Friendship, chunk)
+
+    # --- 실행 ---
+
+    def run(self):
+        password = make_password(LOAD_PASSWORD, salt=f'{self.prefix}{self.seed}')
+        with explicit_timestamps(TIMESTAMPED_MODELS):
+            word_ids = self.create_words()
+            self.log(f'단어 {len(word_ids)}개 준비')
+            cum_weights = list(itertools.accumulate(
+                1 / (rank + 1) ** ZIPF_EXPONENT for rank in range(len(word_ids))
+            ))
+
+            user_ids = []
+            for indexes in _chunks(range(self.user_count), self.chunk_users):
+                with transaction.atomic():
+                    users = self.create_users(indexes, password)
+                    self.create_activity(users, word_ids, cum_weights)
+                user_ids.extend(user_id for user_id, _ in users.values())
+                self.log(f'사용자 {len(user_ids)}/{self.user_count}명, 누적 {sum(self.counts.values()):,}행')
+
+            self.create_friendships(user_ids)
+        return self.counts
@@ -0,0 +1,88 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import setup_test_environment
+
+from apps.study.benchmarks import (
+    KEY_VIEWS, compare_with_baseline, error_responses, load_baseline, query_growth, run_benchmark,
+    save_baseline, seed_dataset
+)
+
+DEFAULT_BASELINE = os.path.join(settings.BASE_DIR, 'benchmarks', 'view_baselines.json')
+
+
+class Command(BaseCommand):
+    help = '모든 뷰의 쿼리 수/SQL 시간/응답 시간을 재고 기준값과 비교합니다. (생성한 데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=1, help='벤치마크 데이터 크기 배수')
+        parser.add_argument(
+            '--growth-scale', type=int, default=3,
+            help='데이터를 이 배수로 늘려 다시 측정해 쿼리 수가 늘어난 뷰(N+1)를 찾음 (0 이면 생략)'
+        )
+        parser.add_argument('--repeat', type=int, default=3, help='URL 마다 측정 반복 횟수')
+        parser.add_argument('--only', nargs='+', help='측정할 URL 이름 (예: study:statistics)')
+        parser.add_argument('--key-views', action='store_true', help='주요 화면만 측정')
+        parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='기준값 JSON 파일 경로')
+        parser.add_argument('--update-baseline', action='store_true', help='이번 측정값을 기준값으로 저장')
+
+    def handle(self, *args, **options):
+        # 테스트 클라이언트의 호스트(testserver) 허용 등
+        setup_test_environment()
+        names = set(options['only'] or (KEY_VIEWS if options['key_views'] else [])) or None
+        scale = options['scale']
+        growth_scale = options['growth_scale']
+
+        with transaction.atomic():
+            fixtures = seed_dataset(scale)
+            results, skipped = run_benchmark(fixtures, names, options['repeat'])
+            growth = []
+            if growth_scale > scale:
+                grown = seed_dataset(growth_scale)
+                larger, _ = run_benchmark(grown, names, 1)
+                growth = query_growth(results, larger)
+            transaction.set_rollback(True)
+
+        baseline = load_baseline(options['baseline'])
+        query_regressions, time_regressions, status_changes = compare_with_baseline(results, baseline)
+        errors = error_responses(results)
+
+        self.stdout.write(f'{"URL":<42} {"상태":>4} {"쿼리":>5} {"SQL ms":>9} {"전체 ms":>9}')
+        for name, result in sorted(results.items()):
+            expected = baseline.get(name, {}).get('queries')
+            marker = f' (기준 {expected})' if expected is not None and expected != result.queries else ''
+            self.stdout.write(
+                f'{name:<42} {result.status:>4} {result.queries:>5} '
+                f'{result.sql_ms:>9.2f} {result.wall_ms:>9.2f}{marker}'
+            )
+        if options['verbosity'] >= 2:
+            for name, reason in skipped:
+                self.stdout.write(f'  건너뜀 {name}: {reason}')
+
+        for name, before, after in growth:
+            self.stderr.write(self.style.ERROR(
+                f'N+1 의심: {name} 쿼리 {before} -> {after} (데이터 {scale}배 -> {growth_scale}배)'
+            ))
+        for name, before, after in query_regressions:
+            self.stderr.write(self.style.ERROR(f'쿼리 수 증가: {name} {before} -> {after}'))
+        for name, before, after in status_changes:
+            self.stderr.write(self.style.ERROR(f'상태 코드 변경: {name} {before} -> {after}'))
+        for name, status in errors:
+            self.stderr.write(self.style.ERROR(f'오류 응답: {name} {status}'))
+        for name, before, after in time_regressions:
+            self.stderr.write(self.style.WARNING(f'응답 시간 증가: {name} {before:.1f}ms -> {after:.1f}ms'))
+
+        if options['update_baseline']:
+            if errors:
+                raise CommandError(f'오류 응답 {len(errors)}건은 기준값으로 저장하지 않습니다 (뷰를 고치거나 BROKEN_URLS 에 추가)')
+            # 일부 URL 만 측정한 경우 나머지 기준값은 유지
+            save_baseline(options['baseline'], results, previous=baseline if names else None)
+            self.stdout.write(self.style.SUCCESS(f'기준값을 저장했습니다: {options["baseline"]}'))
+            return
+
+        failures = len(growth) + len(query_regressions) + len(status_changes) + len(errors)
+        if failures:
+            raise CommandError(f'회귀 {failures}건')
+        self.stdout.write(self.style.SUCCESS(f'{len(results)}개 URL 측정 완료, 쿼리 회귀 없음'))
@@ -0,0 +1,34 @@
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.study.daily_sets import KEEP_DAYS, DailySetBuilder, purge_old_sets
+
+
+class Command(BaseCommand):
+    help = '활성 사용자별 오늘의 단어 목록(DailyWordAssignment)을 미리 만듭니다 (매일 자정 전에 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', type=date.fromisoformat, help='목록 날짜 (YYYY-MM-DD, 기본: 내일)')
+        parser.add_argument('--user', help='특정 사용자(username)만 만들기 (활성 여부 무관)')
+        parser.add_argument('--rebuild', action='store_true', help='이미 있는 목록도 지우고 다시 만들기')
+        parser.add_argument('--chunk-size', type=int, default=500, help='한 트랜잭션에서 처리할 사용자 수')
+        parser.add_argument('--keep-days', type=int, default=KEEP_DAYS, help='이보다 오래된 날짜의 목록 삭제')
+
+    def handle(self, *args, **options):
+        day = options['date'] or timezone.localdate() + timedelta(days=1)
+        users = None
+        if options['user']:
+            users = get_user_model().objects.filter(username=options['user'])
+
+        start = time.perf_counter()
+        builder = DailySetBuilder(day, chunk_size=options['chunk_size'], rebuild=options['rebuild'])
+        built, rows = builder.run(users)
+        purged = purge_old_sets(day, options['keep_days'])
+        self.stdout.write(self.style.SUCCESS(
+            f'{day} 목록 {built}명 / 단어 {rows}행 생성, 지난 목록 {purged}행 삭제 '
+            f'({time.perf_counter() - start:.1f}초)'
+        ))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.study.level_test import BANK_SIZE, build_question_bank
+
+
+class Command(BaseCommand):
+    help = '레벨 테스트용 난이도별 문제 은행(보기 포함)을 만듭니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=BANK_SIZE, help='난이도별 문제 수')
+        parser.add_argument('--rebuild', action='store_true', help='기존 은행 문제를 지우고 새로 뽑기')
+
+    def handle(self, *args, **options):
+        added = build_question_bank(size=options['size'], rebuild=options['rebuild'])
+        summary = ', '.join(f'{difficulty} {count}개' for difficulty, count in added.items())
+        self.stdout.write(self.style.SUCCESS(f'문제 은행에 추가: {summary}'))
@@ -1,15 +1,13 @@
 from django.core.management.base import BaseCommand
-from django.contrib.auth import get_user_model
-from apps.study.utils import check_and_create_reminder_notification
+from django.utils import timezone
+from apps.study.jobs import run_job
 
 class Command(BaseCommand):
-    help = '학습하지 않은 사용자들에게 독려 알림을 보냅니다'
+    help = '학습하지 않은 사용자들에게 독려 알림을 보냅니다 (run_jobs 의 study_reminders 작업)'
 
     def handle(self, *args, **options):
-        User = get_user_model()
-        users = User.objects.all()
+        run = run_job('study_reminders', day=timezone.localdate())
         
-        for user in users:
-            check_and_create_reminder_notification(user)
-        
-        self.stdout.write(self.style.SUCCESS('학습 독려 알림 체크가 완료되었습니다.')) 
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS(
+            f'학습 독려 알림 체크가 완료되었습니다. ({run.rows.get("StudyNotification.reminder", 0)}건)'
+        ))
@@ -0,0 +1,87 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Min
+
+from apps.study.models import ReviewSchedule, StudyProgress
+from apps.study.srs import SRS_FIELDS, backfill_state, start_of_day
+
+
+class Command(BaseCommand):
+    help = 'ReviewSchedule 의 대기 중인 복습 일정을 StudyProgress 의 SRS 상태로 옮기고 정리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='DB 에 쓰지 않고 결과만 집계')
+        parser.add_argument(
+            '--purge-history', action='store_true',
+            help='완료/건너뜀 상태의 지난 일정 행도 삭제'
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        batch_size = options['batch_size']
+
+        # (사용자, 단어)별 가장 이른 대기 일정 - 같은 단어의 중복 행은 하나로 합친다
+        pending = {
+            (row['user_id'], row['word_id']): row['first_date']
+            for row in ReviewSchedule.objects.filter(status='pending')
+            .values('user_id', 'word_id').annotate(first_date=Min('scheduled_date'))
+        }
+        pending_rows = ReviewSchedule.objects.filter(status='pending').count()
+
+        # SRS 상태가 없는 진도에 초기 상태를 채운다
+        fields = ('id', 'user_id', 'word_id', 'proficiency', 'review_count', 'last_reviewed', 'next_review_date')
+        changed = []
+        progresses = StudyProgress.objects.filter(due_at__isnull=True).filter(
+            review_count__gt=0
+        ).only(*fields)
+        for progress in progresses.iterator(chunk_size=batch_size):
+            first_pending = pending.pop((progress.user_id, progress.word_id), None)
+            backfill_state(progress, first_pending)
+            changed.append(progress)
+
+        # 남은 대기 일정의 진도 행만 사용자 묶음으로 조회한다
+        # - SRS 상태가 없는 진도(review_count 0 포함)는 대기 날짜로 대기열에 넣고
+        # - SRS 상태를 가진 진도의 대기 일정은 지우기만 하고
+        # - 진도 행 없이 일정만 남은 단어는 review_count 0 인 진도로 만든다
+        words_by_user = defaultdict(set)
+        for user_id, word_id in pending:
+            words_by_user[user_id].add(word_id)
+        user_ids = sorted(words_by_user)
+        for index in range(0, len(user_ids), batch_size):
+            chunk = user_ids[index:index + batch_size]
+            rows = StudyProgress.objects.filter(
+                user_id__in=chunk, word_id__in=set().union(*(words_by_user[user_id] for user_id in chunk))
+            ).only(*fields, 'due_at')
+            for progress in rows:
+                first_pending = pending.pop((progress.user_id, progress.word_id), None)
+                if first_pending is not None and progress.due_at is None:
+                    backfill_state(progress, first_pending)
+                    changed.append(progress)
+
+        created = [
+            StudyProgress(
+                user_id=user_id, word_id=word_id, due_at=start_of_day(day),
+                next_review_date=day, interval_days=1
+            )
+            for (user_id, word_id), day in pending.items()
+        ]
+
+        history = ReviewSchedule.objects.exclude(status='pending')
+        history_rows = history.count() if options['purge_history'] else 0
+
+        if not dry_run:
+            with transaction.atomic():
+                StudyProgress.objects.bulk_update(changed, SRS_FIELDS, batch_size=batch_size)
+                StudyProgress.objects.bulk_create(created, batch_size=batch_size)
+                ReviewSchedule.objects.filter(status='pending').delete()
+                if options['purge_history']:
+                    history.delete()
+
+        prefix = '[dry-run] ' if dry_run else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}SRS 상태 초기화 {len(changed)}개, 진도 생성 {len(created)}개, '
+            f'대기 일정 {pending_rows}행 정리, 지난 일정 {history_rows}행 삭제'
+        ))
@@ -0,0 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from apps.study.audio import audio_store, get_synthesizer
+from apps.vocabulary.models import Word
+
+
+class Command(BaseCommand):
+    help = '모든 단어(영어)와 예문의 TTS 음성 파일을 미리 만들어 둡니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--synthesizer',
+            help="합성기 클래스 경로 (기본: settings.TTS_SYNTHESIZER, 예: apps.study.audio.FakeSynthesizer)"
+        )
+        parser.add_argument('--words-only', action='store_true', help='예문은 제외')
+        parser.add_argument('--workers', type=int, default=4, help='동시에 합성할 작업 수')
+
+    def handle(self, *args, **options):
+        synthesizer = get_synthesizer(options['synthesizer'])
+
+        texts = []
+        for english, example in Word.objects.order_by('id').values_list('english', 'example_sentence'):
+            texts.append(english)
+            if example and not options['words_only']:
+                texts.append(example)
+        texts = list(dict.fromkeys(text.strip() for text in texts if text and text.strip()))
+
+        created = skipped = failed = 0
+
+        def generate(text):
+            return audio_store.generate(text, 'en', synthesizer=synthesizer)[1]
+
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            futures = [executor.submit(generate, text) for text in texts]
+            for i, (text, future) in enumerate(zip(texts, futures), start=1):
+                try:
+                    if future.result():
+                        created += 1
+                    else:
+                        skipped += 1
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f'실패: {text[:40]} ({e})')
+                if i % 100 == 0:
+                    self.stdout.write(f'{i}/{len(texts)} 처리 중...')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'음성 파일 생성 완료: 새로 생성 {created}개, 기존 파일 {skipped}개, 실패 {failed}개'
+        ))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+from apps.study.streaks import rebuild_streaks
+
+
+class Command(BaseCommand):
+    help = '일일 학습 통계로 사용자별 연속 학습일(UserStreak)을 다시 계산합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='특정 사용자(username)만 다시 계산')
+
+    def handle(self, *args, **options):
+        users = None
+        if options['user']:
+            users = get_user_model().objects.filter(username=options['user'])
+
+        count = rebuild_streaks(users)
+        self.stdout.write(self.style.SUCCESS(f'{count}명의 연속 학습일을 다시 계산했습니다.'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+from apps.study.stats import rebuild_daily_stats
+
+
+class Command(BaseCommand):
+    help = '학습 진도/세션/퀴즈 기록으로 일일 학습 통계(DailyStudyStats)를 다시 만듭니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='특정 사용자(username)만 다시 계산')
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        users = User.objects.all()
+        if options['user']:
+            users = users.filter(username=options['user'])
+
+        total_rows = 0
+        for user in users.iterator():
+            total_rows += rebuild_daily_stats(user)
+
+        self.stdout.write(self.style.SUCCESS(f'일일 학습 통계 {total_rows}건을 다시 만들었습니다.'))
@@ -0,0 +1,73 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils import timezone
+
+from apps.study.jobs import DEFAULT_CHUNK_SIZE, JOBS, last_runs, run_due, run_job, schedule_of
+
+
+class Command(BaseCommand):
+    help = (
+        '예약된 배치 작업(apps.study.jobs)을 실행합니다. 옵션 없이 실행하면 지금 시각(분)에 예약된 작업만 '
+        '실행하므로 시스템 cron 에서 1분마다 부르고, --loop 는 직접 1분마다 확인하는 프로세스로 동작합니다'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--job', action='append', help='예약과 상관없이 바로 실행할 작업 이름 (여러 번 지정 가능)')
+        parser.add_argument('--date', type=date.fromisoformat, help='--job 의 대상 날짜 (YYYY-MM-DD, 기본: 작업별 기본값)')
+        parser.add_argument('--list', action='store_true', help='등록된 작업과 마지막 실행 결과 보기')
+        parser.add_argument('--loop', action='store_true', help='종료하지 않고 1분마다 예약된 작업 실행')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='한 번에 처리할 사용자 수')
+
+    def handle(self, *args, **options):
+        if options['list']:
+            return self._list()
+
+        chunk_size = options['chunk_size']
+        if options['job']:
+            for name in options['job']:
+                if name not in JOBS:
+                    raise CommandError(f'등록되지 않은 작업입니다: {name} (가능: {", ".join(sorted(JOBS))})')
+            for name in options['job']:
+                self._report(run_job(name, day=options['date'], chunk_size=chunk_size))
+            return
+
+        if not options['loop']:
+            for run in run_due(chunk_size=chunk_size):
+                self._report(run)
+            return
+
+        self.stdout.write('예약된 작업을 1분마다 확인합니다 (Ctrl+C 로 종료)')
+        last_checked = None
+        try:
+            while True:
+                now = timezone.now()
+                for run in run_due(now, since=last_checked, chunk_size=chunk_size):
+                    self._report(run)
+                last_checked = now
+                # 작업 사이에 DB 연결이 끊겼거나 오래되었으면 새로 연결한다
+                close_old_connections()
+                time.sleep(60 - timezone.localtime().second)
+        except KeyboardInterrupt:
+            pass
+
+    def _report(self, run):
+        style = self.style.SUCCESS if run.status == 'success' else self.style.ERROR
+        rows = ', '.join(f'{name} {count:,}' for name, count in run.rows.items()) or '-'
+        self.stdout.write(style(f'{run.name} ({run.target_date}) {run.get_status_display()} {run.duration_seconds:.1f}초: {rows}'))
+        if run.error:
+            self.stderr.write(run.error)
+
+    def _list(self):
+        runs = last_runs()
+        for name, job in JOBS.items():
+            run = runs[name]
+            last = (
+                f'{timezone.localtime(run.started_at):%Y-%m-%d %H:%M} {run.get_status_display()} '
+                f'{run.duration_seconds:.1f}초 {run.rows}'
+                if run else '실행 기록 없음'
+            )
+            self.stdout.write(f'{name:<22} {schedule_of(job) or "(예약 없음)":<14} {job.description}')
+            self.stdout.write(f'{"":<22} 마지막 실행: {last}')
@@ -0,0 +1,76 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.study.loadgen import LOAD_PASSWORD, LoadGenerator
+from apps.study.stats import rebuild_daily_stats
+from apps.study.streaks import rebuild_streaks
+
+
+class Command(BaseCommand):
+    help = '부하 테스트/용량 계획용 사용자, 단어, 학습 기록을 seed 로 재현 가능하게 대량 생성합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='생성할 사용자 수')
+        parser.add_argument('--words', type=int, default=5000, help='사용할 단어 수 (없는 단어만 생성)')
+        parser.add_argument('--days', type=int, default=90, help='학습 기록을 만들 기간 (일)')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--end-date', type=date.fromisoformat, help='기록의 마지막 날짜 (YYYY-MM-DD, 기본: 오늘)')
+        parser.add_argument('--prefix', default='load', help='생성 사용자 이름 접두어')
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_create 한 번에 넣을 행 수')
+        parser.add_argument('--chunk-users', type=int, default=200, help='한 트랜잭션에서 처리할 사용자 수')
+        parser.add_argument('--clear', action='store_true', help='같은 prefix/seed 로 만든 사용자와 기록을 먼저 삭제')
+        parser.add_argument(
+            '--skip-rollups', action='store_true',
+            help='일일 학습 통계/연속 학습일 재계산 생략 (나중에 rebuild_study_stats, rebuild_streaks 실행)'
+        )
+
+    def handle(self, *args, **options):
+        if options['days'] < 1 or options['users'] < 0 or options['words'] < 10:
+            raise CommandError('--days 는 1 이상, --words 는 10 이상이어야 합니다.')
+
+        generator = LoadGenerator(
+            users=options['users'], words=options['words'], days=options['days'], seed=options['seed'],
+            prefix=options['prefix'], end_date=options['end_date'], batch_size=options['batch_size'],
+            chunk_users=options['chunk_users'],
+            log=self.stdout.write if options['verbosity'] >= 1 else None,
+        )
+
+        existing = generator.generated_users()
+        if options['clear']:
+            deleted, _ = existing.delete()
+            self.stdout.write(f'기존 생성 데이터 {deleted:,}행 삭제')
+        elif existing.exists():
+            raise CommandError(
+                f'{generator.username(0)} 등 이미 생성된 사용자가 있습니다. --clear 로 지우거나 --seed/--prefix 를 바꾸세요.'
+            )
+
+        start = time.perf_counter()
+        counts = generator.run()
+        elapsed = time.perf_counter() - start
+        total = sum(counts.values())
+        for model, count in sorted(counts.items()):
+            self.stdout.write(f'  {model:<20} {count:>12,}')
+        self.stdout.write(
+            f'{total:,}행 생성 ({elapsed:.1f}초, 분당 {total / elapsed * 60 if elapsed else 0:,.0f}행)'
+        )
+
+        if not options['skip_rollups']:
+            start = time.perf_counter()
+            users = generator.generated_users()
+            # 생성한 행은 이미 커밋되었으므로 재계산이 실패하면 무엇을 다시 실행할지 알려준다
+            try:
+                stats_rows = sum(rebuild_daily_stats(user) for user in users.iterator())
+                streaks = rebuild_streaks(users)
+            except Exception as exc:
+                raise CommandError(
+                    f'데이터 {total:,}행은 생성했지만 일일 학습 통계/연속 학습일 재계산에 실패했습니다: {exc!r}. '
+                    f'원인을 해결한 뒤 rebuild_study_stats, rebuild_streaks 를 실행하세요.'
+                ) from exc
+            self.stdout.write(
+                f'일일 학습 통계 {stats_rows:,}행, 연속 학습일 {streaks:,}명 재계산 '
+                f'({time.perf_counter() - start:.1f}초)'
+            )
+
+        self.stdout.write(self.style.SUCCESS(f'완료 - 생성 사용자 로그인: {generator.username(0)} / {LOAD_PASSWORD}'))
@@ -0,0 +1,287 @@
+"""프로세스 내 지표(카운터/게이지/히스토그램)와 Prometheus 텍스트 형식 출력
+
+지표는 이 모듈 아래쪽에 모아 정의하고, 기능 코드에서는 ``QUIZ_SUBMISSIONS.inc(...)``,
+``with DAILY_GENERATION_SECONDS.time(kind=...)`` 처럼 기록만 한다. 요청 처리 시간과
+진행 중인 요청 수는 RequestTimingMiddleware 가 모든 뷰에 대해 기록한다.
+
+워커가 여러 프로세스면 METRICS_DIR 를 지정한다. 각 프로세스는 요청이 끝날 때
+METRICS_FLUSH_INTERVAL 초에 한 번씩 자기 값을 ``<dir>/metrics-<pid>.json`` 에 쓰고,
+/metrics 는 디렉터리의 파일을 모두 합쳐 출력한다. 카운터/히스토그램은 종료된
+프로세스 값까지 더하고, 게이지는 METRICS_GAUGE_MAX_AGE 초 안에 기록한 프로세스만 더한다.
+파일이 계속 쌓이지 않도록 배포할 때(워커 시작 전) 디렉터리를 비운다.
+"""
+import bisect
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metric:
+    """라벨 값 조합별 값을 가진 지표"""
+
+    type = None
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if len(labels) != len(self.label_names):
+            raise ValueError(f'{self.name} 지표의 라벨은 {self.label_names} 입니다: {tuple(labels)}')
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def samples(self):
+        """{라벨 값 튜플: 값} 사본"""
+        with self._lock:
+            return {key: list(value) if isinstance(value, list) else value for key, value in self._values.items()}
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """값 분포 - 라벨 조합별 [버킷별 개수..., +Inf 개수, 합계, 개수]"""
+
+    type = 'histogram'
+
+    def __init__(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0] * (len(self.buckets) + 3)
+            row[index] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._last_flush = 0.0
+
+    def _register(self, cls, name, help_text, labels, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labels, **kwargs)
+            elif not isinstance(metric, cls) or metric.label_names != tuple(labels):
+                raise ValueError(f'{name} 지표가 다른 형식으로 이미 등록되어 있습니다.')
+            return metric
+
+    def counter(self, name, help_text, labels=()):
+        return self._register(Counter, name, help_text, labels)
+
+    def gauge(self, name, help_text, labels=()):
+        return self._register(Gauge, name, help_text, labels)
+
+    def histogram(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, help_text, labels, buckets=buckets)
+
+    # --- 다중 프로세스 ---
+
+    def snapshot(self):
+        """JSON 으로 쓸 수 있는 현재 프로세스의 값"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            metric.name: {
+                'type': metric.type,
+                'help': metric.help,
+                'labels': metric.label_names,
+                'buckets': getattr(metric, 'buckets', None),
+                'samples': [[list(key), value] for key, value in metric.samples().items()],
+            }
+            for metric in metrics
+        }
+
+    def flush(self, directory=None):
+        """현재 값을 공유 디렉터리의 프로세스별 파일로 쓴다 (원자적으로 교체)"""
+        directory = directory or getattr(settings, 'METRICS_DIR', None)
+        if not directory:
+            return
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f'metrics-{os.getpid()}.json')
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.metrics-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(), f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._last_flush = time.monotonic()
+
+    def maybe_flush(self):
+        """METRICS_DIR 가 있으면 METRICS_FLUSH_INTERVAL 초에 한 번만 flush (요청이 끝날 때 호출)"""
+        if not getattr(settings, 'METRICS_DIR', None):
+            return
+        if time.monotonic() - self._last_flush >= getattr(settings, 'METRICS_FLUSH_INTERVAL', 5):
+            self.flush()
+
+    def collect(self, directory=None):
+        """현재 프로세스 값과 다른 프로세스 파일을 합친 {이름: 지표 정보}"""
+        directory = directory or getattr(settings, 'METRICS_DIR', None)
+        merged = self.snapshot()
+        for data in merged.values():
+            data['samples'] = {tuple(key): value for key, value in data['samples']}
+        if not directory or not os.path.isdir(directory):
+            return merged
+
+        own_file = f'metrics-{os.getpid()}.json'
+        gauge_max_age = getattr(settings, 'METRICS_GAUGE_MAX_AGE', 300)
+        now = time.time()
+        for filename in os.listdir(directory):
+            if not filename.startswith('metrics-') or not filename.endswith('.json') or filename == own_file:
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+                fresh = now - os.path.getmtime(path) <= gauge_max_age
+            except (OSError, ValueError):
+                continue  # 쓰는 중이거나 사라진 파일
+            for name, metric in data.items():
+                if metric['type'] == 'gauge' and not fresh:
+                    continue
+                target = merged.setdefault(name, {**metric, 'samples': {}})
+                if target['type'] != metric['type']:
+                    continue
+                for key, value in metric['samples']:
+                    key = tuple(key)
+                    current = target['samples'].get(key)
+                    if current is None:
+                        target['samples'][key] = value
+                    elif isinstance(current, list):
+                        target['samples'][key] = [a + b for a, b in zip(current, value)]
+                    else:
+                        target['samples'][key] = current + value
+        return merged
+
+    def render(self, directory=None):
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        lines = []
+        for name, metric in sorted(self.collect(directory).items()):
+            lines.append(f'# HELP {name} {_escape_help(metric["help"])}')
+            lines.append(f'# TYPE {name} {metric["type"]}')
+            label_names = metric['labels']
+            for key, value in sorted(metric['samples'].items()):
+                labels = list(zip(label_names, key))
+                if metric['type'] != 'histogram':
+                    lines.append(f'{name}{_labels(labels)} {_number(value)}')
+                    continue
+                cumulative = 0
+                for bound, count in zip([*metric['buckets'], math.inf], value):
+                    cumulative += count
+                    le = '+Inf' if bound == math.inf else _number(bound)
+                    lines.append(f'{name}_bucket{_labels(labels + [("le", le)])} {_number(cumulative)}')
+                lines.append(f'{name}_sum{_labels(labels)} {_number(value[-2])}')
+                lines.append(f'{name}_count{_labels(labels)} {_number(value[-1])}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_help(text):
+    return text.replace('\\', r'\\').replace('\n', r'\n')
+
+
+def _escape_label(value):
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + '}'
+
+
+def _number(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+registry = MetricsRegistry()
+
+# --- 요청 (RequestTimingMiddleware) ---
+HTTP_REQUEST_SECONDS = registry.histogram(
+    'http_request_duration_seconds', '뷰별 요청 처리 시간 (초)', ['view', 'method', 'status']
+)
+HTTP_REQUESTS_IN_PROGRESS = registry.gauge('http_requests_in_progress', '처리 중인 요청 수')
+
+# --- 퀴즈 ---
+QUIZ_GENERATED = registry.counter('quiz_generated_total', '출제한 퀴즈(문제 세트) 수', ['quiz_type'])
+QUIZ_SUBMISSIONS = registry.counter('quiz_submissions_total', '채점을 마친 퀴즈 수', ['quiz_type', 'mode'])
+QUIZ_ANSWERS = registry.counter('quiz_answers_total', '채점한 문제 수', ['result'])
+
+# --- 학습 ---
+WORD_PROGRESS_UPDATES = registry.counter(
+    'word_progress_updates_total', '단어 학습 진도 갱신 수 (new: 처음 학습, review: 복습)', ['kind']
+)
+STUDY_TIME_HEARTBEATS = registry.counter('study_time_heartbeats_total', '학습 시간 저장 요청 수', ['result'])
+STUDY_MINUTES = registry.counter('study_minutes_total', '학습 시간 저장으로 늘어난 학습 시간 (분)')
+DAILY_GENERATION_SECONDS = registry.histogram(
+    'daily_generation_seconds', '오늘의 단어/데일리 미션을 새로 만드는 데 걸린 시간 (초)', ['kind']
+)
+
+# --- 음성 ---
+TTS_REQUESTS = registry.counter('tts_requests_total', '음성 요청 수 (hit: 저장된 파일, miss: 새로 합성)', ['result'])
+TTS_SYNTHESIS_SECONDS = registry.histogram('tts_synthesis_seconds', '음성 합성 시간 (초)')
+
+# --- 배치 작업 (apps.study.jobs) ---
+JOB_SECONDS = registry.histogram(
+    'job_duration_seconds', '배치 작업 실행 시간 (초)', ['job', 'status'],
+    buckets=(1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 1800.0, 3600.0)
+)
+JOB_ROWS = registry.counter('job_rows_total', '배치 작업이 만들거나 바꾼 행 수', ['job'])
+
+# --- 계정 ---
+LOGINS = registry.counter('logins_total', '로그인 시도 수', ['result'])
+ATTENDANCE_CHECKINS = registry.counter('attendance_checkins_total', '새로 기록된 출석 수')
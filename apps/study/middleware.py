@@ -1,7 +1,24 @@
+import contextvars
+import functools
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.contrib import messages
 
+from .metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_PROGRESS, registry
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청의 측정값 (스레드/비동기 요청마다 따로)
+_current_timing = contextvars.ContextVar('request_timing', default=None)
+
 class LevelTestMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -33,4 +50,153 @@ class LevelTestMiddleware:
 
         # 레벨 테스트가 필요한 경우 리다이렉트
         messages.info(request, '학습을 시작하기 전에 레벨 테스트를 완료해주세요.')
-        return redirect('study:level_test_start') 
\ No newline at end of file
+        return redirect('study:level_test_start') 
+
+
+class RequestTiming:
+    """한 요청의 쿼리/템플릿 시간 - DB 연결의 execute_wrapper 로 등록된다"""
+
+    def __init__(self):
+        self.queries = []  # (sql, 초)
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.template_sql_time = 0.0  # 템플릿 렌더링 중 실행된 쿼리 (지연 평가 QuerySet)
+        self.template_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.sql_time += elapsed
+            if self.template_depth:
+                self.template_sql_time += elapsed
+            self.queries.append((sql, elapsed))
+
+    def top_queries(self, limit=5):
+        """SQL 모양(파라미터 제외)별 [(sql, 횟수, 총 초)] - 총 시간 순, 같은 모양이 여러 번이면 N+1 후보"""
+        grouped = defaultdict(lambda: [0, 0.0])
+        for sql, elapsed in self.queries:
+            grouped[sql][0] += 1
+            grouped[sql][1] += elapsed
+        ranked = sorted(grouped.items(), key=lambda item: item[1][1], reverse=True)
+        return [(sql, count, total) for sql, (count, total) in ranked[:limit]]
+
+
+def _install_template_timer():
+    """Django 템플릿 백엔드의 render 를 감싸 렌더링 시간을 현재 요청에 더한다 (한 번만 설치)
+
+    render_to_string/render 가 부르는 최상위 렌더링만 재고, include 등 중첩 렌더링은 포함된다.
+    측정 중인 요청이 없으면 원래 render 를 그대로 호출한다.
+    """
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, 'timed', False):
+        return
+    original = Template.render
+
+    @functools.wraps(original)
+    def render(self, context=None, request=None):
+        timing = _current_timing.get()
+        if timing is None:
+            return original(self, context, request)
+        timing.template_depth += 1
+        start = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            timing.template_depth -= 1
+            if not timing.template_depth:
+                timing.template_time += time.perf_counter() - start
+
+    render.timed = True
+    Template.render = render
+
+
+class RequestTimingMiddleware:
+    """요청별 쿼리 수/SQL 시간/템플릿 시간/전체 시간을 Server-Timing 헤더로 내보낸다
+
+    모든 요청의 처리 시간은 뷰 이름별 http_request_duration_seconds 지표에도 기록한다.
+
+    REQUEST_TIMING_SAMPLE_RATE 비율의 요청만 쿼리와 템플릿을 측정하고, 나머지는 전체
+    시간만 잰다. REQUEST_TIMING_SLOW_MS 를 넘는 요청은 뷰 이름과 함께 로그로 남기고,
+    측정한 요청이면 오래 걸린/중복된 쿼리 상위 목록도 함께 남긴다.
+    MIDDLEWARE 의 맨 앞에 두어야 다른 미들웨어 시간까지 전체 시간에 들어간다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'REQUEST_TIMING_SAMPLE_RATE', 1.0)
+        self.slow_ms = getattr(settings, 'REQUEST_TIMING_SLOW_MS', 500)
+        self.header = getattr(settings, 'REQUEST_TIMING_HEADER', True)
+        _install_template_timer()
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        try:
+            if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+                response = self.get_response(request)
+                timing = None
+            else:
+                timing = RequestTiming()
+                token = _current_timing.set(timing)
+                try:
+                    with ExitStack() as stack:
+                        for alias in connections:
+                            stack.enter_context(connections[alias].execute_wrapper(timing))
+                        response = self.get_response(request)
+                finally:
+                    _current_timing.reset(token)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+        self._finish(request, response, start, timing)
+        return response
+
+    def _finish(self, request, response, start, timing):
+        elapsed = time.perf_counter() - start
+        total_ms = elapsed * 1000
+        match = getattr(request, 'resolver_match', None)
+        # URL 이 아닌 뷰 이름으로 묶는다 (404 경로가 라벨을 늘리지 않도록)
+        HTTP_REQUEST_SECONDS.observe(
+            elapsed, view=match.view_name if match else 'unmatched', method=request.method,
+            status=f'{response.status_code // 100}xx'
+        )
+        registry.maybe_flush()
+        if self.header:
+            response['Server-Timing'] = self._server_timing(total_ms, timing)
+        if total_ms >= self.slow_ms:
+            self._log_slow(request, response, total_ms, timing)
+
+    @staticmethod
+    def _server_timing(total_ms, timing):
+        metrics = []
+        if timing is not None:
+            metrics.append(f'db;dur={timing.sql_time * 1000:.1f};desc="{len(timing.queries)} queries"')
+            template_ms = (timing.template_time - timing.template_sql_time) * 1000
+            metrics.append(f'tpl;dur={template_ms:.1f}')
+        metrics.append(f'total;dur={total_ms:.1f}')
+        return ', '.join(metrics)
+
+    @staticmethod
+    def _log_slow(request, response, total_ms, timing):
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else '-'
+        if timing is None:
+            logger.warning(
+                '느린 요청 %s %s (%s) %d %.1fms', request.method, request.path, view_name,
+                response.status_code, total_ms
+            )
+            return
+
+        lines = [
+            f'  {count}회 {total * 1000:.1f}ms{" (중복)" if count > 1 else ""}: {sql[:300]}'
+            for sql, count, total in timing.top_queries()
+        ]
+        logger.warning(
+            '느린 요청 %s %s (%s) %d %.1fms, 쿼리 %d개 %.1fms, 템플릿 %.1fms\n%s',
+            request.method, request.path, view_name, response.status_code, total_ms,
+            len(timing.queries), timing.sql_time * 1000,
+            (timing.template_time - timing.template_sql_time) * 1000, '\n'.join(lines)
+        )
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.2 on 2026-10-18 02:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0012_rename_daily_study_time_studysession_daily_study_minutes_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStudyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('words_studied', models.IntegerField(default=0)),
+                ('mastered_words', models.IntegerField(default=0)),
+                ('proficiency_sum', models.IntegerField(default=0)),
+                ('study_minutes', models.FloatField(default=0)),
+                ('quiz_questions', models.IntegerField(default=0)),
+                ('quiz_correct', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_study_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-date'],
+                'unique_together': {('user', 'date')},
+            },
+        ),
+    ]
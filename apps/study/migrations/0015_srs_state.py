@@ -0,0 +1,45 @@
+# Generated by Django 5.0.2 on 2026-10-18 02:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0014_userstreak'),
+        ('vocabulary', '0009_word_english_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studyprogress',
+            name='due_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='다음 복습 시각'),
+        ),
+        migrations.AddField(
+            model_name='studyprogress',
+            name='ease_factor',
+            field=models.FloatField(default=2.5, verbose_name='난이도 계수'),
+        ),
+        migrations.AddField(
+            model_name='studyprogress',
+            name='interval_days',
+            field=models.IntegerField(default=0, verbose_name='복습 간격(일)'),
+        ),
+        migrations.AddField(
+            model_name='studyprogress',
+            name='lapses',
+            field=models.IntegerField(default=0, verbose_name='망각 횟수'),
+        ),
+        migrations.AddField(
+            model_name='studyprogress',
+            name='repetitions',
+            field=models.IntegerField(default=0, verbose_name='연속 성공 횟수'),
+        ),
+        migrations.AddIndex(
+            model_name='studyprogress',
+            index=models.Index(fields=['user', 'due_at'], name='study_progress_due_idx'),
+        ),
+    ]
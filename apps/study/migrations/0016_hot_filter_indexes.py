@@ -0,0 +1,36 @@
+# Generated by Django 5.0.2 on 2026-10-18 02:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0015_srs_state'),
+        ('vocabulary', '0010_hot_filter_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reviewschedule',
+            index=models.Index(fields=['user', 'status', 'scheduled_date'], name='review_schedule_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studynotification',
+            index=models.Index(fields=['user', 'created_at'], name='study_notif_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studyprogress',
+            index=models.Index(fields=['user', 'review_count', 'last_reviewed'], name='study_progress_reviewed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studysession',
+            index=models.Index(fields=['user', 'end_time'], name='study_session_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wordstudyhistory',
+            index=models.Index(fields=['user', 'created_at'], name='word_history_user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.2 on 2026-10-18 02:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0016_hot_filter_indexes'),
+        ('vocabulary', '0010_hot_filter_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyWordAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('position', models.PositiveSmallIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_word_assignments', to=settings.AUTH_USER_MODEL)),
+                ('word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_assignments', to='vocabulary.word')),
+            ],
+            options={
+                'ordering': ['date', 'position'],
+                'indexes': [models.Index(fields=['date'], name='dailyword_date_idx')],
+                'unique_together': {('user', 'date', 'position')},
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.0.2 on 2026-10-18 02:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0017_dailywordassignment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dailymission',
+            name='choices',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='dailymission',
+            name='date',
+            field=models.DateField(default=django.utils.timezone.localdate),
+        ),
+        migrations.AlterField(
+            model_name='studynotification',
+            name='notification_type',
+            field=models.CharField(choices=[('goal', '학습 목표 달성'), ('streak', '연속 학습 달성'), ('mastery', '단어 완벽 암기'), ('level', '레벨 달성'), ('review', '복습 알림'), ('reminder', '학습 독려')], max_length=20),
+        ),
+        migrations.CreateModel(
+            name='JobRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50)),
+                ('scheduled_for', models.DateTimeField(blank=True, null=True)),
+                ('target_date', models.DateField()),
+                ('status', models.CharField(choices=[('running', '실행 중'), ('success', '성공'), ('failed', '실패')], default='running', max_length=10)),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('duration_seconds', models.FloatField(default=0)),
+                ('rows', models.JSONField(blank=True, default=dict)),
+                ('error', models.TextField(blank=True)),
+            ],
+            options={
+                'ordering': ['-started_at'],
+                'indexes': [models.Index(fields=['name', 'started_at'], name='jobrun_name_started_idx')],
+                'unique_together': {('name', 'scheduled_for')},
+            },
+        ),
+    ]
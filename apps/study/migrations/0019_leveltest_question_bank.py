@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-18 02:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0018_batch_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='leveltest',
+            name='is_question_bank',
+            field=models.BooleanField(default=False),
+        ),
+    ]
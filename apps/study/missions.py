@@ -0,0 +1,98 @@
+"""데일리 미션 일괄 생성
+
+북마크한 단어가 MIN_BOOKMARKS 개 이상인 활성 사용자마다 다음 날 미션(북마크 중 무작위
+MISSION_SIZE 단어)과 단어별 보기(정답 + 오답 3개, 섞인 순서)를 미리 만들어 둔다.
+미션 화면은 저장된 보기를 읽기만 하고, 미션이 없는 사용자(배치 이후 북마크한 경우 등)는
+처음 열 때 그 사용자 미션만 만든다.
+"""
+import random
+from collections import defaultdict
+
+from django.db import transaction
+
+from apps.quiz.distractors import distractor_pool
+from apps.vocabulary.models import Word, WordBookmark
+
+from .daily_sets import active_users, user_id_chunks
+from .models import DailyMission
+
+MISSION_SIZE = 5
+MIN_BOOKMARKS = 5
+DISTRACTORS = 3
+
+
+def mission_rng(user_id, day):
+    return random.Random(f'daily-mission:{day.isoformat()}:{user_id}')
+
+
+def make_choices(word, rng):
+    """word 의 보기 [[id, 뜻], ...] - 정답 포함, 섞인 순서"""
+    entries = distractor_pool.sample_entries(word, DISTRACTORS, 'korean', rng=rng)
+    choices = [[entry.id, entry.korean] for entry in entries] + [[word.id, word.korean]]
+    rng.shuffle(choices)
+    return choices
+
+
+def build_daily_missions(day, users=None, chunk_size=500):
+    """day 의 미션이 없는 사용자(기본: 활성 사용자)에게 미션을 만들고 {항목: 행 수} 반환"""
+    counts = defaultdict(int)
+    for chunk in user_id_chunks(active_users() if users is None else users, chunk_size):
+        with transaction.atomic():
+            for name, count in _build_chunk(chunk, day).items():
+                counts[name] += count
+    return dict(counts)
+
+
+def _build_chunk(user_ids, day):
+    done = set(DailyMission.objects.filter(user_id__in=user_ids, date=day).values_list('user_id', flat=True))
+    bookmarks = defaultdict(list)
+    rows = WordBookmark.objects.filter(user_id__in=[pk for pk in user_ids if pk not in done])
+    for user_id, word_id in rows.order_by('user_id', 'word_id').values_list('user_id', 'word_id'):
+        bookmarks[user_id].append(word_id)
+
+    picked = {}
+    for user_id, word_ids in bookmarks.items():
+        if len(word_ids) >= MIN_BOOKMARKS:
+            picked[user_id] = mission_rng(user_id, day).sample(word_ids, MISSION_SIZE)
+    if not picked:
+        return {}
+
+    words = Word.objects.only('id', 'korean', 'difficulty', 'part_of_speech').in_bulk(
+        {word_id for word_ids in picked.values() for word_id in word_ids}
+    )
+    missions = []
+    for user_id, word_ids in picked.items():
+        rng = mission_rng(user_id, day)
+        choices = {str(word_id): make_choices(words[word_id], rng) for word_id in word_ids if word_id in words}
+        missions.append(DailyMission(user_id=user_id, date=day, choices=choices))
+    # 같은 사용자의 미션을 화면에서 동시에 만든 경우 먼저 들어간 미션을 남긴다
+    DailyMission.objects.bulk_create(missions, ignore_conflicts=True)
+
+    # MySQL 의 bulk_create 는 pk 를 돌려주지 않으므로 (user, date) 로 다시 조회
+    # - 화면에서 먼저 만든 미션은 보기가 이번에 만든 것과 같을 때만 단어를 연결하고,
+    #   그 화면이 같은 단어를 동시에 연결해도 실패하지 않도록 중복 연결은 무시한다
+    built = {mission.user_id: mission.choices for mission in missions}
+    created = DailyMission.objects.filter(user_id__in=picked, date=day, words__isnull=True)
+    through = DailyMission.words.through
+    links = [
+        through(dailymission_id=mission_id, word_id=word_id)
+        for user_id, mission_id, choices in created.values_list('user_id', 'id', 'choices')
+        if choices == built[user_id]
+        for word_id in picked[user_id] if word_id in words
+    ]
+    through.objects.bulk_create(links, ignore_conflicts=True)
+    return {'DailyMission': len(missions), 'DailyMission.words': len(links)}
+
+
+def mission_choices(mission, words):
+    """화면용 [{'word': 단어, 'choices': [{'id', 'korean'}, ...]}] - 저장된 보기가 없으면 새로 뽑는다"""
+    word_choices = []
+    for word in words:
+        stored = mission.choices.get(str(word.id))
+        if stored is None:
+            stored = make_choices(word, random)
+        word_choices.append({
+            'word': word,
+            'choices': [{'id': choice_id, 'korean': korean} for choice_id, korean in stored],
+        })
+    return word_choices
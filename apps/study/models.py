@@ -98,6 +98,10 @@ class StudySession(models.Model):
 
     class Meta:
         unique_together = ['user', 'start_time']
+        indexes = [
+            # 진행 중인 세션 조회 (end_time IS NULL)
+            models.Index(fields=['user', 'end_time'], name='study_session_open_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}의 학습 세션 ({self.start_time})"
@@ -130,11 +134,23 @@ class StudyProgress(models.Model):
     last_reviewed = models.DateTimeField(default=timezone.now)
     next_review_date = models.DateField(null=True, blank=True)
     is_bookmarked = models.BooleanField(default=False)
+    # 간격 반복(SRS) 상태 - apps/study/srs.py 의 스케줄러가 갱신
+    ease_factor = models.FloatField('난이도 계수', default=2.5)
+    interval_days = models.IntegerField('복습 간격(일)', default=0)
+    repetitions = models.IntegerField('연속 성공 횟수', default=0)
+    lapses = models.IntegerField('망각 횟수', default=0)
+    due_at = models.DateTimeField('다음 복습 시각', null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ['user', 'word']
+        indexes = [
+            # 사용자별 복습 대기열 (due_at <= 현재 시각인 행만 순서대로 읽음)
+            models.Index(fields=['user', 'due_at'], name='study_progress_due_idx'),
+            # 학습한 단어 수/목록 (review_count > 0), 최근 학습 순서
+            models.Index(fields=['user', 'review_count', 'last_reviewed'], name='study_progress_reviewed_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}의 {self.word.english} 학습 진도"
@@ -165,6 +181,9 @@ class ReviewSchedule(models.Model):
 
     class Meta:
         ordering = ['scheduled_date']
+        indexes = [
+            models.Index(fields=['user', 'status', 'scheduled_date'], name='review_schedule_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}의 {self.word.english} 복습 일정"
@@ -233,6 +252,9 @@ class WordStudyHistory(models.Model):
         ordering = ['-created_at']
         verbose_name = '단어 학습 이력'
         verbose_name_plural = '단어 학습 이력'
+        indexes = [
+            models.Index(fields=['user', 'created_at'], name='word_history_user_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}의 {self.word.english} 학습 기록"
@@ -248,6 +270,8 @@ class LevelTest(models.Model):
     title = models.CharField(max_length=100)
     description = models.TextField()
     difficulty = models.CharField(max_length=20, choices=DIFFICULTY_CHOICES)
+    # 난이도별 문제 은행 (사용자 테스트는 여기서 문제를 복사해 만든다, apps.study.level_test 참고)
+    is_question_bank = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -329,6 +353,8 @@ class StudyNotification(models.Model):
         ('streak', '연속 학습 달성'),
         ('mastery', '단어 완벽 암기'),
         ('level', '레벨 달성'),
+        ('review', '복습 알림'),
+        ('reminder', '학습 독려'),
     )
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='study_notifications')
@@ -340,6 +366,10 @@ class StudyNotification(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # 사용자별 알림 최신순 목록
+            models.Index(fields=['user', 'created_at'], name='study_notif_user_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}의 {self.notification_type} 알림"
@@ -379,7 +409,7 @@ class DailyMission(models.Model):
         on_delete=models.CASCADE,
         related_name='daily_missions'
     )
-    date = models.DateField(auto_now_add=True)
+    date = models.DateField(default=timezone.localdate)  # 배치 작업이 다음 날 미션을 미리 만들 수 있도록 직접 지정
     is_completed = models.BooleanField(default=False)
     score = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -388,6 +418,8 @@ class DailyMission(models.Model):
         Word,
         related_name='daily_missions'
     )
+    # 단어별 보기 {word_id: [[id, 뜻], ...]} (정답 포함, 섞인 순서) - 비어 있으면 화면에서 만든다
+    choices = models.JSONField(default=dict, blank=True)
 
     class Meta:
         ordering = ['-date']
@@ -405,3 +437,130 @@ class DailyMissionModalShown(models.Model):
 
     class Meta:
         unique_together = ('user', 'date')
+
+class DailyStudyStats(models.Model):
+    """사용자별 일일 학습 통계 집계
+
+    대시보드가 StudyProgress 전체를 매번 세지 않도록 학습/퀴즈/학습 시간
+    이벤트가 발생할 때 해당 날짜 행만 증감한다. (apps.study.stats 참고)
+    words_studied/mastered_words/proficiency_sum 은 마지막 학습일(last_reviewed)
+    기준이므로 단어를 다른 날 다시 학습하면 이전 날짜에서 빠지고 새 날짜로 옮겨진다.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='daily_study_stats'
+    )
+    date = models.DateField()
+    words_studied = models.IntegerField(default=0)  # 이 날 마지막으로 학습한 단어 수
+    mastered_words = models.IntegerField(default=0)  # 그 중 숙련도 5인 단어 수
+    proficiency_sum = models.IntegerField(default=0)  # 평균 숙련도 계산용 합계
+    study_minutes = models.FloatField(default=0)  # 이 날 시작한 세션의 학습 시간 (분)
+    quiz_questions = models.IntegerField(default=0)  # 푼 퀴즈 문제 수
+    quiz_correct = models.IntegerField(default=0)  # 맞힌 퀴즈 문제 수
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('user', 'date')
+        ordering = ['-date']
+
+    def __str__(self):
+        return f"{self.user.username}의 {self.date} 학습 통계"
+
+    @property
+    def average_proficiency(self):
+        return round(self.proficiency_sum / self.words_studied, 1) if self.words_studied else 0
+
+    @property
+    def quiz_accuracy(self):
+        return round(self.quiz_correct / self.quiz_questions * 100, 1) if self.quiz_questions else 0
+
+class UserStreak(models.Model):
+    """사용자별 연속 학습일 (학습 이벤트마다 갱신, apps.study.streaks 참고)"""
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='streak'
+    )
+    current_streak = models.IntegerField(default=0)  # last_active_date 에서 끝나는 연속 학습일
+    longest_streak = models.IntegerField(default=0)
+    last_active_date = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user.username}의 연속 학습 {self.current_streak}일"
+
+    def register_day(self, day):
+        """day 에 학습했음을 반영하고 값이 바뀌었는지 반환"""
+        last = self.last_active_date
+        if last is not None and day <= last:
+            return False
+        if last is not None and day - last == timedelta(days=1):
+            self.current_streak += 1
+        else:
+            self.current_streak = 1
+        self.last_active_date = day
+        self.longest_streak = max(self.longest_streak, self.current_streak)
+        return True
+
+    def streak_on(self, day):
+        """day 까지 이어진 연속 학습일 (day 에 학습하지 않았으면 0)"""
+        return self.current_streak if self.last_active_date == day else 0
+
+
+class DailyWordAssignment(models.Model):
+    """사용자별 오늘의 단어 목록 (build_daily_sets 명령이 미리 만들어 둠, apps.study.daily_sets 참고)"""
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='daily_word_assignments'
+    )
+    date = models.DateField()
+    word = models.ForeignKey(Word, on_delete=models.CASCADE, related_name='daily_assignments')
+    position = models.PositiveSmallIntegerField()  # 목록 안에서의 순서
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['date', 'position']
+        unique_together = ('user', 'date', 'position')
+        indexes = [
+            # 오래된 목록 정리 (날짜 범위 삭제)
+            models.Index(fields=['date'], name='dailyword_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username}의 {self.date} 오늘의 단어 {self.position + 1}"
+
+
+class JobRun(models.Model):
+    """배치 작업 실행 기록 (apps.study.jobs 참고)
+
+    예약 실행은 (name, scheduled_for) 가 유일해 스케줄러가 여러 개 떠 있어도 한 번만 실행된다.
+    직접 실행(run_jobs --job)은 scheduled_for 가 비어 있다.
+    """
+    STATUS_CHOICES = (
+        ('running', '실행 중'),
+        ('success', '성공'),
+        ('failed', '실패'),
+    )
+
+    name = models.CharField(max_length=50)
+    scheduled_for = models.DateTimeField(null=True, blank=True)
+    target_date = models.DateField()  # 작업이 만든 데이터의 날짜
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='running')
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_seconds = models.FloatField(default=0)
+    rows = models.JSONField(default=dict, blank=True)  # {항목: 처리한 행 수}
+    error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ['-started_at']
+        unique_together = ('name', 'scheduled_for')
+        indexes = [
+            # 작업별 최근 실행
+            models.Index(fields=['name', 'started_at'], name='jobrun_name_started_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.target_date}, {self.get_status_display()})"
@@ -0,0 +1,55 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.accounts.models import Attendance
+from apps.quiz.models import QuizAttempt
+from apps.vocabulary.models import Word
+from .cache import invalidate_user
+from .models import StudyProgress, StudySession, Friendship
+from .stats import local_date, record_quiz_answers
+from .word_of_the_day import word_of_the_day
+
+
+@receiver(post_save, sender=QuizAttempt)
+def update_daily_quiz_stats(sender, instance, created, **kwargs):
+    """완료된 퀴즈 응시 기록이 생기면 일일 통계에 문제 수/정답 수를 더함"""
+    if created and instance.completed_at:
+        record_quiz_answers(
+            instance.user,
+            local_date(instance.completed_at),
+            instance.total_questions,
+            instance.correct_answers
+        )
+
+
+@receiver(post_save, sender=StudyProgress)
+@receiver(post_delete, sender=StudyProgress)
+@receiver(post_save, sender=StudySession)
+@receiver(post_delete, sender=StudySession)
+@receiver(post_save, sender=QuizAttempt)
+@receiver(post_delete, sender=QuizAttempt)
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """학습/퀴즈/출석 기록이 바뀌면 해당 사용자의 캐시 조각을 무효화"""
+    invalidate_user(instance.user_id)
+
+
+@receiver(post_save, sender=Friendship)
+@receiver(post_delete, sender=Friendship)
+def invalidate_friend_cache(sender, instance, **kwargs):
+    """친구 관계가 바뀌면 양쪽 사용자의 캐시 조각을 무효화"""
+    invalidate_user(instance.user1_id, instance.user2_id)
+
+
+@receiver(post_save, sender=Word)
+def refresh_word_of_the_day(sender, instance, **kwargs):
+    """단어가 추가/수정되면 id 배열을 다시 만들고, 오늘의 단어가 수정되었으면 다시 읽음"""
+    word_of_the_day.invalidate()
+    word_of_the_day.forget(instance.pk)
+
+
+@receiver(post_delete, sender=Word)
+def remove_word_of_the_day(sender, instance, **kwargs):
+    """단어가 삭제되면 id 배열을 다시 만들고, 오늘의 단어였으면 다시 고름"""
+    word_of_the_day.invalidate()
+    word_of_the_day.forget(instance.pk, deleted=True)
@@ -0,0 +1,153 @@
+"""간격 반복(SRS) 복습 스케줄러
+
+단어별 복습 상태(난이도 계수, 간격, 연속 성공 횟수, 망각 횟수, 다음 복습 시각)는
+StudyProgress 한 행에 저장되고, ``(user, due_at)`` 인덱스가 사용자별 복습
+대기열 역할을 한다. 복습할 때마다 일정 행을 새로 만들지 않는다.
+
+스케줄러는 ``settings.SRS_SCHEDULER`` 경로로 바꿀 수 있으며
+``schedule(card, quality, now) -> SRSCard`` 만 구현하면 된다.
+"""
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import StudyProgress
+
+MIN_EASE = 1.3
+DEFAULT_EASE = 2.5
+
+# 스케줄러가 읽고 쓰는 카드 상태
+SRSCard = namedtuple('SRSCard', ['ease_factor', 'interval_days', 'repetitions', 'lapses', 'due_at'])
+
+SRS_FIELDS = ['ease_factor', 'interval_days', 'repetitions', 'lapses', 'due_at', 'next_review_date']
+
+# 이전 고정 간격 (숙련도 -> 일) - SRS 상태가 없는 진도의 초기 간격으로 사용
+LEGACY_INTERVALS = {1: 1, 2: 1, 3: 3, 4: 7, 5: 14}
+
+
+class SM2Scheduler:
+    """SuperMemo SM-2
+
+    quality 는 0~5 (3 미만이면 잊은 것으로 보고 간격을 1일로 되돌린다).
+    화면의 숙련도(1~5)를 그대로 quality 로 사용한다.
+    """
+
+    def schedule(self, card, quality, now):
+        quality = max(0, min(5, int(quality)))
+        ease = card.ease_factor + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+        ease = max(MIN_EASE, ease)
+
+        if quality < 3:
+            repetitions = 0
+            interval = 1
+            lapses = card.lapses + 1
+        else:
+            repetitions = card.repetitions + 1
+            lapses = card.lapses
+            if repetitions == 1:
+                interval = 1
+            elif repetitions == 2:
+                interval = 6
+            else:
+                interval = max(1, round(card.interval_days * ease))
+
+        return SRSCard(ease, interval, repetitions, lapses, now + timedelta(days=interval))
+
+
+def get_scheduler(path=None):
+    path = path or getattr(settings, 'SRS_SCHEDULER', 'apps.study.srs.SM2Scheduler')
+    return import_string(path)()
+
+
+def card_of(progress):
+    return SRSCard(
+        progress.ease_factor, progress.interval_days, progress.repetitions,
+        progress.lapses, progress.due_at
+    )
+
+
+def apply_review(progress, quality, now=None, scheduler=None):
+    """복습 결과를 StudyProgress 의 SRS 필드에 반영 (저장은 호출한 쪽에서)"""
+    now = now or timezone.now()
+    card = (scheduler or get_scheduler()).schedule(card_of(progress), quality, now)
+    progress.ease_factor = card.ease_factor
+    progress.interval_days = card.interval_days
+    progress.repetitions = card.repetitions
+    progress.lapses = card.lapses
+    progress.due_at = card.due_at
+    # 기존 화면/알림에서 쓰는 날짜 필드도 맞춰 둔다
+    progress.next_review_date = timezone.localtime(card.due_at).date()
+    return progress
+
+
+def due_queryset(user, now=None):
+    """지금 복습할 카드 (user, due_at 인덱스 범위 조회)"""
+    now = now or timezone.now()
+    return StudyProgress.objects.filter(user=user, due_at__lte=now).order_by('due_at')
+
+
+def next_due(user, limit=20, now=None):
+    """복습 시각이 지난 카드를 오래된 순서로 최대 limit 개"""
+    return list(due_queryset(user, now).select_related('word')[:limit])
+
+
+def due_count(user, now=None):
+    return due_queryset(user, now).count()
+
+
+def upcoming(user, limit=50):
+    """복습 예정인 카드 전체 (다음 복습 시각 순서)"""
+    return list(
+        StudyProgress.objects.filter(user=user, due_at__isnull=False)
+        .order_by('due_at').select_related('word')[:limit]
+    )
+
+
+def start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def backfill_state(progress, first_pending=None):
+    """SRS 상태가 없는(due_at 이 빈) 학습 진도에 숙련도 기준 초기 상태를 채운다 (저장은 호출한 쪽에서)
+
+    first_pending 은 예전 ReviewSchedule 의 가장 이른 대기 날짜 (있으면 next_review_date 다음으로 사용).
+    """
+    interval = LEGACY_INTERVALS.get(progress.proficiency, 1)
+    progress.ease_factor = DEFAULT_EASE
+    progress.interval_days = interval
+    progress.repetitions = progress.review_count if progress.proficiency >= 3 else 0
+    progress.lapses = 0
+    if progress.next_review_date:
+        due_day = progress.next_review_date
+    elif first_pending:
+        due_day = first_pending
+    else:
+        due_day = timezone.localtime(progress.last_reviewed).date() + timedelta(days=interval)
+    progress.next_review_date = due_day
+    progress.due_at = start_of_day(due_day)
+    return progress
+
+
+def refresh_due_queues(users=None, batch_size=1000):
+    """학습했지만 SRS 상태가 없는 진도를 복습 대기열에 넣고 채운 행 수를 반환
+
+    (SRS 를 거치지 않고 review_count 만 올리는 학습 완료 처리 등으로 생긴 행)
+    """
+    progresses = StudyProgress.objects.filter(due_at__isnull=True, review_count__gt=0).only(
+        'id', 'user_id', 'proficiency', 'review_count', 'last_reviewed', 'next_review_date'
+    )
+    if users is not None:
+        progresses = progresses.filter(user__in=users)
+    changed = []
+    total = 0
+    for progress in progresses.iterator(chunk_size=batch_size):
+        changed.append(backfill_state(progress))
+        if len(changed) >= batch_size:
+            StudyProgress.objects.bulk_update(changed, SRS_FIELDS)
+            total += len(changed)
+            changed = []
+    StudyProgress.objects.bulk_update(changed, SRS_FIELDS)
+    return total + len(changed)
@@ -0,0 +1,182 @@
+"""일일 학습 통계 집계 (DailyStudyStats)
+
+학습/퀴즈/학습 시간 이벤트가 발생할 때 해당 날짜 행을 증감하고,
+대시보드는 날짜 수만큼의 집계 행만 읽는다. 같은 이벤트로 연속 학습일도 갱신한다.
+"""
+from collections import Counter, defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .cache import invalidate_user
+from .models import DailyStudyStats, StudyProgress, StudySession
+from .streaks import record_study_day
+
+STAT_FIELDS = (
+    'words_studied', 'mastered_words', 'proficiency_sum',
+    'study_minutes', 'quiz_questions', 'quiz_correct',
+)
+
+TOTAL_MINUTES_TIMEOUT = 60 * 60 * 24  # 초
+
+
+def local_date(value):
+    return timezone.localtime(value).date()
+
+
+def _apply(user, day, deltas):
+    """user/day 집계 행의 필드를 deltas 만큼 증감 (행이 없으면 만든다)"""
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+    stats, _ = DailyStudyStats.objects.get_or_create(user=user, date=day)
+    DailyStudyStats.objects.filter(pk=stats.pk).update(
+        updated_at=timezone.now(),
+        **{field: F(field) + value for field, value in deltas.items()}
+    )
+    invalidate_user(user.pk)
+
+
+def progress_snapshot(progress):
+    """StudyProgress 가 집계에 기여하는 값 (마지막 학습일, 숙련도) - 학습 전이면 None
+
+    변경 전 상태는 저장하기 전에 이 함수로 떠 두었다가 record_progress 에 넘긴다.
+    """
+    if progress is None or progress.pk is None or progress.review_count <= 0:
+        return None
+    return local_date(progress.last_reviewed), progress.proficiency
+
+
+def record_progress(user, before, progress):
+    """단어 학습 진도 변경분을 일일 통계에 반영
+
+    before: 저장 전 progress_snapshot() 값, progress: 저장된 StudyProgress
+    """
+    after = progress_snapshot(progress)
+    if before == after:
+        return
+
+    deltas = defaultdict(Counter)
+    for snapshot, sign in ((before, -1), (after, 1)):
+        if snapshot is None:
+            continue
+        day, proficiency = snapshot
+        deltas[day]['words_studied'] += sign
+        deltas[day]['mastered_words'] += sign if proficiency == 5 else 0
+        deltas[day]['proficiency_sum'] += sign * proficiency
+
+    with transaction.atomic():
+        for day, day_deltas in deltas.items():
+            _apply(user, day, day_deltas)
+    if after is not None:
+        record_study_day(user, after[0])
+
+
+def _total_minutes_key(user_id):
+    return f'study_minutes_total:{user_id}'
+
+
+def get_total_study_minutes(user):
+    """전체 학습 시간 (분) - 캐시의 누적 카운터, 없으면 일일 통계 합계로 채운다
+
+    카운터는 record_study_minutes 가 증감분만큼 늘리므로 하트비트마다 합계를 구하지 않는다.
+    memcached/redis 의 incr 가 정수만 받으므로 1/100 분 단위 정수로 저장한다.
+    """
+    key = _total_minutes_key(user.pk)
+    hundredths = cache.get(key)
+    if hundredths is None:
+        hundredths = round(get_total_stats(user)['study_minutes'] * 100)
+        cache.add(key, hundredths, TOTAL_MINUTES_TIMEOUT)
+    return hundredths / 100
+
+
+def record_study_minutes(user, session, minutes_delta):
+    """세션 학습 시간 증감분을 세션 시작일 통계에 반영"""
+    day = local_date(session.start_time)
+    _apply(user, day, {'study_minutes': minutes_delta})
+    if minutes_delta:
+        try:
+            cache.incr(_total_minutes_key(user.pk), round(minutes_delta * 100))
+        except ValueError:
+            pass  # 아직 계산한 적 없음 - 다음 조회 때 일일 통계로 채운다
+    if minutes_delta > 0:
+        record_study_day(user, day)
+
+
+def record_quiz_answers(user, day, total, correct):
+    """퀴즈 응시 결과를 일일 통계에 반영"""
+    _apply(user, day, {'quiz_questions': total, 'quiz_correct': correct})
+    if total > 0:
+        record_study_day(user, day)
+
+
+def get_daily_stats(user, start, end):
+    """start~end 날짜의 집계 행을 {date: DailyStudyStats} 로 반환 (없는 날짜는 빠짐)"""
+    rows = DailyStudyStats.objects.filter(user=user, date__range=(start, end))
+    return {row.date: row for row in rows}
+
+
+def get_today_stats(user, today=None):
+    """오늘 집계 행 (없으면 저장하지 않은 빈 행)"""
+    today = today or timezone.localtime().date()
+    stats = DailyStudyStats.objects.filter(user=user, date=today).first()
+    return stats or DailyStudyStats(user=user, date=today)
+
+
+def get_total_stats(user):
+    """전체 기간 누적 값 {필드: 합계}"""
+    totals = DailyStudyStats.objects.filter(user=user).aggregate(
+        **{field: Sum(field) for field in STAT_FIELDS}
+    )
+    return {field: totals[field] or 0 for field in STAT_FIELDS}
+
+
+def rebuild_daily_stats(user):
+    """원본 테이블을 날짜별로 묶어 user 의 집계 행을 다시 만든다 (쿼리 3번)"""
+    from apps.quiz.models import QuizAttempt
+
+    rows = defaultdict(Counter)
+
+    progress_rows = StudyProgress.objects.filter(user=user, review_count__gt=0).annotate(
+        day=TruncDate('last_reviewed')
+    ).values('day').annotate(
+        words=Count('id'),
+        mastered=Count('id', filter=Q(proficiency=5)),
+        proficiency=Sum('proficiency'),
+    )
+    for row in progress_rows:
+        rows[row['day']].update(
+            words_studied=row['words'],
+            mastered_words=row['mastered'],
+            proficiency_sum=row['proficiency'] or 0,
+        )
+
+    session_rows = StudySession.objects.filter(user=user).annotate(
+        day=TruncDate('start_time')
+    ).values('day').annotate(minutes=Sum('study_minutes'))
+    for row in session_rows:
+        rows[row['day']]['study_minutes'] += row['minutes'] or 0
+
+    quiz_rows = QuizAttempt.objects.filter(user=user, completed_at__isnull=False).annotate(
+        day=TruncDate('completed_at')
+    ).values('day').annotate(
+        questions=Sum('total_questions'),
+        correct=Sum('correct_answers'),
+    )
+    for row in quiz_rows:
+        rows[row['day']].update(
+            quiz_questions=row['questions'] or 0,
+            quiz_correct=row['correct'] or 0,
+        )
+
+    with transaction.atomic():
+        DailyStudyStats.objects.filter(user=user).delete()
+        DailyStudyStats.objects.bulk_create([
+            DailyStudyStats(user=user, date=day, **{field: values[field] for field in STAT_FIELDS})
+            for day, values in rows.items()
+        ])
+    cache.delete(_total_minutes_key(user.pk))
+    return len(rows)
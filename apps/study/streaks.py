@@ -0,0 +1,87 @@
+"""연속 학습일 (UserStreak)
+
+학습 이벤트가 생길 때 그날을 한 번만 반영하므로, 화면에서 연속 학습일을
+구할 때 날짜를 하루씩 거슬러 올라가며 조회할 필요가 없다.
+"""
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import DailyStudyStats, UserStreak
+
+
+def record_study_day(user, day=None):
+    """user 가 day(기본: 오늘)에 학습했음을 연속 학습일에 반영"""
+    day = day or timezone.localtime().date()
+    streak = UserStreak.objects.filter(user=user).only('last_active_date').first()
+    if streak is not None and streak.last_active_date is not None and streak.last_active_date >= day:
+        return  # 이미 반영된 날 - 추가 쓰기 없음
+
+    with transaction.atomic():
+        streak, _ = UserStreak.objects.select_for_update().get_or_create(user=user)
+        if streak.register_day(day):
+            streak.save()
+
+
+def get_streak(user, day=None):
+    """day(기본: 오늘)까지 이어진 연속 학습일 (쿼리 1번)"""
+    day = day or timezone.localtime().date()
+    streak = UserStreak.objects.filter(user=user).first()
+    return streak.streak_on(day) if streak else 0
+
+
+def compute_streak(days):
+    """정렬된 학습 날짜 목록으로 (현재 연속일, 최장 연속일, 마지막 학습일) 계산"""
+    current = longest = 0
+    last = None
+    for day in days:
+        if last is not None and day - last == timedelta(days=1):
+            current += 1
+        elif day != last:
+            current = 1
+        longest = max(longest, current)
+        last = day
+    return current, longest, last
+
+
+def active_days_queryset():
+    """학습 기록(단어/학습 시간/퀴즈)이 있는 (user_id, date) 목록"""
+    return DailyStudyStats.objects.filter(
+        Q(words_studied__gt=0) | Q(study_minutes__gt=0) | Q(quiz_questions__gt=0)
+    ).order_by('user_id', 'date').values_list('user_id', 'date')
+
+
+def rebuild_streaks(users=None):
+    """일일 학습 통계의 학습 날짜로 연속 학습일을 다시 계산 (조회 쿼리 1번)"""
+    rows = active_days_queryset()
+    if users is not None:
+        rows = rows.filter(user__in=users)
+
+    days_by_user = {}
+    for user_id, day in rows.iterator():
+        days_by_user.setdefault(user_id, []).append(day)
+
+    streaks = []
+    for user_id, days in days_by_user.items():
+        current, longest, last = compute_streak(days)
+        streaks.append(UserStreak(
+            user_id=user_id,
+            current_streak=current,
+            longest_streak=longest,
+            last_active_date=last,
+            updated_at=timezone.now(),
+        ))
+
+    # MySQL 은 충돌 대상 컬럼을 지정할 수 없다 (ON DUPLICATE KEY UPDATE - user 의 유일 키로 충돌)
+    unique_fields = ['user'] if connection.features.supports_update_conflicts_with_target else None
+    with transaction.atomic():
+        UserStreak.objects.bulk_create(
+            streaks,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=['current_streak', 'longest_streak', 'last_active_date', 'updated_at'],
+        )
+    return len(streaks)
@@ -1,3 +1,760 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import Attendance
+from apps.quiz.models import QuizAttempt
+from apps.vocabulary.models import Word, WordBookmark
+from .benchmarks import KEY_VIEWS, error_responses, query_growth, run_benchmark, seed_dataset
+from .metrics import MetricsRegistry
+from .missions import build_daily_missions
+from .daily_sets import DEFAULT_TARGET, DailySetBuilder, get_daily_words
+from .jobs import cron_matches, parse_cron, run_due, run_job
+from .level_test import LevelScorer, LevelTestRun, build_question_bank, create_level_test, question_bank
+from .models import (
+    DailyMission, DailyStudyStats, DailyWordAssignment, LevelTest, ReviewSchedule, StudyNotification, StudyPlan,
+    StudyProgress, StudySession, UserLevel, UserStreak, UserTestResult, WordStudyHistory
+)
+from .srs import DEFAULT_EASE, MIN_EASE, SM2Scheduler, SRSCard, apply_review, due_count, next_due, start_of_day
+from .stats import get_total_stats, get_total_study_minutes
+from .streaks import rebuild_streaks
+from .word_of_the_day import WordOfTheDay
+
+
+@skipUnless(connection.vendor in ('sqlite', 'mysql'), 'EXPLAIN 결과 형식을 아는 DB 에서만 실행')
+class HotQueryPlanTests(TestCase):
+    """자주 실행되는 필터가 복합 인덱스를 타는지 EXPLAIN 으로 확인
+
+    인덱스가 빠지거나 쿼리 모양이 바뀌어 전체 스캔으로 떨어지면 실패한다.
+    옵티마이저가 통계로 판단하는 MySQL 에서도 같은 결과가 나오도록 두 사용자에게
+    여러 행을 나눠 넣는다.
+    """
+
+    ROWS_PER_USER = 30
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.user = User.objects.create_user('plan-user', 'plan@example.com', 'pw')
+        other = User.objects.create_user('plan-other', 'other@example.com', 'pw')
+        now = timezone.now()
+        difficulties = ['easy', 'medium', 'hard']
+        words = Word.objects.bulk_create([
+            Word(english=f'plan{i}', english_key=f'plan{i}', korean=f'계획{i}',
+                 difficulty=difficulties[i % 3], part_of_speech='noun')
+            for i in range(cls.ROWS_PER_USER)
+        ])
+        for user in (cls.user, other):
+            StudyProgress.objects.bulk_create([
+                StudyProgress(user=user, word=word, review_count=i % 3, proficiency=1 + i % 5,
+                              last_reviewed=now - timedelta(days=i),
+                              due_at=now + timedelta(days=i - 10))
+                for i, word in enumerate(words)
+            ])
+            WordStudyHistory.objects.bulk_create([
+                WordStudyHistory(user=user, word=word, is_correct=i % 2 == 0) for i, word in enumerate(words)
+            ])
+            StudyNotification.objects.bulk_create([
+                StudyNotification(user=user, notification_type='reminder', message='m', is_read=i % 2 == 0)
+                for i in range(cls.ROWS_PER_USER)
+            ])
+            ReviewSchedule.objects.bulk_create([
+                ReviewSchedule(user=user, word=word, scheduled_date=(now + timedelta(days=i)).date(),
+                               status='pending' if i % 2 else 'completed')
+                for i, word in enumerate(words)
+            ])
+            StudySession.objects.bulk_create([
+                StudySession(user=user, start_time=now - timedelta(hours=i),
+                             end_time=None if i == 0 else now - timedelta(hours=i - 1))
+                for i in range(cls.ROWS_PER_USER)
+            ])
+            QuizAttempt.objects.bulk_create([
+                QuizAttempt(user=user, quiz_type='en_to_ko', mode=f'm{i}',
+                            completed_at=now - timedelta(days=i) if i % 4 else None)
+                for i in range(cls.ROWS_PER_USER)
+            ])
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, f'{index_name} 인덱스를 사용하지 않습니다:\n{plan}\n{queryset.query}')
+
+    def test_studied_words_count(self):
+        self.assertUsesIndex(
+            StudyProgress.objects.filter(user=self.user, review_count__gt=0),
+            'study_progress_reviewed_idx'
+        )
+
+    def test_due_queue(self):
+        self.assertUsesIndex(
+            StudyProgress.objects.filter(user=self.user, due_at__lte=timezone.now()).order_by('due_at'),
+            'study_progress_due_idx'
+        )
+
+    def test_recent_study_history(self):
+        self.assertUsesIndex(
+            WordStudyHistory.objects.filter(user=self.user).order_by('-created_at')[:20],
+            'word_history_user_created_idx'
+        )
+
+    def test_recent_quiz_attempts(self):
+        self.assertUsesIndex(
+            QuizAttempt.objects.filter(user=self.user, completed_at__isnull=False).order_by('-completed_at')[:5],
+            'quiz_attempt_completed_idx'
+        )
+
+    def test_notification_list(self):
+        self.assertUsesIndex(
+            StudyNotification.objects.filter(user=self.user).order_by('-created_at')[:20],
+            'study_notif_user_created_idx'
+        )
+
+    def test_pending_review_schedules(self):
+        self.assertUsesIndex(
+            ReviewSchedule.objects.filter(
+                user=self.user, status='pending', scheduled_date__lte=timezone.now().date()
+            ).order_by('scheduled_date'),
+            'review_schedule_status_idx'
+        )
+
+    def test_words_by_difficulty(self):
+        self.assertUsesIndex(
+            Word.objects.filter(difficulty='easy').order_by('english'),
+            'word_difficulty_english_idx'
+        )
+
+    def test_word_by_korean(self):
+        self.assertUsesIndex(Word.objects.filter(korean='계획1').order_by('id'), 'word_korean_idx')
+
+    def test_open_study_session(self):
+        self.assertUsesIndex(
+            StudySession.objects.filter(user=self.user, end_time__isnull=True),
+            'study_session_open_idx'
+        )
+
+
+class ViewQueryCountTests(TestCase):
+    """주요 화면의 쿼리 수가 데이터 양에 따라 늘지 않는지 확인 (N+1 회귀 방지)"""
+
+    def test_key_views_do_not_grow_with_data(self):
+        small, _ = run_benchmark(seed_dataset(1), set(KEY_VIEWS), repeat=1)
+        large, _ = run_benchmark(seed_dataset(3), set(KEY_VIEWS), repeat=1)
+
+        self.assertEqual(set(small), set(KEY_VIEWS))
+        for name, result in small.items():
+            self.assertEqual(result.status, 200, f'{name} 응답 {result.status}')
+        self.assertEqual(query_growth(small, large), [])
+
+    def test_benchmark_leaves_shared_cache_alone(self):
+        cache.set('live:heartbeat', 42)
+        results, _ = run_benchmark(seed_dataset(1), {'study:study_home'}, repeat=2)
+
+        self.assertEqual(cache.get('live:heartbeat'), 42)
+        self.assertEqual(error_responses(results), [])
+
+
+class RequestTimingMiddlewareTests(TestCase):
+    """Server-Timing 헤더와 느린 요청 로그"""
+
+    @override_settings(REQUEST_TIMING_SAMPLE_RATE=1.0, REQUEST_TIMING_SLOW_MS=0)
+    def test_sampled_request_reports_queries_and_logs_slow(self):
+        user = get_user_model().objects.create_user(
+            'timing-user', 'timing@example.com', 'pw', level_test_completed=True
+        )
+        Attendance.objects.create(user=user, check_date=timezone.localdate())
+        self.client.force_login(user)
+
+        with self.assertLogs('apps.study.middleware', 'WARNING') as logs:
+            response = self.client.get(reverse('study:statistics'))
+
+        header = response['Server-Timing']
+        self.assertRegex(header, r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertIn('tpl;dur=', header)
+        self.assertIn('total;dur=', header)
+        self.assertIn('study:statistics', logs.output[0])
+        self.assertIn('SELECT', logs.output[0])
+
+    @override_settings(REQUEST_TIMING_SAMPLE_RATE=0, REQUEST_TIMING_SLOW_MS=60_000)
+    def test_unsampled_request_only_reports_total(self):
+        response = self.client.get(reverse('accounts:login'))
+
+        self.assertRegex(response['Server-Timing'], r'^total;dur=[\d.]+$')
+
+
+class MetricsTests(TestCase):
+    """지표 레지스트리의 텍스트 출력과 다중 프로세스 합산, /metrics 접근 제한"""
+
+    def test_render_counter_and_histogram(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('demo_total', '예시 카운터', ['result'])
+        histogram = registry.histogram('demo_seconds', '예시 히스토그램', buckets=(0.1, 1))
+        counter.inc(result='hit')
+        counter.inc(2, result='hit')
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+
+        text = registry.render()
+
+        self.assertIn('# TYPE demo_total counter', text)
+        self.assertIn('demo_total{result="hit"} 3', text)
+        self.assertIn('demo_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('demo_seconds_bucket{le="1"} 2', text)
+        self.assertIn('demo_seconds_bucket{le="+Inf"} 2', text)
+        self.assertIn('demo_seconds_count 2', text)
+
+    def test_collect_sums_other_process_files(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('demo_total', '예시 카운터')
+        gauge = registry.gauge('demo_in_progress', '예시 게이지')
+        counter.inc(2)
+        gauge.set(1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            # 다른 워커 두 개가 남긴 파일 (하나는 오래전에 기록 - 게이지는 제외)
+            for pid, age in ((101, 0), (102, 3600)):
+                path = os.path.join(directory, f'metrics-{pid}.json')
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(registry.snapshot(), f)
+                stamp = time.time() - age
+                os.utime(path, (stamp, stamp))
+
+            collected = registry.collect(directory)
+
+        self.assertEqual(collected['demo_total']['samples'][()], 6)
+        self.assertEqual(collected['demo_in_progress']['samples'][()], 2)
+
+    def test_endpoint_is_limited_to_allowed_ips(self):
+        self.client.get(reverse('accounts:login'))
+
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('http_request_duration_seconds_bucket{', response.content.decode())
+
+        self.assertEqual(self.client.get(reverse('metrics'), REMOTE_ADDR='203.0.113.9').status_code, 403)
+
+
+@override_settings(STUDY_HEARTBEAT_FLUSH_INTERVAL=120)
+class SRSTests(TestCase):
+    """SM-2 간격/난이도 계수 변화, 복습 대기열 조회, ReviewSchedule 정리 명령"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user('srs-user', 'srs@example.com', 'pw')
+        cls.words = Word.objects.bulk_create([
+            Word(english=f'srs{i}', english_key=f'srs{i}', korean=f'뜻 {i}') for i in range(4)
+        ])
+
+    def test_sm2_progression_and_lapse(self):
+        scheduler = SM2Scheduler()
+        now = timezone.now()
+        card = SRSCard(DEFAULT_EASE, 0, 0, 0, None)
+
+        intervals = []
+        for _ in range(3):
+            card = scheduler.schedule(card, 5, now)
+            intervals.append(card.interval_days)
+        self.assertEqual(intervals, [1, 6, 17])
+        self.assertAlmostEqual(card.ease_factor, 2.8)
+        self.assertEqual(card.due_at, now + timedelta(days=17))
+
+        # 4 는 계수를 유지하고, 3 미만은 잊은 것으로 보고 처음부터 다시
+        self.assertAlmostEqual(scheduler.schedule(card, 4, now).ease_factor, 2.8)
+        lapsed = scheduler.schedule(card, 2, now)
+        self.assertEqual((lapsed.interval_days, lapsed.repetitions, lapsed.lapses), (1, 0, 1))
+        self.assertAlmostEqual(lapsed.ease_factor, 2.48)
+
+        for _ in range(10):
+            card = scheduler.schedule(card, 0, now)
+        self.assertEqual(card.ease_factor, MIN_EASE)
+
+    def test_apply_review_and_due_queue(self):
+        now = timezone.now()
+        progresses = StudyProgress.objects.bulk_create([
+            StudyProgress(user=self.user, word=word, due_at=now + timedelta(hours=offset))
+            for word, offset in zip(self.words, (-3, -1, 2, 48))
+        ])
+
+        self.assertEqual(due_count(self.user, now), 2)
+        self.assertEqual([p.word_id for p in next_due(self.user, now=now)], [self.words[0].id, self.words[1].id])
+        self.assertEqual(len(next_due(self.user, limit=1, now=now)), 1)
+
+        progress = apply_review(progresses[0], 4, now=now)
+        progress.save()
+        self.assertEqual(progress.due_at, now + timedelta(days=1))
+        self.assertEqual(progress.next_review_date, timezone.localtime(progress.due_at).date())
+        self.assertEqual(due_count(self.user, now), 1)
+
+    def test_compact_review_schedules_is_idempotent(self):
+        today = timezone.localdate()
+        # SRS 상태가 없는 진도 + 대기 일정, 진도 없이 대기 일정만 있는 단어, 지난 일정
+        StudyProgress.objects.create(
+            user=self.user, word=self.words[0], proficiency=4, review_count=2, next_review_date=None
+        )
+        # 아직 학습하지 않은(review_count 0) 진도의 대기 일정도 사라지면 안 된다
+        StudyProgress.objects.create(user=self.user, word=self.words[3], review_count=0)
+        ReviewSchedule.objects.bulk_create([
+            ReviewSchedule(user=self.user, word=self.words[3], scheduled_date=today + timedelta(days=4)),
+            ReviewSchedule(user=self.user, word=self.words[0], scheduled_date=today + timedelta(days=3)),
+            ReviewSchedule(user=self.user, word=self.words[0], scheduled_date=today + timedelta(days=5)),
+            ReviewSchedule(user=self.user, word=self.words[1], scheduled_date=today + timedelta(days=2)),
+            ReviewSchedule(user=self.user, word=self.words[2], scheduled_date=today, status='completed'),
+        ])
+
+        out = StringIO()
+        call_command('compact_review_schedules', '--purge-history', stdout=out)
+        self.assertIn('SRS 상태 초기화 2개, 진도 생성 1개, 대기 일정 4행 정리, 지난 일정 1행 삭제', out.getvalue())
+        state = {
+            p.word_id: (p.next_review_date, p.due_at, p.interval_days)
+            for p in StudyProgress.objects.filter(user=self.user)
+        }
+        self.assertEqual(state[self.words[0].id][0], today + timedelta(days=3))
+        self.assertEqual(state[self.words[0].id][2], 7)
+        self.assertEqual(state[self.words[1].id][0], today + timedelta(days=2))
+        first_pending = today + timedelta(days=4)
+        self.assertEqual(state[self.words[3].id][:2], (first_pending, start_of_day(first_pending)))
+        self.assertFalse(ReviewSchedule.objects.exists())
+
+        out = StringIO()
+        call_command('compact_review_schedules', '--purge-history', stdout=out)
+        self.assertIn('SRS 상태 초기화 0개, 진도 생성 0개, 대기 일정 0행 정리, 지난 일정 0행 삭제', out.getvalue())
+        self.assertEqual({
+            p.word_id: (p.next_review_date, p.due_at, p.interval_days)
+            for p in StudyProgress.objects.filter(user=self.user)
+        }, state)
+
+
+class StreakRebuildTests(TestCase):
+    """rebuild_streaks 가 기존 행을 덮어쓰고 없는 행은 만드는지 (한 번의 upsert)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user('streak-user', 'streak@example.com', 'pw')
+        cls.other = get_user_model().objects.create_user('streak-other', 'streak-other@example.com', 'pw')
+
+    def test_rebuild_upserts_streaks(self):
+        today = timezone.localdate()
+        UserStreak.objects.create(user=self.user, current_streak=9, longest_streak=9,
+                                  last_active_date=today - timedelta(days=30))
+        DailyStudyStats.objects.bulk_create(
+            [DailyStudyStats(user=self.user, date=today - timedelta(days=offset), words_studied=1)
+             for offset in (0, 1, 2, 5)]
+            + [DailyStudyStats(user=self.other, date=today - timedelta(days=3), study_minutes=5)]
+        )
+
+        self.assertEqual(rebuild_streaks(), 2)
+        streaks = {s.user_id: (s.current_streak, s.longest_streak, s.last_active_date)
+                   for s in UserStreak.objects.all()}
+        self.assertEqual(streaks, {self.user.id: (3, 3, today), self.other.id: (1, 1, today - timedelta(days=3))})
+
+        # 다시 실행해도 행이 늘지 않는다
+        self.assertEqual(rebuild_streaks(), 2)
+        self.assertEqual(UserStreak.objects.count(), 2)
+
+    def test_upsert_omits_conflict_target_on_mysql(self):
+        DailyStudyStats.objects.create(user=self.user, date=timezone.localdate(), words_studied=1)
+        # MySQL 은 충돌 대상 컬럼을 받지 않는다 (ON DUPLICATE KEY UPDATE)
+        with mock.patch.object(connection.features, 'supports_update_conflicts_with_target', False), \
+                mock.patch.object(UserStreak.objects, 'bulk_create') as bulk_create:
+            rebuild_streaks()
+        kwargs = bulk_create.call_args.kwargs
+        self.assertTrue(kwargs['update_conflicts'])
+        self.assertIsNone(kwargs['unique_fields'])
+
+
+class StudyHeartbeatTests(TestCase):
+    """학습 시간 하트비트가 버퍼에 모였다가 마지막 하트비트에서만 DB 에 쓰이는지"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            'heartbeat-user', 'heartbeat@example.com', 'pw', level_test_completed=True
+        )
+        Attendance.objects.create(user=self.user, check_date=timezone.localdate())
+        self.session = StudySession.objects.create(user=self.user)
+        self.client.force_login(self.user)
+
+    def ping(self, seconds, **extra):
+        return self.client.post(
+            reverse('study:save_study_time'),
+            json.dumps({'session_id': self.session.id, 'study_time': seconds, **extra}),
+            content_type='application/json'
+        ).json()
+
+    def test_heartbeats_are_buffered_until_final(self):
+        self.ping(10)
+        with CaptureQueriesContext(connection) as captured:
+            for seconds in range(20, 120, 10):
+                response = self.ping(seconds)
+        writes = [q['sql'] for q in captured.captured_queries if not q['sql'].startswith('SELECT')]
+        self.assertEqual(writes, [])
+        self.assertEqual(response['total_study_time'], round(110 / 60, 2))
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.study_minutes, 0)
+
+        response = self.ping(120, final=True)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.study_minutes, 2)
+        self.assertEqual(response['total_study_time'], 2)
+        self.assertEqual(get_total_stats(self.user)['study_minutes'], 2)
+
+    def test_stale_or_smaller_heartbeat_does_not_lower_time(self):
+        self.ping(120, final=True)
+        cache.clear()  # 다른 워커(버퍼 없음)로 간 늦은 하트비트
+
+        self.ping(60, final=True)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.study_minutes, 2)
+        self.assertEqual(get_total_study_minutes(self.user), 2)
+
+    def test_flushes_after_interval(self):
+        self.ping(10)
+        with override_settings(STUDY_HEARTBEAT_FLUSH_INTERVAL=0):
+            self.ping(30)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.study_minutes, 0.5)
+
+
+class WordOfTheDayTests(TestCase):
+    """오늘의 단어가 날짜로 결정되고 요청 경로에서 단어 테이블에 쓰지 않는지"""
+
+    def setUp(self):
+        cache.clear()
+        Word.objects.bulk_create([
+            Word(english=f'daily{i}', english_key=f'daily{i}', korean=f'오늘{i}') for i in range(20)
+        ])
+        self.service = WordOfTheDay()
+
+    def test_same_word_for_same_day_without_writes(self):
+        day = timezone.localdate()
+        with CaptureQueriesContext(connection) as captured:
+            word = self.service.get(day)
+        self.assertEqual([q['sql'] for q in captured.captured_queries if not q['sql'].startswith('SELECT')], [])
+        self.assertIsNone(word.daily_word_date)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.service.get(day), word)
+
+        cache.clear()  # 캐시를 공유하지 않는 다른 워커
+        self.assertEqual(WordOfTheDay().get(day), word)
+
+    def test_choice_is_pinned_for_the_day_and_replaced_when_deleted(self):
+        day = timezone.localdate()
+        word = self.service.get(day)
+        Word.objects.create(english='newcomer', korean='새 단어')
+        self.service.invalidate()
+        self.assertEqual(WordOfTheDay().get(day), word)
+
+        word.delete()
+        self.service.forget(word.pk, deleted=True)
+        replacement = self.service.get(day)
+        self.assertIsNotNone(replacement)
+        self.assertNotEqual(replacement.pk, word.pk)
+
+
+class DailySetTests(TestCase):
+    """사용자별 오늘의 단어 목록을 일괄로 만들고 화면은 읽기만 하는지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        difficulties = ['easy', 'medium', 'hard']
+        cls.words = Word.objects.bulk_create([
+            Word(english=f'set{i}', english_key=f'set{i}', korean=f'목록{i}', difficulty=difficulties[i % 3])
+            for i in range(60)
+        ])
+        User = get_user_model()
+        cls.user = User.objects.create_user(
+            'set-user', 'set@example.com', 'pw', level_test_completed=True, last_login=timezone.now()
+        )
+        cls.other = User.objects.create_user(
+            'set-other', 'set-other@example.com', 'pw', level_test_completed=True, last_login=timezone.now()
+        )
+        for user in (cls.user, cls.other):
+            Attendance.objects.create(user=user, check_date=timezone.localdate())
+        User.objects.create_user('set-idle', 'idle@example.com', 'pw')  # 로그인 기록 없음
+        StudyPlan.objects.create(user=cls.user, title='계획', target_words_per_day=7)
+        UserLevel.objects.create(user=cls.user, current_level=5)
+        cls.learned = [word for word in cls.words if word.difficulty == 'hard'][:5]
+        StudyProgress.objects.bulk_create([
+            StudyProgress(user=cls.user, word=word, review_count=1) for word in cls.learned
+        ])
+
+    def test_builds_sets_for_active_users(self):
+        day = timezone.localdate()
+        built, rows = DailySetBuilder(day).run()
+
+        self.assertEqual((built, rows), (2, 7 + DEFAULT_TARGET))
+        words = get_daily_words(self.user, day)
+        self.assertEqual(len(words), 7)
+        self.assertTrue(all(word.difficulty == 'hard' for word in words))
+        self.assertFalse({word.pk for word in words} & {word.pk for word in self.learned})
+
+        # 이미 만든 목록은 건너뛰고, 다시 만들어도 같은 단어를 고른다
+        self.assertEqual(DailySetBuilder(day).run(), (0, 0))
+        DailySetBuilder(day, rebuild=True).run()
+        self.assertEqual(get_daily_words(self.user, day), words)
+
+    def test_view_reads_prebuilt_set_without_touching_words(self):
+        DailySetBuilder(timezone.localdate()).run()
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse('study:daily_words'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['daily_words']), 7)
+        writes = [q['sql'] for q in captured.captured_queries if not q['sql'].startswith('SELECT')]
+        self.assertFalse([q for q in writes if 'vocabulary_word' in q or 'study_dailywordassignment' in q])
+
+    def test_view_builds_missing_set_for_one_user(self):
+        self.client.force_login(self.other)
+        response = self.client.get(reverse('study:daily_words'))
+
+        self.assertEqual(len(response.context['daily_words']), DEFAULT_TARGET)
+        self.assertEqual(
+            set(DailyWordAssignment.objects.values_list('user_id', flat=True).distinct()), {self.other.pk}
+        )
+
+
+class BatchJobTests(TestCase):
+    """배치 작업 등록소/스케줄러와 미리 만드는 미션, 알림"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.words = Word.objects.bulk_create([
+            Word(english=f'job{i}', english_key=f'job{i}', korean=f'작업{i}') for i in range(20)
+        ])
+        cls.user = get_user_model().objects.create_user(
+            'job-user', 'job@example.com', 'pw', level_test_completed=True, last_login=timezone.now()
+        )
+        Attendance.objects.create(user=cls.user, check_date=timezone.localdate())
+        WordBookmark.objects.bulk_create([WordBookmark(user=cls.user, word=word) for word in cls.words[:6]])
+
+    def test_cron_matching(self):
+        moment = timezone.localtime().replace(year=2026, month=10, day=18, hour=23, minute=30)  # 일요일
+        self.assertTrue(cron_matches('30 23 * * *', moment))
+        self.assertTrue(cron_matches('*/15 20-23 * * 0', moment))
+        self.assertTrue(cron_matches('0 0 1 * 7', moment.replace(hour=0, minute=0)))
+        self.assertFalse(cron_matches('30 23 * * 1-5', moment))
+        with self.assertRaises(ValueError):
+            parse_cron('61 * * * *')
+
+    def test_scheduled_slot_runs_once_and_records_rows(self):
+        moment = timezone.localtime().replace(hour=23, minute=40, second=5)
+        runs = run_due(moment)
+        self.assertEqual([run.name for run in runs], ['daily_missions'])
+        self.assertEqual(runs[0].status, 'success')
+        self.assertEqual(runs[0].rows, {'DailyMission': 1, 'DailyMission.words': 5})
+        self.assertEqual(runs[0].target_date, moment.date() + timedelta(days=1))
+
+        # 다른 스케줄러가 같은 예약 시각을 다시 확인해도 실행하지 않는다
+        self.assertEqual(run_due(moment, since=moment - timedelta(minutes=1)), [])
+
+    def test_mission_view_reads_prebuilt_choices(self):
+        build_daily_missions(timezone.localdate())
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse('study:daily_mission'))
+
+        self.assertFalse([q['sql'] for q in captured.captured_queries if not q['sql'].startswith('SELECT')])
+        word_choices = response.context['word_choices']
+        self.assertEqual(len(word_choices), 5)
+        for item in word_choices:
+            ids = [choice['id'] for choice in item['choices']]
+            self.assertEqual(len(ids), 4)
+            self.assertIn(item['word'].id, ids)
+
+    def test_mission_created_concurrently_by_view_is_kept(self):
+        day = timezone.localdate()
+        real_bulk_create = DailyMission.objects.bulk_create
+
+        def view_wins(missions, **kwargs):
+            # 미션 조회 이후, 화면이 같은 사용자의 미션을 먼저 넣고 단어는 아직 연결하지 않은 상태
+            DailyMission.objects.create(user=self.user, date=day, choices={})
+            return real_bulk_create(missions, **kwargs)
+
+        with mock.patch.object(DailyMission.objects, 'bulk_create', side_effect=view_wins):
+            rows = build_daily_missions(day)
+
+        self.assertEqual(rows['DailyMission.words'], 0)
+        mission = DailyMission.objects.get(user=self.user, date=day)
+        self.assertEqual((mission.choices, mission.words.count()), ({}, 0))
+
+        # 보기가 같은 미션이면 연결하고, 그 사이 화면이 먼저 연결한 단어는 건너뛴다
+        DailyMission.objects.all().delete()
+        through = DailyMission.words.through
+        real_link = through.objects.bulk_create
+
+        def view_links_first(links, **kwargs):
+            real_link(links[:2])
+            return real_link(links, **kwargs)
+
+        with mock.patch.object(through.objects, 'bulk_create', side_effect=view_links_first):
+            build_daily_missions(day)
+        self.assertEqual(DailyMission.objects.get(user=self.user, date=day).words.count(), 5)
+
+    def test_review_and_reminder_notifications(self):
+        today = timezone.localdate()
+        StudyProgress.objects.create(user=self.user, word=self.words[0], review_count=1, due_at=timezone.now())
+        session = StudySession.objects.create(user=self.user)
+        StudySession.objects.filter(pk=session.pk).update(end_time=timezone.now() - timedelta(days=7))
+
+        for name in ('review_notifications', 'study_reminders', 'review_notifications'):
+            run_job(name, day=today)
+
+        self.assertEqual(
+            sorted(StudyNotification.objects.filter(user=self.user).values_list('notification_type', flat=True)),
+            ['reminder', 'review']
+        )
+
+
+class LevelTestBankTests(TestCase):
+    """레벨 테스트를 문제 은행에서 한 번의 bulk_create 로 만드는지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Word.objects.bulk_create([
+            Word(english=f'bank{difficulty}{i}', english_key=f'bank{difficulty}{i}', korean=f'{difficulty} 뜻 {i}',
+                 difficulty=difficulty)
+            for difficulty in ('easy', 'medium', 'hard') for i in range(25)
+        ])
+        cls.user = get_user_model().objects.create_user('bank-user', 'bank@example.com', 'pw')
+        Attendance.objects.create(user=cls.user, check_date=timezone.localdate())
+
+    def setUp(self):
+        question_bank.invalidate()
+
+    def test_bank_is_built_once_per_difficulty(self):
+        self.assertEqual(build_question_bank(size=10), {'easy': 10, 'medium': 10, 'hard': 10})
+        self.assertEqual(build_question_bank(size=10), {'easy': 0, 'medium': 0, 'hard': 0})
+        bank = question_bank.questions()
+        self.assertEqual({difficulty: len(questions) for difficulty, questions in bank.items()},
+                         {'easy': 10, 'medium': 10, 'hard': 10})
+        question = bank['hard'][0]
+        self.assertEqual(len(question.options), 4)
+        self.assertIn(question.correct_answer, question.options)
+
+    def test_test_is_copied_from_bank_in_one_insert(self):
+        build_question_bank()
+        question_bank.questions()
+
+        with CaptureQueriesContext(connection) as captured:
+            test = create_level_test(self.user)
+        sql = [q['sql'] for q in captured.captured_queries]
+        self.assertFalse([q for q in sql if q.startswith('SELECT')])
+        self.assertEqual(len([q for q in sql if q.startswith('INSERT INTO "study_testquestion"')]), 1)
+
+        questions = list(test.questions.select_related('word'))
+        self.assertEqual(len(questions), 60)
+        self.assertEqual(sorted({q.word.difficulty for q in questions}), ['easy', 'hard', 'medium'])
+        self.assertTrue(UserTestResult.objects.filter(user=self.user, test=test).exists())
+
+    def test_start_view_builds_missing_bank(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('study:level_test_start'))
+
+        test = LevelTest.objects.get(is_question_bank=False)
+        self.assertRedirects(response, reverse('study:level_test_question', args=[test.id, 1]),
+                             fetch_redirect_response=False)
+        self.assertEqual(test.questions.count(), 60)
+
+    def _run_request(self):
+        request = RequestFactory().get('/')
+        request.user = self.user
+        request.session = SessionStore()
+        return request
+
+    def test_answers_are_written_once_on_completion(self):
+        cache.clear()
+        build_question_bank(size=20)
+        test = create_level_test(self.user)
+        questions = list(test.questions.order_by('id').select_related('word'))
+        self.client.force_login(self.user)
+
+        def answer(number):
+            question = questions[number - 1]
+            # 쉬운 문제만 맞힌다
+            text = question.correct_answer if question.word.difficulty == 'easy' else '모름'
+            url = reverse('study:level_test_question', args=[test.id, number])
+            self.assertEqual(self.client.get(url).status_code, 200)
+            self.client.post(url, {'answer': text})
+
+        answer(1)
+        with CaptureQueriesContext(connection) as captured:
+            for number in range(2, 31):
+                answer(number)
+        sql = [q['sql'] for q in captured.captured_queries]
+        self.assertFalse([q for q in sql if 'study_testquestion' in q or 'study_usertestresult' in q])
+
+        # 다른 워커로 가거나 캐시에서 밀려나도 세션의 답안은 남는다
+        cache.clear()
+        for number in range(31, 60):
+            answer(number)
+        self.assertEqual(UserTestResult.objects.get(user=self.user, test=test).answers, {})
+
+        # 다 풀지 않았으면 채점하지 않고 답하지 않은 문제로 돌려보낸다
+        response = self.client.get(reverse('study:level_test_complete', args=[test.id]))
+        self.assertRedirects(response, reverse('study:level_test_question', args=[test.id, 60]),
+                             fetch_redirect_response=False)
+        self.assertEqual(UserTestResult.objects.get(user=self.user, test=test).answers, {})
+
+        answer(60)
+        response = self.client.get(reverse('study:level_test_complete', args=[test.id]))
+        self.assertEqual(response.status_code, 200)
+        result = UserTestResult.objects.get(user=self.user, test=test)
+        self.assertEqual((result.score, result.level), (33, 1))
+        self.assertEqual(len(result.answers), 60)
+        self.assertEqual(result.answers['1']['word_id'], questions[0].word_id)
+        self.assertEqual(UserLevel.objects.get(user=self.user).current_level, 1)
+
+        # 완료한 테스트를 다시 열면 저장된 답안으로 같은 결과를 보여준다
+        response = self.client.get(reverse('study:level_test_complete', args=[test.id]))
+        self.assertEqual(response.context['result'].score, 33)
+
+    def test_reanswer_replaces_tally(self):
+        cache.clear()
+        build_question_bank(size=20)
+        test = create_level_test(self.user)
+        request = self._run_request()
+        run = LevelTestRun.load(request, test.id)
+        hard = [n for n, q in enumerate(run.questions, start=1) if q.difficulty == 'hard']
+        for number in hard:
+            run.record(number, 'x')
+        run.record(hard[0], run.question(hard[0]).correct_answer)
+        self.assertEqual(run.scorer.tallies['hard'], [1, 20])
+        self.assertEqual(run.first_unanswered(), min(set(range(1, 61)) - set(hard)))
+        with self.assertRaises(ValueError):
+            run.finish()
+
+        # 문제 목록이 캐시에서 밀려나도 같은 순서로 다시 읽고 세션의 답안을 이어 쓴다
+        cache.clear()
+        restored = LevelTestRun.load(request, test.id)
+        self.assertEqual([q.id for q in restored.questions], [q.id for q in run.questions])
+        self.assertEqual(restored.scorer.tallies['hard'], [1, 20])
+
+        other = self._run_request()
+        other.user = get_user_model().objects.create_user('other', 'o@example.com', 'pw')
+        self.assertIsNone(LevelTestRun.load(other, test.id))
+
+    def test_scorer_levels(self):
+        scorer = LevelScorer()
+        for correct in (True, True, True, False):
+            scorer.add('hard', correct)
+        self.assertEqual(scorer.result()[:3], (75, 5, 'hard'))
+        scorer.remove('hard', True)
+        scorer.add('medium', True)
+        self.assertEqual(scorer.result()[:3], (75, 4, 'hard'))
+        self.assertEqual(LevelScorer().result().score, 0)
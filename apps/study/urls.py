@@ -60,6 +60,7 @@ urlpatterns = [
     path('wordlist/', views.word_list_study, name='wordlist'),
     path('review/', views.review_list, name='review'),
     path('review/start/<int:word_id>/', views.review_start, name='review_start'),
+    path('review/due/', views.review_due_api, name='review_due_api'),
     path('daily-words/', views.daily_words, name='daily_words'),
     path('wrong-notes/', views.wrong_notes, name='wrong_notes'),
 
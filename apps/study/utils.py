@@ -1,27 +1,16 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Max
 from django.utils import timezone
-from datetime import timedelta
-from .models import StudyProgress, StudySession, ReviewSchedule, Notification, UserNotificationSettings
+from datetime import datetime, time, timedelta
+from .daily_sets import active_users, user_id_chunks
+from .models import StudyProgress, StudySession, StudyNotification, Notification, UserNotificationSettings
+from .streaks import get_streak
+
+User = get_user_model()
 
 def check_and_create_review_notification(user):
     """복습 알림 체크 및 생성"""
-    today = timezone.now().date()
-    review_count = ReviewSchedule.objects.filter(
-        user=user,
-        scheduled_date=today,
-        status='pending'
-    ).count()
-
-    if review_count > 0:
-        # 아직 읽지 않은 오늘의 복습 알림이 있는지 확인
-        existing_notification = Notification.objects.filter(
-            user=user,
-            type='review',
-            created_at__date=today,
-            is_read=False
-        ).exists()
-
-        if not existing_notification:
-            Notification.create_review_notification(user, review_count)
+    create_review_notifications(timezone.localdate(), users=User.objects.filter(pk=user.pk))
 
 def check_and_create_achievement_notifications(user):
     """목표 달성 알림 체크 및 생성"""
@@ -60,46 +49,84 @@ def check_and_create_achievement_notifications(user):
 
 def check_and_create_reminder_notification(user):
     """학습 독려 알림 체크 및 생성"""
-    last_session = StudySession.objects.filter(
-        user=user,
-        end_time__isnull=False
-    ).order_by('-end_time').first()
-
-    if last_session:
-        days_since_last_study = (timezone.now().date() - last_session.end_time.date()).days
-        reminder_days = [3, 7, 14]  # 3일, 7일, 14일 동안 학습하지 않았을 때
-
-        if days_since_last_study in reminder_days:
-            # 같은 날짜에 대한 알림이 이미 있는지 확인
-            existing_notification = Notification.objects.filter(
-                user=user,
-                type='reminder',
-                created_at__date=timezone.now().date()
-            ).exists()
-
-            if not existing_notification:
-                Notification.create_reminder_notification(user, days_since_last_study)
+    create_reminder_notifications(timezone.localdate(), users=User.objects.filter(pk=user.pk))
+
+REMINDER_DAYS = [3, 7, 14]  # 3일, 7일, 14일 동안 학습하지 않았을 때
+
+
+def _day_range(day):
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+def _notified_users(user_ids, notification_type, day):
+    """day 에 이미 notification_type 알림을 받은 사용자 id"""
+    start, end = _day_range(day)
+    return set(StudyNotification.objects.filter(
+        user_id__in=user_ids, notification_type=notification_type, created_at__gte=start, created_at__lt=end
+    ).values_list('user_id', flat=True))
+
+
+def _opted_out_users(user_ids, field):
+    """알림 설정에서 field 알림을 끈 사용자 id (설정이 없으면 기본값인 켜짐)"""
+    return set(UserNotificationSettings.objects.filter(
+        user_id__in=user_ids, **{field: False}
+    ).values_list('user_id', flat=True))
+
+
+def create_review_notifications(day, users=None, chunk_size=500):
+    """day 가 끝날 때까지 복습할 카드가 있는 사용자(기본: 활성 사용자)에게 복습 알림을 만든다
+
+    사용자 chunk_size 명마다 복습 대기 카드 수를 한 번에 세고 알림을 bulk_create 한다.
+    반환값: {항목: 행 수}
+    """
+    _, end = _day_range(day)
+    created = 0
+    for chunk in user_id_chunks(active_users() if users is None else users, chunk_size):
+        skip = _notified_users(chunk, 'review', day) | _opted_out_users(chunk, 'review_notifications')
+        due = (
+            StudyProgress.objects.filter(user_id__in=[pk for pk in chunk if pk not in skip], due_at__lt=end)
+            .values('user_id').annotate(count=Count('id')).order_by()
+        )
+        notifications = [
+            StudyNotification(
+                user_id=row['user_id'], notification_type='review',
+                message=f'오늘 복습할 단어가 {row["count"]}개 있습니다. 잊기 전에 복습해 보세요! 📖'
+            )
+            for row in due
+        ]
+        StudyNotification.objects.bulk_create(notifications)
+        created += len(notifications)
+    return {'StudyNotification.review': created}
+
+
+def create_reminder_notifications(day, users=None, chunk_size=500):
+    """마지막 학습 후 REMINDER_DAYS 일째인 사용자(기본: 활성 사용자)에게 학습 독려 알림을 만든다
+
+    반환값: {항목: 행 수}
+    """
+    created = 0
+    for chunk in user_id_chunks(active_users() if users is None else users, chunk_size):
+        skip = _notified_users(chunk, 'reminder', day) | _opted_out_users(chunk, 'reminder_notifications')
+        last_sessions = (
+            StudySession.objects.filter(user_id__in=[pk for pk in chunk if pk not in skip], end_time__isnull=False)
+            .values('user_id').annotate(last_end=Max('end_time')).order_by()
+        )
+        notifications = []
+        for row in last_sessions:
+            days_since_last_study = (day - timezone.localtime(row['last_end']).date()).days
+            if days_since_last_study in REMINDER_DAYS:
+                notifications.append(StudyNotification(
+                    user_id=row['user_id'], notification_type='reminder',
+                    message=f'{days_since_last_study}일 동안 학습하지 않았어요. 오늘 다시 시작해 볼까요? 📚'
+                ))
+        StudyNotification.objects.bulk_create(notifications)
+        created += len(notifications)
+    return {'StudyNotification.reminder': created}
 
 def get_consecutive_study_days(user):
-    """연속 학습일수 계산"""
-    today = timezone.now().date()
-    consecutive_days = 0
-    current_date = today
-
-    while True:
-        has_study = StudySession.objects.filter(
-            user=user,
-            start_time__date=current_date,
-            end_time__isnull=False
-        ).exists()
-
-        if not has_study:
-            break
-
-        consecutive_days += 1
-        current_date -= timedelta(days=1)
-
-    return consecutive_days
+    """연속 학습일수 (UserStreak 에 저장된 값, 쿼리 1번)"""
+    return get_streak(user)
 
 def create_notification(user, notification_type, message):
     """알림을 생성하는 기본 함수"""
@@ -8,6 +8,24 @@ from .models import StudyPlan, StudySession, StudyProgress, ReviewSchedule, Noti
 from apps.vocabulary.models import Word, PersonalWordList
 from apps.accounts.models import CustomUser
 from apps.quiz.models import QuizAnswerHistory, WrongAnswerNote, QuizAttempt
+from apps.quiz.distractors import distractor_pool
+from .audio import MAX_TEXT_LENGTH, audio_key, audio_response, audio_store
+from .cache import get_user_fragment
+from .daily_sets import get_daily_words
+from .heartbeats import discard as discard_heartbeats, record_heartbeat
+from .level_test import LevelTestRun, create_level_test
+from .metrics import (
+    DAILY_GENERATION_SECONDS, STUDY_MINUTES, STUDY_TIME_HEARTBEATS, TTS_REQUESTS,
+    TTS_SYNTHESIS_SECONDS, WORD_PROGRESS_UPDATES, registry as metrics_registry
+)
+from .missions import build_daily_missions, mission_choices
+from .srs import apply_review, due_count, next_due, upcoming
+from .streaks import get_streak
+from .word_of_the_day import word_of_the_day
+from .stats import (
+    get_daily_stats, get_today_stats, get_total_stats, progress_snapshot,
+    record_progress, record_study_minutes
+)
 from apps.accounts.models import UserProfile
 from datetime import datetime, timedelta, time
 from django.db.models import Sum, Count, Avg, Q, Max
@@ -19,10 +37,9 @@ from .utils import (
 )
 import random
 from django.urls import reverse
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, Http404
 from django.db import models
 from django.core.paginator import Paginator
-from gtts import gTTS
 import os
 from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
@@ -34,6 +51,8 @@ from django.contrib.auth import get_user_model
 
 logger = logging.getLogger(__name__)
 
+REVIEW_PAGE_SIZE = 100  # 복습 목록/API 에서 한 번에 보여줄 최대 카드 수
+
 User = get_user_model()
 
 # Create your views here.
@@ -68,28 +87,8 @@ class WordEncoder(DjangoJSONEncoder):
         return super().default(obj)
 
 def get_todays_word():
-    """오늘의 단어를 가져오는 함수"""
-    today = timezone.localtime().date()
-    
-    # 오늘의 단어가 이미 설정되어 있는지 확인
-    todays_word = Word.objects.filter(daily_word_date=today).first()
-    
-    if todays_word:
-        return todays_word
-    
-    # 새로운 오늘의 단어 선택
-    words = Word.objects.all()
-    if words.exists():
-        # 이전 오늘의 단어 표시 제거
-        Word.objects.filter(daily_word_date=today).update(daily_word_date=None)
-        
-        # 새로운 단어 선택
-        new_word = random.choice(words)
-        new_word.daily_word_date = today
-        new_word.save()
-        
-        return new_word
-    return None
+    """오늘의 단어를 가져오는 함수 (날짜 해시로 고르며 단어 테이블에 쓰지 않음)"""
+    return word_of_the_day.get()
 
 @login_required
 def study_home(request):
@@ -100,55 +99,44 @@ def study_home(request):
     # 오늘의 단어 가져오기
     todays_word = get_todays_word()
     
-    # 오늘 학습한 단어 수 (고유 단어 기준)
     current_time = timezone.localtime(timezone.now())
     today = current_time.date()
-    today_start = timezone.make_aware(datetime.combine(today, datetime.min.time()))
-    today_end = timezone.make_aware(datetime.combine(today, datetime.max.time()))
-    
-    # 한국 시간대로 변환
-    today_start = timezone.localtime(today_start)
-    today_end = timezone.localtime(today_end)
     
-    today_words = StudyProgress.objects.filter(
-        user=request.user,
-        last_reviewed__range=(today_start, today_end),
-        review_count__gt=0
-    ).count()
-    
-    # 연속 출석일 계산
-    streak_days = 0
-    current_date = today
-    while True:
-        has_study = StudyProgress.objects.filter(
-            user=request.user,
-            last_reviewed__date=current_date,
-            review_count__gt=0
-        ).exists()
-        if has_study:
-            streak_days += 1
-            current_date -= timezone.timedelta(days=1)
-        else:
-            break
+    def compute_home_stats():
+        # 오늘 학습한 단어 수 (고유 단어 기준, 일일 통계에서 조회)
+        today_words = get_today_stats(request.user, today).words_studied
+        
+        # 연속 학습일 (학습 이벤트마다 갱신되는 UserStreak 에서 조회)
+        streak_days = get_streak(request.user, today)
+        
+        # 주간 학습 단어 수 (고유 단어 수 기준)
+        week_start = today - timezone.timedelta(days=today.weekday())
+        week_end = week_start + timezone.timedelta(days=6)
+        weekly_achieved = sum(
+            stats.words_studied for stats in get_daily_stats(request.user, week_start, week_end).values()
+        )
+        
+        total_studied_words = get_total_stats(request.user)['words_studied']
+        return {
+            'today_words': today_words,
+            'streak_days': streak_days,
+            'weekly_achieved': weekly_achieved,
+            'total_studied_words': total_studied_words,
+        }
     
-    # 주간 달성률 계산 (고유 단어 수 기준)
-    week_start = today - timezone.timedelta(days=today.weekday())
-    week_end = week_start + timezone.timedelta(days=6)
+    # 학습 기록이 바뀌면 signals 에서 무효화되는 사용자별 캐시
+    home_stats = get_user_fragment(request.user, 'study_home', compute_home_stats, today)
+    today_words = home_stats['today_words']
+    streak_days = home_stats['streak_days']
+    total_studied_words = home_stats['total_studied_words']
     
+    # 주간 달성률 계산
     weekly_goals = user_profile.daily_goal * 7
-    weekly_achieved = StudyProgress.objects.filter(
-        user=request.user,
-        last_reviewed__date__range=[week_start, week_end],
-        review_count__gt=0
-    ).count()
-    
+    weekly_achieved = home_stats['weekly_achieved']
     weekly_achievement_rate = min(100, int((weekly_achieved / weekly_goals) * 100)) if weekly_goals > 0 else 0
     
     # 경험치 계산 (학습한 단어 수 * 10)
-    experience = StudyProgress.objects.filter(
-        user=request.user,
-        review_count__gt=0
-    ).count() * 10
+    experience = total_studied_words * 10
 
     # 틀린 단어 목록 가져오기 (상위 5개)
     wrong_answers = WrongAnswerNote.objects.filter(
@@ -159,7 +147,7 @@ def study_home(request):
         'user_profile': user_profile,
         'study_plans': study_plans,
         'today_words': today_words,
-        'total_studied_words': StudyProgress.objects.filter(user=request.user, review_count__gt=0).count(),
+        'total_studied_words': total_studied_words,
         'weekly_achievement_rate': weekly_achievement_rate,
         'streak_days': streak_days,
         'daily_goal': user_profile.daily_goal,
@@ -203,67 +191,71 @@ def wrong_notes(request):
 def statistics(request):
     """학습 통계 대시보드 뷰"""
     user = request.user
-    # 누적 통계
-    total_words_studied = StudyProgress.objects.filter(user=user, review_count__gt=0).count()
-    mastered_words = StudyProgress.objects.filter(user=user, proficiency=5).count()
-    needs_review = StudyProgress.objects.filter(user=user, proficiency__lt=5, review_count__gt=0).count()
-    
-    # 디버그 로그 추가
-    print(f"\n=== 학습 통계 디버깅 ===")
-    print(f"사용자: {user.username} (ID: {user.id})")
-    print(f"전체 학습 단어 수: {total_words_studied}")
-    print(f"완벽히 암기한 단어 수: {mastered_words}")
-    print(f"복습이 필요한 단어 수: {needs_review}")
-    print("=======================\n")
-    
-    total_study_minutes = StudySession.objects.filter(user=user, end_time__isnull=False).aggregate(total=Sum('study_minutes'))['total'] or 0
-    total_study_minutes = round(total_study_minutes)  # 정수로 반올림
-    total_study_hours = round(total_study_minutes / 60, 1)
-    
-    # 시간과 분 계산
-    hours = total_study_minutes // 60
-    minutes = total_study_minutes % 60
-
     # 오늘 날짜 (한국시간)
     today = timezone.localtime().date()
-    week_ago = today - timedelta(days=6)
-    month_ago = today - timedelta(days=29)
-
-    # 주간/월간 학습 데이터 (파이썬에서 직접 변환)
-    week_counts = defaultdict(int)
-    month_counts = defaultdict(int)
-    accuracy_week = defaultdict(list)
-
-    progresses = StudyProgress.objects.filter(user=user, review_count__gt=0)
-    for p in progresses:
-        reviewed_local = timezone.localtime(p.last_reviewed)
-        reviewed_date = reviewed_local.date()
-        if week_ago <= reviewed_date <= today:
-            week_counts[reviewed_date] += 1
-            accuracy_week[reviewed_date].append(p.proficiency)
-        if month_ago <= reviewed_date <= today:
-            month_counts[reviewed_date] += 1
-
-    # 주간 데이터 리스트화 (누락된 날짜는 0)
-    week_dates = [week_ago + timedelta(days=i) for i in range(7)]
-    weekly_counts = [week_counts[d] for d in week_dates]
-    weekly_labels = [d.strftime('%m-%d') for d in week_dates]
-    # 월간 데이터 리스트화
-    month_dates = [month_ago + timedelta(days=i) for i in range(30)]
-    monthly_counts = [month_counts[d] for d in month_dates]
-    monthly_labels = [d.strftime('%m-%d') for d in month_dates]
-
-    # 주간 정확도
-    accuracy_data = []
-    for d in week_dates:
-        if accuracy_week[d]:
-            avg = sum(accuracy_week[d]) / len(accuracy_week[d])
-            accuracy_data.append(round(avg, 1))
-        else:
-            accuracy_data.append(0)
 
-    # 오늘 학습한 단어 수
-    today_words_studied = week_counts[today]
+    def compute_statistics():
+        # 누적 통계 (일일 통계 합계)
+        totals = get_total_stats(user)
+        total_words_studied = totals['words_studied']
+        mastered_words = totals['mastered_words']
+        needs_review = total_words_studied - mastered_words
+        
+        # 디버그 로그 추가
+        print(f"\n=== 학습 통계 디버깅 ===")
+        print(f"사용자: {user.username} (ID: {user.id})")
+        print(f"전체 학습 단어 수: {total_words_studied}")
+        print(f"완벽히 암기한 단어 수: {mastered_words}")
+        print(f"복습이 필요한 단어 수: {needs_review}")
+        print("=======================\n")
+        
+        total_study_minutes = round(totals['study_minutes'])  # 정수로 반올림
+
+        week_ago = today - timedelta(days=6)
+        month_ago = today - timedelta(days=29)
+
+        # 주간/월간 학습 데이터 (최근 30일 일일 통계 행만 조회)
+        daily_stats = get_daily_stats(user, month_ago, today)
+
+        def words_on(d):
+            return daily_stats[d].words_studied if d in daily_stats else 0
+
+        # 주간 데이터 리스트화 (누락된 날짜는 0)
+        week_dates = [week_ago + timedelta(days=i) for i in range(7)]
+        weekly_counts = [words_on(d) for d in week_dates]
+        # 월간 데이터 리스트화
+        month_dates = [month_ago + timedelta(days=i) for i in range(30)]
+        monthly_counts = [words_on(d) for d in month_dates]
+
+        return {
+            'total_words_studied': total_words_studied,
+            'mastered_words': mastered_words,
+            'needs_review': needs_review,
+            'total_study_hours': round(total_study_minutes / 60, 1),
+            'total_study_minutes': total_study_minutes,
+            'study_hours': total_study_minutes // 60,  # 시간
+            'study_minutes': total_study_minutes % 60,  # 분
+            'today_words_studied': words_on(today),  # 오늘 학습한 단어 수
+            'weekly_labels': [d.strftime('%m-%d') for d in week_dates],
+            'weekly_counts': weekly_counts,
+            'monthly_labels': [d.strftime('%m-%d') for d in month_dates],
+            'monthly_counts': monthly_counts,
+            # 주간 정확도 (그날 학습한 단어들의 평균 숙련도)
+            'accuracy_data': [
+                daily_stats[d].average_proficiency if d in daily_stats else 0
+                for d in week_dates
+            ],
+            # 최근 퀴즈 기록
+            'recent_quiz_attempts': list(QuizAttempt.objects.filter(
+                user=user,
+                completed_at__isnull=False
+            ).order_by('-completed_at')[:5]),
+            'any_weekly_data': any(weekly_counts),  # 주간 데이터 존재 여부
+            'any_monthly_data': any(monthly_counts),  # 월간 데이터 존재 여부
+        }
+
+    # 학습/퀴즈 기록이 바뀌면 signals 에서 무효화되는 사용자별 캐시
+    context = get_user_fragment(user, 'statistics', compute_statistics, today)
     
     # 일일 목표 가져오기
     daily_goal = DailyGoal.objects.filter(
@@ -279,79 +271,25 @@ def statistics(request):
             study_time=5  # 기본값 5분 설정 (필드 참조 제거)
         )
     
+    today_words_studied = context['today_words_studied']
     daily_achievement = min(int(today_words_studied / daily_goal.words * 100), 100) if daily_goal.words > 0 else 0
 
-    # 최근 퀴즈 기록 가져오기
-    recent_quiz_attempts = QuizAttempt.objects.filter(
-        user=request.user,
-        completed_at__isnull=False
-    ).order_by('-completed_at')[:5]
-
-    context = {
-        'total_words_studied': total_words_studied,
-        'mastered_words': mastered_words,
-        'needs_review': needs_review,
-        'total_study_hours': total_study_hours,
-        'total_study_minutes': total_study_minutes,
-        'study_hours': hours,  # 시간 추가
-        'study_minutes': minutes,  # 분 추가
-        'daily_goal': daily_goal,
-        'daily_achievement': daily_achievement,
-        'today_words_studied': today_words_studied,
-        'weekly_labels': weekly_labels,
-        'weekly_counts': weekly_counts,
-        'monthly_labels': monthly_labels,
-        'monthly_counts': monthly_counts,
-        'accuracy_data': accuracy_data,
-        'recent_quiz_attempts': recent_quiz_attempts,
-        'any_weekly_data': any(weekly_counts),  # 주간 데이터 존재 여부
-        'any_monthly_data': any(monthly_counts),  # 월간 데이터 존재 여부
-    }
+    context = dict(
+        context,
+        daily_goal=daily_goal,
+        daily_achievement=daily_achievement,
+    )
     
     return render(request, 'study/statistics.html', context)
 
 @login_required
 def daily_words(request):
     """오늘의 단어 목록을 보여줍니다."""
-    # 사용자의 학습 계획 가져오기
-    study_plan = StudyPlan.objects.filter(user=request.user, is_active=True).first()
-    target_words_count = 10  # 기본값
-    
-    if study_plan:
-        target_words_count = study_plan.target_words_per_day
-    
     # 오늘 날짜 가져오기 (한국 시간 기준)
-    today = timezone.localtime().date()
-    
-    # 이미 학습한 단어 제외
-    learned_words = StudyProgress.objects.filter(
-        user=request.user,
-        review_count__gt=0
-    ).values_list('word_id', flat=True)
+    today = timezone.localdate()
     
-    # 오늘의 단어 가져오기 (날짜 기준으로 캐싱)
-    daily_words = Word.objects.filter(
-        daily_word_date=today
-    ).exclude(
-        id__in=learned_words
-    )[:target_words_count]
-    
-    # 오늘의 단어가 없거나 부족한 경우 새로 생성
-    if not daily_words or daily_words.count() < target_words_count:
-        # 이전 오늘의 단어 표시 제거
-        Word.objects.filter(daily_word_date=today).update(daily_word_date=None)
-        
-        # 새로운 단어 선택
-        new_words = Word.objects.exclude(
-            id__in=learned_words
-        ).order_by('?')[:target_words_count]
-        
-        # 선택된 단어들을 오늘의 단어로 표시
-        for word in new_words:
-            word.daily_word_date = today
-            word.save()
-        
-        daily_words = new_words
+    # build_daily_sets 명령이 미리 만든 사용자별 목록 (없으면 이 사용자 목록만 새로 만듦)
+    daily_words = get_daily_words(request.user, today)
     
     if not daily_words:
         messages.info(request, '모든 단어를 학습하셨습니다! 복습을 통해 단어 실력을 더욱 향상시켜보세요.')
@@ -364,17 +302,35 @@ def daily_words(request):
 @login_required
 def review_list(request):
     """복습 목록"""
-    # 복습이 필요한 단어들을 가져옵니다
-    review_schedules = ReviewSchedule.objects.filter(
-        user=request.user,
-        scheduled_date__lte=timezone.now(),
-        status='pending'
-    ).select_related('word').order_by('scheduled_date')
+    # 복습 시각이 지난 카드를 복습 대기열 인덱스에서 오래된 순서로 가져옵니다
+    review_schedules = next_due(request.user, limit=REVIEW_PAGE_SIZE)
 
     return render(request, 'study/review_list.html', {
         'review_schedules': review_schedules
     })
 
+@login_required
+def review_due_api(request):
+    """다음 복습 카드 N개 (JSON)"""
+    try:
+        limit = min(max(int(request.GET.get('limit', 20)), 1), REVIEW_PAGE_SIZE)
+    except ValueError:
+        limit = 20
+    now = timezone.now()
+    cards = next_due(request.user, limit=limit, now=now)
+    return JsonResponse({
+        'due_count': due_count(request.user, now=now),
+        'cards': [{
+            'word_id': card.word_id,
+            'english': card.word.english,
+            'korean': card.word.korean,
+            'due_at': card.due_at.isoformat(),
+            'interval_days': card.interval_days,
+            'ease_factor': round(card.ease_factor, 2),
+            'lapses': card.lapses,
+        } for card in cards]
+    })
+
 # 학습 계획 관련 뷰
 @login_required
 def study_plan_list(request):
@@ -432,37 +388,20 @@ def study_plan_detail(request, plan_id):
     """학습 계획 상세 보기"""
     plan = get_object_or_404(StudyPlan, id=plan_id, user=request.user)
     
-    # 오늘의 학습 현황 (한국 시간 기준)
-    current_time = timezone.localtime(timezone.now())
-    today = current_time.date()
-    today_start = timezone.make_aware(datetime.combine(today, datetime.min.time()))
-    today_end = timezone.make_aware(datetime.combine(today, datetime.max.time()))
-    
-    # 한국 시간대로 변환
-    today_start = timezone.localtime(today_start)
-    today_end = timezone.localtime(today_end)
+    # 오늘의 학습 현황 (한국 시간 기준, 일일 통계에서 조회)
+    today_stats = get_today_stats(request.user)
     
     # 오늘 학습한 단어 수
-    today_progress = StudyProgress.objects.filter(
-        user=request.user,
-        last_reviewed__range=(today_start, today_end),
-        review_count__gt=0
-    ).count()
+    today_progress = today_stats.words_studied
     
     # 사용자의 일일 목표
     daily_goal = getattr(request.user.profile, 'daily_goal', 20)  # 기본값 20
     
-    # 오늘의 학습 시간 계산
-    daily_study_time = StudySession.objects.filter(
-        user=request.user,
-        start_time__range=(today_start, today_end)
-    ).aggregate(total=Sum('daily_study_minutes'))['total'] or 0
+    # 오늘의 학습 시간
+    daily_study_time = today_stats.study_minutes
     
-    # 전체 학습 시간 계산
-    total_study_time = StudySession.objects.filter(
-        user=request.user,
-        end_time__isnull=False
-    ).aggregate(total=Sum('study_minutes'))['total'] or 0
+    # 전체 학습 시간
+    total_study_time = get_total_stats(request.user)['study_minutes']
     
     return render(request, 'study/plan_detail.html', {
         'plan': plan,
@@ -557,12 +496,15 @@ def study_session_end(request, session_id):
         
         end_time = timezone.now()
         elapsed_minutes = (end_time - session.start_time).total_seconds() / 60
+        previous_minutes = session.study_minutes
         
-        # study_minutes와 daily_study_minutes 모두 업데이트
+        # study_minutes와 daily_study_minutes 모두 업데이트 (경과 시간으로 확정하므로 하트비트 버퍼는 버림)
+        discard_heartbeats(session.id)
         session.study_minutes = round(elapsed_minutes, 2)
         session.daily_study_minutes = round(elapsed_minutes, 2)
         session.end_time = end_time
         session.save()
+        record_study_minutes(request.user, session, session.study_minutes - previous_minutes)
         
         # 학습 시간 메시지 표시
         minutes = int(elapsed_minutes)
@@ -593,10 +535,17 @@ def study_session_save_time(request):
             ).first()
             
             if session:
+                previous_minutes = session.study_minutes
                 # study_minutes와 daily_study_minutes 모두 업데이트
                 session.study_minutes = minutes
                 session.daily_study_minutes = minutes
                 session.save()
+                record_study_minutes(request.user, session, float(minutes) - previous_minutes)
+                STUDY_TIME_HEARTBEATS.inc(result='saved')
+                if float(minutes) > previous_minutes:
+                    STUDY_MINUTES.inc(float(minutes) - previous_minutes)
+            else:
+                STUDY_TIME_HEARTBEATS.inc(result='missing_session')
             
             return JsonResponse({
                 'success': True,
@@ -605,6 +554,7 @@ def study_session_save_time(request):
             
         except Exception as e:
             print(f"[ERROR] 세션 저장 실패: {str(e)}")
+            STUDY_TIME_HEARTBEATS.inc(result='error')
             return JsonResponse({'success': False, 'error': str(e)}, status=400)
             
     return JsonResponse({'success': False, 'error': 'Invalid request method'}, status=405)
@@ -623,9 +573,7 @@ def flashcard_study(request, plan_id):
     ).values_list('word_id', flat=True)
     
     # 학습할 단어 가져오기
-    study_words = Word.objects.exclude(
-        id__in=learned_words
-    ).order_by('?')[:plan.target_words_per_day]
+    study_words = Word.objects.sample(plan.target_words_per_day, exclude_ids=learned_words)
     
     # 학습 세션 생성
     session = StudySession.objects.create(
@@ -776,6 +724,7 @@ def word_progress_update(request, word_id):
         # StudyProgress 생성 또는 업데이트
         try:
             progress = StudyProgress.objects.get(user=request.user, word=word)
+            before = progress_snapshot(progress)
             old_review_count = progress.review_count
             if proficiency == 5:
                 progress.proficiency = 5
@@ -784,10 +733,14 @@ def word_progress_update(request, word_id):
             progress.review_count += 1
             progress.study_session = study_session
             progress.last_reviewed = current_time
+            # 다음 복습 시각은 SRS 스케줄러가 숙련도(복습 품질)로 계산
+            apply_review(progress, proficiency, current_time)
             progress.save()
+            WORD_PROGRESS_UPDATES.inc(kind='review')
             print(f"[DEBUG] 기존 진도 업데이트: ID {progress.id}, 복습 횟수 {old_review_count} -> {progress.review_count}")
         except StudyProgress.DoesNotExist:
-            progress = StudyProgress.objects.create(
+            before = None
+            progress = StudyProgress(
                 user=request.user,
                 word=word,
                 proficiency=proficiency,
@@ -795,52 +748,16 @@ def word_progress_update(request, word_id):
                 last_reviewed=current_time,
                 review_count=1
             )
+            apply_review(progress, proficiency, current_time)
+            progress.save()
+            WORD_PROGRESS_UPDATES.inc(kind='new')
             print(f"[DEBUG] 새로운 진도 생성: ID {progress.id}, 복습 횟수 1")
         
-        # 다음 복습 일정 설정
-        next_review = current_time.date()
-        if int(proficiency) < 3:
-            next_review += timedelta(days=1)
-        elif int(proficiency) == 3:
-            next_review += timedelta(days=3)
-        elif int(proficiency) == 4:
-            next_review += timedelta(days=7)
-        else:
-            next_review += timedelta(days=14)
+        print(f"[DEBUG] 다음 복습 시각: {progress.due_at} (간격 {progress.interval_days}일)")
         
-        progress.next_review_date = next_review
-        progress.save()
-        print(f"[DEBUG] 다음 복습 일정 설정: {next_review}")
-        
-        ReviewSchedule.objects.create(
-            user=request.user,
-            word=word,
-            scheduled_date=next_review
-        )
-        print(f"[DEBUG] 복습 일정 생성됨: {next_review}")
-        
-        # 오늘의 학습 현황 확인 (한국 시간 기준)
-        today = current_time.date()
-        today_start = timezone.make_aware(datetime.combine(today, datetime.min.time()))
-        today_end = timezone.make_aware(datetime.combine(today, datetime.max.time()))
+        # 일일 학습 통계 갱신
+        record_progress(request.user, before, progress)
         
-        # 한국 시간대로 변환
-        today_start = timezone.localtime(today_start)
-        today_end = timezone.localtime(today_end)
-        
-        today_progress = StudyProgress.objects.filter(
-            user=request.user,
-            last_reviewed__range=(today_start, today_end),
-            review_count__gt=0
-        ).count()
-        print(f"[DEBUG] 오늘의 학습 현황: {today_progress}개")
-        
-        # 전체 학습 현황 확인
-        total_studied = StudyProgress.objects.filter(
-            user=request.user,
-            review_count__gt=0
-        ).count()
-        print(f"[DEBUG] 전체 학습 현황: {total_studied}개")
         print("=== 단어 학습 진도 업데이트 완료 ===\n")
         
         messages.success(request, f"{word.english} 단어를 학습했습니다!")
@@ -900,10 +817,8 @@ def bookmark_toggle(request, word_id):
 # 복습 일정 관련 뷰
 @login_required
 def review_schedule_list(request):
-    schedules = ReviewSchedule.objects.filter(
-        user=request.user,
-        status='pending'
-    ).select_related('word')
+    # 단어마다 한 행인 복습 대기열을 다음 복습 시각 순서로 보여준다
+    schedules = upcoming(request.user)
     return render(request, 'study/schedule_list.html', {'schedules': schedules})
 
 @login_required
@@ -1024,29 +939,33 @@ def review_start(request, word_id):
 
 def text_to_speech(request):
     """텍스트를 음성으로 변환하여 반환합니다."""
-    text = request.GET.get('text', '')
-    if not text:
+    text = request.GET.get('text', '').strip()
+    lang = request.GET.get('lang', 'en')
+    if not text or len(text) > MAX_TEXT_LENGTH or lang not in ('en', 'ko'):
         return HttpResponse(status=400)
     
-    # 음성 파일 저장 경로
-    audio_dir = os.path.join(settings.MEDIA_ROOT, 'audio')
-    if not os.path.exists(audio_dir):
-        os.makedirs(audio_dir)
-    
-    # 파일명 생성 (텍스트의 처음 10글자 사용)
-    filename = f"{text[:10]}.mp3"
-    filepath = os.path.join(audio_dir, filename)
-    
-    # 이미 파일이 존재하면 재사용
-    if not os.path.exists(filepath):
-        tts = gTTS(text=text, lang='en')
-        tts.save(filepath)
+    # 이미 만들어진 파일은 합성 대기 없이 바로 반환
+    path = audio_store.lookup(text, lang)
+    if path is None:
+        try:
+            with TTS_SYNTHESIS_SECONDS.time():
+                path = audio_store.get_or_create(text, lang)
+        except Exception as e:
+            logger.warning(f"음성 파일 생성 실패: {e}")
+            TTS_REQUESTS.inc(result='error')
+            return HttpResponse(status=503)
+        TTS_REQUESTS.inc(result='miss')
+    else:
+        TTS_REQUESTS.inc(result='hit')
     
-    # 오디오 파일을 직접 반환
-    with open(filepath, 'rb') as f:
-        response = HttpResponse(f.read(), content_type='audio/mpeg')
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        return response
+    return audio_response(request, path, audio_key(text, lang))
+
+def metrics(request):
+    """Prometheus 수집용 지표 (METRICS_ALLOWED_IPS 에서 오거나 관리자만)"""
+    allowed = request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS
+    if not allowed and not request.user.is_staff:
+        return HttpResponse(status=403)
+    return HttpResponse(metrics_registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
 
 def word_detail(request, word_id):
     word = get_object_or_404(Word, id=word_id)
@@ -1076,39 +995,27 @@ def study_stats_api(request, plan_id):
     today_start = timezone.localtime(today_start)
     today_end = timezone.localtime(today_end)
     
-    # 오늘의 학습 시간 계산 (종료된 세션 + 현재 진행 중인 세션)
-    completed_sessions_time = StudySession.objects.filter(
-        user=request.user,
-        start_time__range=(today_start, today_end),
-        end_time__isnull=False
-    ).aggregate(total=Sum('daily_study_minutes'))['total'] or 0
+    today_stats = get_today_stats(request.user, today)
+    
+    # 오늘의 학습 시간 계산 (일일 통계 + 현재 진행 중인 세션의 경과 시간)
+    daily_study_time = today_stats.study_minutes
     
-    # 현재 진행 중인 세션의 시간 계산
+    # 현재 진행 중인 세션은 마지막으로 저장된 시간 대신 실제 경과 시간을 사용
     active_session = StudySession.objects.filter(
         user=request.user,
         start_time__range=(today_start, today_end),
         end_time__isnull=True
     ).first()
     
-    active_session_time = 0
     if active_session:
         elapsed_minutes = (timezone.now() - active_session.start_time).total_seconds() / 60
-        active_session_time = round(elapsed_minutes, 2)
+        daily_study_time += round(elapsed_minutes, 2) - active_session.study_minutes
     
-    daily_study_time = completed_sessions_time + active_session_time
+    # 전체 학습 시간
+    total_study_time = get_total_stats(request.user)['study_minutes']
     
-    # 전체 학습 시간 계산
-    total_study_time = StudySession.objects.filter(
-        user=request.user,
-        end_time__isnull=False
-    ).aggregate(total=Sum('study_minutes'))['total'] or 0
-    
-    # 오늘 학습한 단어 수 계산
-    today_progress = StudyProgress.objects.filter(
-        user=request.user,
-        last_reviewed__date=today,
-        review_count__gt=0
-    ).count()
+    # 오늘 학습한 단어 수
+    today_progress = today_stats.words_studied
     
     return JsonResponse({
         'status': 'success',
@@ -1130,89 +1037,40 @@ def level_test_start(request):
         messages.info(request, '이미 진행 중인 테스트가 있습니다.')
         return redirect('study:level_test_continue')
 
-    # 각 난이도별로 20개씩 단어 선택
-    easy_words = list(Word.objects.filter(difficulty='easy').order_by('?')[:20])
-    medium_words = list(Word.objects.filter(difficulty='medium').order_by('?')[:20])
-    hard_words = list(Word.objects.filter(difficulty='hard').order_by('?')[:20])
-
-    # 테스트 생성
-    test = LevelTest.objects.create(
-        title=f"{request.user.username}의 레벨 테스트",
-        description="사용자 레벨을 측정하기 위한 테스트입니다."
-    )
-
-    # 모든 단어를 합치고 섞기
-    all_words = easy_words + medium_words + hard_words
-    shuffle(all_words)
-
-    # 각 단어에 대한 문제 생성
-    for word in all_words:
-        # 보기 생성 (현재 단어의 난이도에서 3개 추가 선택)
-        options = list(Word.objects.filter(
-            difficulty=word.difficulty
-        ).exclude(
-            id=word.id
-        ).values_list('korean', flat=True).order_by('?')[:3])
-        options.append(word.korean)
-        shuffle(options)
-
-        TestQuestion.objects.create(
-            test=test,
-            question_type='multiple_choice',
-            word=word,
-            question_text=f"다음 단어의 뜻으로 알맞은 것은? - {word.english}",
-            correct_answer=word.korean,
-            options=options,
-            points=1
-        )
-
-    # 테스트 결과 초기 생성
-    UserTestResult.objects.create(
-        user=request.user,
-        test=test,
-        score=0,
-        level=1,
-        answers={}
-    )
+    # 문제 은행에서 난이도별 20문제를 뽑아 테스트 생성 (문제 행은 한 번에 복사)
+    test = create_level_test(request.user)
+    if test is None:
+        # 다른 화면으로 보내면 레벨 테스트 미들웨어가 다시 이곳으로 보낸다
+        return HttpResponse('레벨 테스트 문제를 준비하지 못했습니다. 잠시 후 다시 시도해주세요.', status=503)
 
     return redirect('study:level_test_question', test_id=test.id, question_number=1)
 
 @login_required
 def level_test_question(request, test_id, question_number):
-    """레벨 테스트 문제 풀기"""
-    test = get_object_or_404(LevelTest, id=test_id)
-    questions = test.questions.all()
-    
-    if question_number > questions.count():
+    """레벨 테스트 문제 풀기 - 진행 상황은 세션에 두고 답안마다 해당 문제만 갱신"""
+    run = LevelTestRun.load(request, test_id)
+    if run is None or question_number < 1:
+        raise Http404
+
+    if question_number > run.total:
         return redirect('study:level_test_complete', test_id=test_id)
 
-    question = questions[question_number - 1]
-    
+    question = run.question(question_number)
+
     if request.method == 'POST':
         answer = request.POST.get('answer')
-        
-        # 답변 저장
-        test_result = UserTestResult.objects.get(user=request.user, test=test)
-        answers = test_result.answers
-        answers[str(question_number)] = {
-            'word_id': question.word.id,
-            'answer': answer,
-            'correct': answer == question.correct_answer,
-            'difficulty': question.word.difficulty
-        }
-        test_result.answers = answers
-        test_result.save()
-
+        if answer is None:
+            return redirect('study:level_test_question', test_id=test_id, question_number=question_number)
+        run.record(question_number, answer)
         return redirect('study:level_test_question', test_id=test_id, question_number=question_number + 1)
 
     # 진행률 계산
-    progress = (question_number / questions.count()) * 100
+    progress = (question_number / run.total) * 100
 
     return render(request, 'study/level_test_question.html', {
-        'test': test,
         'question': question,
         'question_number': question_number,
-        'total_questions': questions.count(),
+        'total_questions': run.total,
         'options': question.options,
         'progress': progress
     })
@@ -1220,56 +1078,20 @@ def level_test_question(request, test_id, question_number):
 @login_required
 def level_test_complete(request, test_id):
     """레벨 테스트 완료 및 결과 계산"""
-    test = get_object_or_404(LevelTest, id=test_id)
-    result = get_object_or_404(UserTestResult, user=request.user, test=test)
-
-    # 난이도별 정답률 계산
-    difficulty_scores = {
-        'easy': {'correct': 0, 'total': 0},
-        'medium': {'correct': 0, 'total': 0},
-        'hard': {'correct': 0, 'total': 0}
-    }
+    run = LevelTestRun.load(request, test_id)
+    if run is None:
+        raise Http404
 
-    for answer in result.answers.values():
-        difficulty = answer['difficulty']
-        difficulty_scores[difficulty]['total'] += 1
-        if answer['correct']:
-            difficulty_scores[difficulty]['correct'] += 1
-
-    # 각 난이도의 정답률 계산
-    accuracy_rates = {}
-    for difficulty, scores in difficulty_scores.items():
-        if scores['total'] > 0:
-            accuracy_rates[difficulty] = (scores['correct'] / scores['total']) * 100
-        else:
-            accuracy_rates[difficulty] = 0
-
-    # 레벨 결정
-    if accuracy_rates['hard'] >= 70:
-        level = 5  # 고급
-        difficulty = 'hard'
-    elif accuracy_rates['hard'] >= 50:
-        level = 4  # 중상급
-        difficulty = 'hard'
-    elif accuracy_rates['medium'] >= 70:
-        level = 3  # 중급
-        difficulty = 'medium'
-    elif accuracy_rates['medium'] >= 50:
-        level = 2  # 초급
-        difficulty = 'easy'
-    else:
-        level = 1  # 기초
-        difficulty = 'easy'
+    # 답하지 않은 문제가 있으면 (직접 주소로 들어온 경우 등) 그 문제로 돌려보낸다
+    unanswered = run.first_unanswered()
+    if unanswered is not None:
+        messages.info(request, '아직 답하지 않은 문제가 있습니다.')
+        return redirect('study:level_test_question', test_id=test_id, question_number=unanswered)
 
-    # 총점 계산
-    total_correct = sum(scores['correct'] for scores in difficulty_scores.values())
-    total_questions = sum(scores['total'] for scores in difficulty_scores.values())
-    score = int((total_correct / total_questions) * 100)
-
-    # 결과 저장
-    result.score = score
-    result.level = level
-    result.save()
+    # 답안마다 모아 둔 난이도별 집계로 레벨을 정하고 결과를 한 번에 저장
+    score, level, difficulty, accuracy_rates, total_correct, total_questions = run.finish()
+    # 결과 화면용 (저장은 finish 가 했다)
+    result = UserTestResult(user=request.user, test_id=test_id, score=score, level=level)
 
     # 사용자 레벨 업데이트
     UserLevel.objects.update_or_create(
@@ -1377,38 +1199,44 @@ def study_complete(request, word_id):
         user=request.user,
         word=word
     )[0]
+    before = progress_snapshot(progress)
     
     # 학습 완료 처리
     progress.review_count += 1
     progress.last_reviewed = timezone.now()
     progress.save()
+    record_progress(request.user, before, progress)
     
     # 포인트 지급
     request.user.profile.add_points(5, "단어 학습 완료")
     
-    # 연속 학습일 체크
-    check_streak(request.user)
+    # 연속 학습일은 record_progress 에서 함께 갱신된다
     
     return JsonResponse({'status': 'success'})
 
 @login_required
 def friend_list(request):
     """친구 목록 페이지"""
-    # 친구 목록 가져오기 (양쪽 모두 확인)
-    friendships = Friendship.objects.filter(
-        models.Q(user1=request.user) | models.Q(user2=request.user)
-    ).select_related('user1', 'user2')
-    
-    # 친구 목록을 (친구, 관계) 튜플의 리스트로 변환
-    friends_list = []
-    for friendship in friendships:
-        # 현재 사용자가 user1인 경우 user2가 친구
-        if friendship.user1 == request.user:
-            friend = friendship.user2
-        # 현재 사용자가 user2인 경우 user1이 친구
-        else:
-            friend = friendship.user1
-        friends_list.append((friend, friendship))
+    def compute_friends_list():
+        # 친구 목록 가져오기 (양쪽 모두 확인, 친구의 프로필까지 함께 조회)
+        friendships = Friendship.objects.filter(
+            models.Q(user1=request.user) | models.Q(user2=request.user)
+        ).select_related('user1__profile', 'user2__profile')
+        
+        # 친구 목록을 (친구, 관계) 튜플의 리스트로 변환
+        friends_list = []
+        for friendship in friendships:
+            # 현재 사용자가 user1인 경우 user2가 친구
+            if friendship.user1_id == request.user.id:
+                friend = friendship.user2
+            # 현재 사용자가 user2인 경우 user1이 친구
+            else:
+                friend = friendship.user1
+            friends_list.append((friend, friendship))
+        return friends_list
+    
+    # 친구의 레벨/포인트는 자주 바뀌므로 짧게 캐시 (친구 관계 변경 시에는 즉시 무효화)
+    friends_list = get_user_fragment(request.user, 'friend_list', compute_friends_list, timeout=60)
     
     # 받은 친구 요청 가져오기
     received_requests = FriendRequest.objects.filter(
@@ -1603,49 +1431,27 @@ def friend_wordbook(request, friend_id):
 @login_required
 def daily_mission(request):
     """데일리 미션 뷰"""
-    today = timezone.now().date()
+    today = timezone.localdate()
     
-    # 오늘의 데일리 미션 가져오기
+    # 오늘의 데일리 미션 가져오기 (run_jobs 의 daily_missions 작업이 보기까지 미리 만들어 둠)
     daily_mission = DailyMission.objects.filter(
         user=request.user,
         date=today
     ).first()
     
     if not daily_mission:
-        # 북마크된 단어가 있는지 확인
-        bookmarked_words = Word.objects.filter(
-            bookmarks__user=request.user
-        ).distinct()
+        # 미리 만든 미션이 없으면 이 사용자 미션만 만든다 (북마크한 단어가 5개 이상일 때)
+        with DAILY_GENERATION_SECONDS.time(kind='daily_mission'):
+            build_daily_missions(today, users=User.objects.filter(pk=request.user.pk))
+        daily_mission = DailyMission.objects.filter(user=request.user, date=today).first()
         
-        if bookmarked_words.count() < 5:
+        if not daily_mission:
             messages.warning(request, '북마크된 단어가 5개 미만입니다. 더 많은 단어를 북마크해주세요.')
             return redirect('accounts:home')
-        
-        # 새로운 데일리 미션 생성
-        daily_mission = DailyMission.objects.create(
-            user=request.user,
-            date=today,
-            is_completed=False
-        )
-        
-        # 북마크된 단어들 중에서 무작위로 5개 선택
-        mission_words = bookmarked_words.order_by('?')[:5]
-        daily_mission.words.add(*mission_words)
-    
-    # 데일리 미션의 단어들 가져오기
-    mission_words = daily_mission.words.all()
-    
-    # 각 단어에 대한 보기 생성
-    word_choices = []
-    for word in mission_words:
-        # 해당 단어를 제외한 다른 단어들 중에서 3개를 무작위로 선택
-        other_words = Word.objects.exclude(id=word.id).order_by('?')[:3]
-        choices = list(other_words) + [word]
-        random.shuffle(choices)
-        word_choices.append({
-            'word': word,
-            'choices': choices
-        })
+    
+    # 데일리 미션의 단어들과 저장된 보기
+    mission_words = list(daily_mission.words.all())
+    word_choices = mission_choices(daily_mission, mission_words)
     
     context = {
         'daily_mission': daily_mission,
@@ -1815,46 +1621,34 @@ def daily_mission_modal_shown(request):
     return JsonResponse({'status': 'error'}, status=400)
 
 @login_required
+@require_POST
 def save_study_time(request):
+    """학습 시간 하트비트 - 캐시 버퍼에 모았다가 주기적으로/마지막 하트비트(final)에서만 DB 에 쓴다"""
+    data = request.POST
+    if request.content_type == 'application/json':
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            data = {}
     try:
-        session_id = request.POST.get('session_id')
-        study_time = float(request.POST.get('study_time', 0))
-        
-        print(f"\n=== save_study_time 디버깅 ===")
-        print(f"세션 ID: {session_id}")
-        print(f"학습 시간(초): {study_time}")
-        
-        session = StudySession.objects.get(id=session_id, user=request.user)
-        
-        # 초를 분으로 변환하고 소수점 둘째 자리까지 반올림
-        minutes = round(study_time / 60, 2)
-        
-        # study_minutes와 daily_study_minutes 모두 업데이트
-        session.study_minutes = minutes
-        session.daily_study_minutes = minutes
-        session.save()
-        
-        print(f"저장된 학습 시간(분): {minutes}")
-        print(f"study_minutes: {session.study_minutes}")
-        print(f"daily_study_minutes: {session.daily_study_minutes}")
-        
-        # 총 학습 시간 계산
-        total_study_time = StudySession.objects.filter(
-            user=request.user,
-            end_time__isnull=False
-        ).aggregate(total=Sum('study_minutes'))['total'] or 0
-        
-        print(f"총 누적 학습 시간: {total_study_time}분")
-        print("=== save_study_time 디버깅 완료 ===\n")
-        
-        return JsonResponse({
-            'status': 'success',
-            'total_study_time': round(total_study_time, 2)
-        })
+        session_id = int(data.get('session_id'))
+        study_time = float(data.get('study_time', 0))
+    except (TypeError, ValueError):
+        STUDY_TIME_HEARTBEATS.inc(result='error')
+        return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'})
+    final = str(data.get('final', '')).lower() in ('1', 'true')
+
+    try:
+        result = record_heartbeat(request.user, session_id, study_time, final=final)
     except StudySession.DoesNotExist:
+        STUDY_TIME_HEARTBEATS.inc(result='missing_session')
         return JsonResponse({'status': 'error', 'message': '세션을 찾을 수 없습니다.'})
-    except Exception as e:
-        return JsonResponse({'status': 'error', 'message': str(e)})
+
+    STUDY_TIME_HEARTBEATS.inc(result='flushed' if result.flushed else 'buffered')
+    return JsonResponse({
+        'status': 'success',
+        'total_study_time': round(result.total_minutes, 2)
+    })
 
 @login_required
 def reset_today_sessions(request):
@@ -1869,14 +1663,17 @@ def reset_today_sessions(request):
     )
     
     for session in today_sessions:
+        discard_heartbeats(session.id)
         end_time = timezone.now()
         elapsed_minutes = (end_time - session.start_time).total_seconds() / 60
+        previous_minutes = session.study_minutes
         
         # study_minutes와 daily_study_minutes 모두 업데이트
         session.study_minutes = round(elapsed_minutes, 2)
         session.daily_study_minutes = round(elapsed_minutes, 2)
         session.end_time = end_time
         session.save()
+        record_study_minutes(request.user, session, session.study_minutes - previous_minutes)
     
     messages.success(request, f'오늘의 {today_sessions.count()}개의 학습 세션이 초기화되었습니다.')
     return redirect('study:home')
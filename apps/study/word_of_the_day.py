@@ -0,0 +1,132 @@
+"""오늘의 단어
+
+날짜(TIME_ZONE, Asia/Seoul 기준)를 해시한 값으로 id 순으로 정렬한 단어 id 배열의 위치를
+골라, 모든 워커가 DB 에 쓰지 않고 같은 날 같은 단어를 고른다. 고른 단어 id 는 캐시에
+자정까지, 단어 객체는 프로세스 메모리에 보관하므로 하루에 한 번만 고르고 이후 요청은
+쿼리 없이 끝난다.
+
+id 배열은 Word 저장/삭제 시 signals 에서 ``invalidate()`` 로 버전을 올려 다음 선택 때
+다시 적재한다. 그날 이미 고른 단어는 단어가 추가되어도 바뀌지 않고, 고른 단어가 삭제되면
+그때 다시 고른다. 다른 워커 프로세스에서 수정된 단어 내용은 ``MAX_AGE`` 후 반영된다.
+"""
+import hashlib
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.vocabulary.models import Word
+
+from .metrics import DAILY_GENERATION_SECONDS
+
+OTHER_DAY_TIMEOUT = 60 * 60 * 24  # 오늘이 아닌 날짜를 조회한 경우 (초)
+
+Choice = namedtuple('Choice', ['date', 'word', 'loaded_at'])
+
+
+def cache_key(day):
+    return f'word_of_the_day:{day.isoformat()}'
+
+
+def seconds_until_midnight(now=None):
+    """현재 시간대(TIME_ZONE) 기준 다음 자정까지 남은 초"""
+    now = timezone.localtime(now)
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=now.tzinfo)
+    return max(1, int((midnight - now).total_seconds()))
+
+
+def day_index(day, size):
+    """날짜별로 고정된 0 이상 size 미만의 위치"""
+    digest = hashlib.sha256(f'word-of-the-day:{day.isoformat()}'.encode()).digest()
+    return int.from_bytes(digest[:8], 'big') % size
+
+
+class WordOfTheDay:
+    """날짜 해시로 고른 오늘의 단어를 캐시와 프로세스 메모리에 보관"""
+
+    MAX_AGE = 600  # 초
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._loaded_version = None
+        self._loaded_at = 0.0
+        self._ids = ()
+        self._choice = None
+
+    def invalidate(self):
+        """단어 변경 시 호출 - 다음 선택 때 id 배열을 다시 만든다."""
+        with self._lock:
+            self._version += 1
+
+    def forget(self, word_id, deleted=False):
+        """오늘의 단어로 보관 중인 단어가 수정/삭제되면 다음 요청에서 다시 읽는다."""
+        choice = self._choice
+        if choice is None or choice.word.pk != word_id:
+            return
+        self._choice = None
+        if deleted:
+            cache.delete(cache_key(choice.date))
+
+    def _is_fresh(self):
+        return (
+            self._loaded_version == self._version
+            and time.monotonic() - self._loaded_at < self.MAX_AGE
+        )
+
+    def _word_ids(self):
+        if self._is_fresh():
+            return self._ids
+        with self._lock:
+            if not self._is_fresh():
+                version = self._version
+                self._ids = tuple(Word.objects.order_by('id').values_list('id', flat=True))
+                self._loaded_version = version
+                self._loaded_at = time.monotonic()
+            return self._ids
+
+    def pick_id(self, day):
+        """day 의 단어 id - 같은 단어 목록이면 어느 프로세스에서도 같은 값 (단어가 없으면 None)"""
+        ids = self._word_ids()
+        if not ids:
+            return None
+        return ids[day_index(day, len(ids))]
+
+    def get(self, day=None):
+        """오늘(또는 day)의 단어 - 단어가 하나도 없으면 None"""
+        day = day or timezone.localdate()
+        choice = self._choice
+        if choice is not None and choice.date == day and time.monotonic() - choice.loaded_at < self.MAX_AGE:
+            return choice.word
+
+        word = self._load(day)
+        if word is not None:
+            self._choice = Choice(day, word, time.monotonic())
+        return word
+
+    def _load(self, day):
+        key = cache_key(day)
+        word_id = cache.get(key)
+        if word_id is not None:
+            word = Word.objects.filter(pk=word_id).first()
+            if word is not None:
+                return word
+
+        with DAILY_GENERATION_SECONDS.time(kind='word_of_the_day'):
+            picked = self.pick_id(day)
+            if picked is None:
+                return None
+            timeout = seconds_until_midnight() if day == timezone.localdate() else OTHER_DAY_TIMEOUT
+            if word_id is not None:
+                # 캐시에 있던 단어가 삭제됨
+                cache.set(key, picked, timeout)
+            elif not cache.add(key, picked, timeout):
+                # 단어 목록이 다른 프로세스가 먼저 골랐으면 그 단어를 따른다
+                picked = cache.get(key, picked)
+            return Word.objects.filter(pk=picked).first()
+
+
+word_of_the_day = WordOfTheDay()
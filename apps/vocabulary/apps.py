@@ -5,3 +5,6 @@ class VocabularyConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.vocabulary'
     verbose_name = '단어장 관리'
+
+    def ready(self):
+        import apps.vocabulary.signals
@@ -0,0 +1,77 @@
+"""영어/한글 뜻 -> 단어 id 조회용 인메모리 사전
+
+정규화한 영어 키(Word.english_key)와 한글 뜻 문자열을 단어 id 로 바로 찾는다.
+Word 저장/삭제 시 signals 에서 ``invalidate()`` 로 버전을 올리고, 다음 조회 때
+한 번의 쿼리로 다시 적재한다. 다른 워커 프로세스의 변경은 ``MAX_AGE`` 후 반영된다.
+"""
+import threading
+import time
+
+from .models import Word, normalize_english
+
+
+def normalize_korean(korean):
+    return ' '.join((korean or '').split())
+
+
+class WordLookup:
+    """english_key -> id, korean -> id 사전"""
+
+    MAX_AGE = 600  # 초
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._loaded_version = None
+        self._loaded_at = 0.0
+        self._state = ({}, {})
+
+    def invalidate(self):
+        """단어 변경 시 호출 - 다음 조회 때 사전을 다시 만든다."""
+        with self._lock:
+            self._version += 1
+
+    def _is_fresh(self):
+        return (
+            self._loaded_version == self._version
+            and time.monotonic() - self._loaded_at < self.MAX_AGE
+        )
+
+    def _ensure_loaded(self):
+        if self._is_fresh():
+            return self._state
+        with self._lock:
+            if self._is_fresh():
+                return self._state
+            version = self._version
+            by_english = {}
+            by_korean = {}
+            rows = Word.objects.order_by('id').values_list('id', 'english', 'korean')
+            for word_id, english, korean in rows:
+                # 같은 키가 여러 단어에 있으면 먼저 등록된(id 가 작은) 단어를 사용
+                by_english.setdefault(normalize_english(english), word_id)
+                by_korean.setdefault(normalize_korean(korean), word_id)
+            self._state = (by_english, by_korean)
+            self._loaded_version = version
+            self._loaded_at = time.monotonic()
+            return self._state
+
+    def english_ids(self):
+        """{english_key: id} 복사본 (가져오기 명령에서 기존 단어 확인용)"""
+        return dict(self._ensure_loaded()[0])
+
+    def find_by_english(self, english):
+        return self._ensure_loaded()[0].get(normalize_english(english))
+
+    def find_by_korean(self, korean):
+        return self._ensure_loaded()[1].get(normalize_korean(korean))
+
+    def find(self, text):
+        """영어 단어 또는 한글 뜻과 정확히 일치하는 단어 id (없으면 None)"""
+        word_id = self.find_by_english(text)
+        if word_id is None:
+            word_id = self.find_by_korean(text)
+        return word_id
+
+
+word_lookup = WordLookup()
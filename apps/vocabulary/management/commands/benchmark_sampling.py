@@ -0,0 +1,73 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.vocabulary.models import Word
+
+
+class Command(BaseCommand):
+    help = "무작위 단어 선택 방식(order_by('?') vs Word.objects.sample)의 성능을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+            help='비교할 단어 테이블 크기 목록'
+        )
+        parser.add_argument('--pick', type=int, default=15, help='한 번에 뽑을 단어 수')
+        parser.add_argument('--repeat', type=int, default=20, help='측정 반복 횟수')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        pick = options['pick']
+        repeat = options['repeat']
+
+        # 측정용 단어는 트랜잭션 안에서만 만들고 끝나면 롤백한다
+        with transaction.atomic():
+            for size in sorted(options['sizes']):
+                self._fill_to(size, rng)
+                easy = Word.objects.filter(difficulty='easy')
+
+                cases = [
+                    ("order_by('?')", lambda: list(Word.objects.order_by('?')[:pick])),
+                    ('sample()', lambda: Word.objects.sample(pick, rng=rng)),
+                    ("filtered order_by('?')", lambda: list(easy.order_by('?')[:pick])),
+                    ('filtered sample()', lambda: easy.sample(pick, rng=rng)),
+                ]
+                self.stdout.write(f'\n[{Word.objects.count()} words, pick {pick}]')
+                for label, func in cases:
+                    elapsed = self._measure(func, repeat)
+                    self.stdout.write(f'  {label:<24} median {elapsed:8.2f} ms')
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('\n벤치마크가 완료되었습니다. (생성한 단어는 롤백됨)'))
+
+    def _fill_to(self, size, rng):
+        current = Word.objects.count()
+        if current >= size:
+            return
+        difficulties = [choice for choice, _ in Word.DIFFICULTY_CHOICES]
+        parts = [choice for choice, _ in Word.PART_OF_SPEECH_CHOICES]
+        Word.objects.bulk_create(
+            (
+                Word(
+                    english=f'benchword{i}',
+                    english_key=f'benchword{i}',
+                    korean=f'벤치마크 단어 {i}',
+                    difficulty=rng.choice(difficulties),
+                    part_of_speech=rng.choice(parts),
+                )
+                for i in range(current, size)
+            ),
+            batch_size=2000,
+        )
+
+    def _measure(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
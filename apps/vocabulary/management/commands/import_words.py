@@ -1,44 +1,178 @@
 import csv
-from django.core.management.base import BaseCommand
-from apps.vocabulary.models import Word
-from django.utils.timezone import make_aware
-from datetime import datetime
+import itertools
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from apps.vocabulary.lookup import word_lookup
+from apps.vocabulary.models import Word, normalize_english
+from apps.vocabulary.search import word_search_index
+from apps.quiz.distractors import distractor_pool
+
+# CSV 컬럼 -> Word 필드
+FIELDS = ['english', 'korean', 'part_of_speech', 'difficulty', 'example_sentence', 'example_translation']
+UPDATE_FIELDS = ['korean', 'part_of_speech', 'difficulty', 'example_sentence', 'example_translation', 'updated_at']
+
 
 class Command(BaseCommand):
-    help = 'CSV 파일에서 단어를 가져옵니다.'
+    help = 'CSV 파일에서 단어를 가져옵니다. (청크 단위 bulk_create/bulk_update)'
 
     def add_arguments(self, parser):
         parser.add_argument('csv_file', type=str, help='가져올 CSV 파일의 경로')
+        parser.add_argument(
+            '--upsert', action='store_true',
+            help='이미 있는 단어(영어 기준)의 뜻/품사/난이도/예문을 CSV 값으로 갱신'
+        )
+        parser.add_argument('--dry-run', action='store_true', help='DB 에 쓰지 않고 결과만 집계')
+        parser.add_argument('--batch-size', type=int, default=2000, help='한 트랜잭션에서 처리할 행 수')
+        parser.add_argument('--encoding', default='utf-8-sig')
 
     def handle(self, *args, **options):
-        csv_file_path = options['csv_file']
-        
-        with open(csv_file_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            words_created = 0
-            
-            for row in reader:
-                # created_at과 updated_at 필드를 datetime 객체로 변환
-                created_at = make_aware(datetime.strptime(row['created_at'].strip(), '%Y-%m-%d %H:%M:%S'))
-                updated_at = make_aware(datetime.strptime(row['updated_at'].strip(), '%Y-%m-%d %H:%M:%S'))
-                
-                word, created = Word.objects.get_or_create(
-                    english=row['english'].strip(),
-                    defaults={
-                        'korean': row['korean'].strip(),
-                        'part_of_speech': row['part_of_speech'].strip(),
-                        'difficulty': row['difficulty'].strip(),
-                        'example_sentence': row['example_sentence'].strip() if row['example_sentence'] else '',
-                        'example_translation': row['example_translation'].strip() if row['example_translation'] else '',
-                        'created_at': created_at,
-                        'updated_at': updated_at
-                    }
-                )
-                
-                if created:
-                    words_created += 1
-                    self.stdout.write(f'단어 추가됨: {word.english}')
-            
-            self.stdout.write(
-                self.style.SUCCESS(f'성공적으로 {words_created}개의 단어를 가져왔습니다.')
-            ) 
\ No newline at end of file
+        self.verbosity = options['verbosity']
+        self.upsert = options['upsert']
+        self.dry_run = options['dry_run']
+        batch_size = options['batch_size']
+
+        # 기존 단어의 영어 키 -> id 사전을 한 번에 받아 둔다 (행마다 조회하지 않음)
+        self.existing = word_lookup.english_ids()
+        self.counts = {'created': 0, 'updated': 0, 'skipped': 0, 'invalid': 0}
+        processed = 0
+        start = time.perf_counter()
+
+        try:
+            with open(options['csv_file'], 'r', encoding=options['encoding'], newline='') as file:
+                for chunk in self._read_chunks(csv.reader(file), batch_size):
+                    self._import_chunk(chunk)
+                    processed += len(chunk)
+                    elapsed = time.perf_counter() - start
+                    self.stdout.write(f'{processed}행 처리 ({processed / elapsed:,.0f}행/초)')
+        except FileNotFoundError:
+            raise CommandError(f'파일을 찾을 수 없습니다: {options["csv_file"]}')
+
+        # bulk 작업은 signals 를 거치지 않으므로 단어 캐시를 직접 무효화
+        if not self.dry_run and (self.counts['created'] or self.counts['updated']):
+            word_search_index.invalidate()
+            word_lookup.invalidate()
+            distractor_pool.invalidate()
+
+        elapsed = time.perf_counter() - start
+        prefix = '[dry-run] ' if self.dry_run else ''
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}추가 {self.counts['created']}개, 갱신 {self.counts['updated']}개, "
+            f"건너뜀 {self.counts['skipped']}개, 잘못된 행 {self.counts['invalid']}개 "
+            f"({elapsed:.2f}초, {processed / elapsed if elapsed else 0:,.0f}행/초)"
+        ))
+
+    def _column_map(self, header, first_row):
+        """CSV 헤더에서 필드별 컬럼 위치를 찾는다
+
+        engword_final.csv 처럼 맨 앞의 id 컬럼에 헤더 이름이 없으면 한 칸 밀어서 읽는다.
+        """
+        header = [name.strip() for name in header]
+        missing = [field for field in FIELDS[:2] if field not in header]
+        if missing:
+            raise CommandError(f'CSV 헤더에 필수 컬럼이 없습니다: {", ".join(missing)}')
+
+        offset = 0
+        if ('id' not in header and header[0] == 'english'
+                and first_row[0].strip().isdigit() and len(first_row) > len(header)):
+            offset = 1
+        return {field: header.index(field) + offset for field in FIELDS if field in header}
+
+    def _read_chunks(self, reader, batch_size):
+        header = next(reader, None)
+        if header is None:
+            return
+        first_row = next(reader, None)
+        if first_row is None:
+            return
+        columns = self._column_map(header, first_row)
+
+        chunk = []
+        line = 1
+        for row in itertools.chain([first_row], reader):
+            line += 1
+            values = {
+                field: row[index].strip() if index < len(row) else ''
+                for field, index in columns.items()
+            }
+            if not values.get('english') or not values.get('korean'):
+                self.counts['invalid'] += 1
+                if self.verbosity >= 2:
+                    self.stderr.write(f'{line}행: 영어/한글 뜻이 비어 있어 건너뜀')
+                continue
+            chunk.append(values)
+            if len(chunk) >= batch_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _import_chunk(self, chunk):
+        to_create = {}
+        to_update = {}
+        for values in chunk:
+            key = normalize_english(values['english'])
+            word_id = self.existing.get(key)
+            if word_id == -1:
+                # 이번 실행에서 이미 추가한 단어 (파일 안의 중복)
+                self.counts['skipped'] += 1
+            elif word_id is None:
+                # 같은 파일 안에서 중복된 단어는 나중 행을 사용
+                to_create[key] = values
+            elif self.upsert:
+                to_update[word_id] = values
+            else:
+                self.counts['skipped'] += 1
+
+        self.counts['created'] += len(to_create)
+        if self.dry_run:
+            self.counts['updated'] += len(to_update)
+            for key in to_create:
+                self.existing[key] = -1  # 이후 청크에서 같은 단어를 새 단어로 세지 않도록
+            return
+
+        # 청크 하나를 하나의 트랜잭션으로 처리
+        with transaction.atomic():
+            if to_update:
+                self.counts['updated'] += self._apply_updates(to_update)
+            # bulk_create 는 save() 를 거치지 않으므로 정규화 키를 직접 채운다
+            created = Word.objects.bulk_create([
+                Word(english_key=key, **self._defaults(values)) for key, values in to_create.items()
+            ])
+        for word in created:
+            # MySQL 은 bulk_create 후 pk 를 돌려주지 않으므로 -1 로 표시만 해 둔다
+            self.existing[word.english_key] = word.pk or -1
+
+    def _apply_updates(self, to_update):
+        now = timezone.now()
+        words = Word.objects.in_bulk(list(to_update))
+        changed = []
+        for word_id, values in to_update.items():
+            word = words.get(word_id)
+            if word is None:
+                continue
+            new_values = self._defaults(values)
+            if all(getattr(word, field) == new_values[field] for field in UPDATE_FIELDS[:-1]):
+                self.counts['skipped'] += 1
+                continue
+            for field in UPDATE_FIELDS[:-1]:
+                setattr(word, field, new_values[field])
+            word.updated_at = now
+            changed.append(word)
+
+        Word.objects.bulk_update(changed, UPDATE_FIELDS, batch_size=1000)
+        return len(changed)
+
+    @staticmethod
+    def _defaults(values):
+        return {
+            # bulk_create 는 save() 를 거치지 않으므로 save() 와 같이 소문자로 저장
+            'english': values['english'].strip().lower(),
+            'korean': values['korean'],
+            'part_of_speech': values.get('part_of_speech') or 'noun',
+            'difficulty': values.get('difficulty') or 'medium',
+            'example_sentence': values.get('example_sentence', ''),
+            'example_translation': values.get('example_translation', ''),
+        }
@@ -0,0 +1,37 @@
+from django.db import migrations, models
+
+
+def fill_english_key(apps, schema_editor):
+    """기존 단어의 english_key 채우기 (같은 키가 여러 개면 id 가 가장 작은 단어만)"""
+    Word = apps.get_model('vocabulary', 'Word')
+    seen = set()
+    words = []
+    for word in Word.objects.order_by('id').only('id', 'english').iterator():
+        key = ' '.join((word.english or '').split()).lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        word.english_key = key
+        words.append(word)
+    Word.objects.bulk_update(words, ['english_key'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocabulary', '0008_personalwordlist'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='english_key',
+            field=models.CharField(editable=False, max_length=100, null=True, verbose_name='영어 키'),
+        ),
+        migrations.RunPython(fill_english_key, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='word',
+            name='english_key',
+            field=models.CharField(editable=False, max_length=100, null=True, unique=True, verbose_name='영어 키'),
+        ),
+    ]
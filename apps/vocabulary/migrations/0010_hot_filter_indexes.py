@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2 on 2026-10-18 02:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocabulary', '0009_word_english_key'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['difficulty', 'english'], name='word_difficulty_english_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2 on 2026-10-18 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocabulary', '0010_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['korean'], name='word_korean_idx'),
+        ),
+    ]
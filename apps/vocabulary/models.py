@@ -1,6 +1,14 @@
+import random
+
 from django.db import models
 from django.conf import settings
 
+
+def normalize_english(english):
+    """단어 조회용 영어 키 (앞뒤/중복 공백 제거 + 소문자)"""
+    return ' '.join((english or '').split()).lower()
+
+
 class Category(models.Model):
     """단어 카테고리 모델"""
     name = models.CharField('카테고리명', max_length=50)
@@ -16,6 +24,67 @@ class Category(models.Model):
     def __str__(self):
         return self.name
 
+class WordQuerySet(models.QuerySet):
+    """단어 쿼리셋 - ORDER BY RAND() 없이 무작위 단어를 뽑는 sample() 제공"""
+
+    PROBE_ROUNDS = 3
+    PROBE_FACTOR = 3
+
+    def sample(self, n, exclude_ids=None, rng=random):
+        """쿼리셋에서 n 개의 단어를 무작위로 뽑아 리스트로 반환
+
+        먼저 id 범위에서 후보 id 를 뽑아 PK 조회로 확인하고 (id 가 빽빽하면
+        1~2번의 조회로 끝남), 조건에 맞는 단어가 드물어 부족하면 정렬 없이
+        id 목록만 읽어 파이썬에서 뽑는다. exclude_ids 는 사용자가 이미 학습한
+        단어처럼 요청마다 한 번 계산해 둔 제외 집합이다.
+        """
+        exclude_ids = set(exclude_ids or ())
+        if n <= 0:
+            return []
+
+        chosen = self._probe_id_range(n, exclude_ids, rng)
+
+        if len(chosen) < n:
+            skip = exclude_ids | set(chosen)
+            ids = [pk for pk in self.order_by().values_list('pk', flat=True) if pk not in skip]
+            chosen += rng.sample(ids, min(n - len(chosen), len(ids)))
+
+        if not chosen:
+            return []
+        words = self.order_by().in_bulk(chosen)
+        return [words[pk] for pk in chosen if pk in words]
+
+    def _probe_id_range(self, n, exclude_ids, rng):
+        # MIN()/MAX() 를 한 쿼리로 묶으면 SQLite 가 인덱스 최적화를 못 하므로 양 끝을 따로 조회
+        lo = self.order_by('pk').values_list('pk', flat=True).first()
+        hi = self.order_by('-pk').values_list('pk', flat=True).first()
+        if lo is None:
+            return []
+
+        chosen = []
+        tried = set(exclude_ids)
+        span = hi - lo + 1
+        for _ in range(self.PROBE_ROUNDS):
+            remaining = n - len(chosen)
+            if remaining <= 0 or len(tried) >= span:
+                break
+            candidates = set()
+            for _ in range(remaining * self.PROBE_FACTOR):
+                pk = rng.randint(lo, hi)
+                if pk not in tried:
+                    candidates.add(pk)
+            if not candidates:
+                continue
+            tried |= candidates
+            found = list(self.order_by().filter(pk__in=candidates).values_list('pk', flat=True))
+            if not found:
+                # 조건에 맞는 id 가 드문 쿼리셋 - id 목록 방식으로 넘긴다
+                break
+            rng.shuffle(found)
+            chosen += found[:remaining]
+        return chosen
+
+
 class Word(models.Model):
     """단어 모델"""
     DIFFICULTY_CHOICES = [
@@ -38,6 +107,8 @@ class Word(models.Model):
     ]
     
     english = models.CharField('영어', max_length=100)
+    # 중복 단어 방지 및 조회용 정규화 키 (save() 에서 채움, bulk_create 시에는 직접 지정)
+    english_key = models.CharField('영어 키', max_length=100, unique=True, null=True, editable=False)
     korean = models.CharField('한글 뜻', max_length=200)
     difficulty = models.CharField(
         '난이도',
@@ -56,12 +127,20 @@ class Word(models.Model):
     is_bookmarked = models.BooleanField('즐겨찾기', default=False)
     created_at = models.DateTimeField('생성일', auto_now_add=True)
     updated_at = models.DateTimeField('수정일', auto_now=True)
-    daily_word_date = models.DateField(null=True, blank=True)  # 오늘의 단어로 선택된 날짜
+    daily_word_date = models.DateField(null=True, blank=True)  # 더 이상 쓰지 않음 (오늘의 단어: study.word_of_the_day, 단어 목록: study.DailyWordAssignment)
+
+    objects = WordQuerySet.as_manager()
 
     class Meta:
         verbose_name = '단어'
         verbose_name_plural = '단어 목록'
         ordering = ['english']
+        indexes = [
+            # 난이도 필터 + 영어 정렬 (단어 목록)
+            models.Index(fields=['difficulty', 'english'], name='word_difficulty_english_idx'),
+            # 한글 뜻 정확히 일치 (오답 노트 추가 시 사전에 없는 단어 확인)
+            models.Index(fields=['korean'], name='word_korean_idx'),
+        ]
 
     def __str__(self):
         return f"{self.english} ({self.korean})"
@@ -69,6 +148,14 @@ class Word(models.Model):
     def save(self, *args, **kwargs):
         # 저장 시 영어는 소문자로 변환
         self.english = self.english.lower()
+        key = normalize_english(self.english)
+        if self.english_key != key:
+            # 같은 철자의 단어가 이미 있으면 키는 먼저 등록된 단어에만 둔다 (중복 단어는 NULL)
+            taken = Word.objects.filter(english_key=key).exclude(pk=self.pk).exists()
+            self.english_key = None if taken else key
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'english' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'english_key'}
         super().save(*args, **kwargs)
 
 class Example(models.Model):
@@ -0,0 +1,303 @@
+"""단어 검색 인덱스
+
+영어 단어/한글 뜻의 n-gram 역색인과 정렬된 접두어 목록을 프로세스 메모리에
+유지해 ``icontains`` 검색(테이블 전체 스캔)을 대신한다.
+
+- 부분 문자열 검색: 1·2-gram 역색인으로 후보를 줄인 뒤 원문으로 확인하므로
+  결과는 ``english__icontains | korean__icontains`` 와 같다.
+- 자동완성: 정렬된 목록에서 이분 탐색으로 접두어를 찾는다. 한글은 자모 단위로
+  분해해 두어 '학ㅅ' 처럼 조합 중인 글자도 '학습' 에 걸린다.
+- 예문: 영어 예문의 단어 토큰 역색인 (순위 검색에서만 사용)
+
+Word 저장/삭제 시 signals 에서 해당 단어만 갱신하고, 다른 워커 프로세스의
+변경 사항은 ``MAX_AGE`` 가 지나면 다시 적재해 반영한다.
+"""
+import bisect
+import re
+import threading
+import time
+from collections import defaultdict, namedtuple
+
+from apps.vocabulary.models import Word
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = (
+    '', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+    'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+)
+
+DIFFICULTY_ORDER = {'easy': 1, 'medium': 2, 'hard': 3}
+
+TOKEN_SPLIT_RE = re.compile(r"[^0-9a-z가-힣ㄱ-ㅎㅏ-ㅣ']+")
+
+IndexedWord = namedtuple('IndexedWord', ['id', 'english', 'korean', 'difficulty', 'example'])
+
+
+def normalize(text):
+    return (text or '').strip().lower()
+
+
+def decompose_hangul(text):
+    """한글 음절을 초성/중성/종성 자모로 분해 ('학습' -> 'ㅎㅏㄱㅅㅡㅂ')"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            result.append(CHOSEONG[offset // 588])
+            result.append(JUNGSEONG[(offset % 588) // 28])
+            result.append(JONGSEONG[offset % 28])
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def ngrams(text):
+    """1-gram 과 2-gram 집합"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def query_grams(text):
+    """검색어로 후보를 좁힐 때 쓰는 gram (2글자 이상이면 2-gram 만)"""
+    if len(text) < 2:
+        return {text}
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def tokenize(text):
+    return [token for token in TOKEN_SPLIT_RE.split(normalize(text)) if token]
+
+
+class WordSearchIndex:
+    """영어/한글 n-gram 역색인 + 접두어 목록 + 예문 토큰 색인"""
+
+    MAX_AGE = 600  # 초
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._loaded_at = 0.0
+        self._reset()
+
+    def _reset(self):
+        self._docs = {}
+        self._english_grams = defaultdict(set)
+        self._korean_grams = defaultdict(set)
+        self._example_tokens = defaultdict(set)
+        self._english_prefix = []  # (english, id) 정렬 목록
+        self._korean_prefix = []   # (뜻 토큰의 자모열, id) 정렬 목록
+
+    # ------------------------------------------------------------------
+    # 적재 / 갱신
+    # ------------------------------------------------------------------
+    def invalidate(self):
+        """다음 조회 때 전체를 다시 적재하도록 표시 (bulk 작업 후 호출)"""
+        with self._lock:
+            self._loaded = False
+
+    def _ensure_loaded(self):
+        if self._loaded and time.monotonic() - self._loaded_at < self.MAX_AGE:
+            return
+        with self._lock:
+            if self._loaded and time.monotonic() - self._loaded_at < self.MAX_AGE:
+                return
+            self._reset()
+            rows = Word.objects.order_by().values_list(
+                'id', 'english', 'korean', 'difficulty', 'example_sentence'
+            )
+            for row in rows:
+                self._add(IndexedWord(*row), keep_sorted=False)
+            self._english_prefix.sort()
+            self._korean_prefix.sort()
+            self._loaded = True
+            self._loaded_at = time.monotonic()
+
+    def update(self, word):
+        """단어 하나를 색인에 반영 (Word post_save)"""
+        with self._lock:
+            if not self._loaded:
+                return
+            self._remove(word.pk)
+            self._add(IndexedWord(
+                word.pk, word.english, word.korean, word.difficulty, word.example_sentence
+            ))
+
+    def remove(self, word_id):
+        """단어 하나를 색인에서 제거 (Word post_delete)"""
+        with self._lock:
+            if self._loaded:
+                self._remove(word_id)
+
+    def _korean_terms(self, korean):
+        # '경영진, 임원' -> ['경영진', '임원']
+        return [term for term in re.split(r'[,;/()\s]+', korean) if term]
+
+    def _add(self, doc, keep_sorted=True):
+        doc = doc._replace(
+            english=normalize(doc.english),
+            korean=normalize(doc.korean),
+            example=normalize(doc.example),
+        )
+        self._docs[doc.id] = doc
+        for gram in ngrams(doc.english):
+            self._english_grams[gram].add(doc.id)
+        for gram in ngrams(doc.korean):
+            self._korean_grams[gram].add(doc.id)
+        for token in set(tokenize(doc.example)):
+            self._example_tokens[token].add(doc.id)
+
+        insert = bisect.insort if keep_sorted else list.append
+        insert(self._english_prefix, (doc.english, doc.id))
+        for term in self._korean_terms(doc.korean):
+            insert(self._korean_prefix, (decompose_hangul(term), doc.id))
+
+    def _remove(self, word_id):
+        doc = self._docs.pop(word_id, None)
+        if doc is None:
+            return
+        for index, grams in (
+            (self._english_grams, ngrams(doc.english)),
+            (self._korean_grams, ngrams(doc.korean)),
+            (self._example_tokens, set(tokenize(doc.example))),
+        ):
+            for gram in grams:
+                postings = index.get(gram)
+                if postings is not None:
+                    postings.discard(word_id)
+                    if not postings:
+                        del index[gram]
+
+        self._discard_sorted(self._english_prefix, (doc.english, word_id))
+        for term in self._korean_terms(doc.korean):
+            self._discard_sorted(self._korean_prefix, (decompose_hangul(term), word_id))
+
+    @staticmethod
+    def _discard_sorted(items, item):
+        position = bisect.bisect_left(items, item)
+        if position < len(items) and items[position] == item:
+            del items[position]
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _candidates(self, index, query):
+        postings = [index.get(gram) for gram in query_grams(query)]
+        if not postings or any(p is None for p in postings):
+            return set()
+        postings.sort(key=len)
+        result = set(postings[0])
+        for p in postings[1:]:
+            result &= p
+            if not result:
+                break
+        return result
+
+    def match_ids(self, query, difficulty=None):
+        """english 또는 korean 에 query 가 포함된 단어 id 집합 (icontains 와 동일)"""
+        query = normalize(query)
+        if not query:
+            return set()
+        self._ensure_loaded()
+        with self._lock:
+            docs = self._docs
+            matched = {
+                word_id for word_id in self._candidates(self._english_grams, query)
+                if query in docs[word_id].english
+            }
+            matched.update(
+                word_id for word_id in self._candidates(self._korean_grams, query)
+                if query in docs[word_id].korean
+            )
+            if difficulty:
+                matched = {word_id for word_id in matched if docs[word_id].difficulty == difficulty}
+        return matched
+
+    def sorted_ids(self, ids):
+        """word_list 와 같은 순서(난이도 -> 영어)로 정렬된 id 목록
+
+        match_ids 이후 다시 적재되어 색인에서 빠진 id 는 맨 뒤에 둔다.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            docs = self._docs
+
+            def sort_key(word_id):
+                doc = docs.get(word_id)
+                if doc is None:
+                    return (len(DIFFICULTY_ORDER) + 1, '')
+                return (DIFFICULTY_ORDER.get(doc.difficulty, 0), doc.english)
+
+            return sorted(ids, key=sort_key)
+
+    def search(self, query, limit=20, include_examples=True):
+        """순위가 매겨진 검색 결과 id 목록
+
+        순위: 영어 일치 > 영어 접두어 > 한글 뜻 단어 일치/접두어 > 부분 일치 > 예문
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        matched = self.match_ids(query)
+        with self._lock:
+            docs = self._docs
+            ranked = {}
+            for word_id in matched:
+                # match_ids 와 이 블록 사이에 다시 적재/삭제되어 색인에서 빠진 단어는 건너뛴다
+                doc = docs.get(word_id)
+                if doc is None:
+                    continue
+                if doc.english == query:
+                    tier = 0
+                elif doc.english.startswith(query):
+                    tier = 1
+                elif any(term.startswith(query) for term in self._korean_terms(doc.korean)):
+                    tier = 2
+                else:
+                    tier = 3
+                ranked[word_id] = tier
+
+            if include_examples:
+                tokens = tokenize(query)
+                if tokens:
+                    postings = [self._example_tokens.get(token, set()) for token in tokens]
+                    for word_id in set.intersection(*postings):
+                        ranked.setdefault(word_id, 4)
+
+            results = sorted(
+                ranked,
+                key=lambda word_id: (ranked[word_id], len(docs[word_id].english), docs[word_id].english)
+            )
+        return results[:limit] if limit else results
+
+    def autocomplete(self, prefix, limit=10):
+        """접두어로 시작하는 단어를 영어 -> 한글 뜻 순서로 반환 [(id, english, korean)]"""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        self._ensure_loaded()
+        results = []
+        seen = set()
+        with self._lock:
+            for items, key in (
+                (self._english_prefix, prefix),
+                (self._korean_prefix, decompose_hangul(prefix)),
+            ):
+                position = bisect.bisect_left(items, (key,))
+                while position < len(items) and len(results) < limit:
+                    value, word_id = items[position]
+                    if not value.startswith(key):
+                        break
+                    if word_id not in seen:
+                        seen.add(word_id)
+                        doc = self._docs[word_id]
+                        results.append((word_id, doc.english, doc.korean))
+                    position += 1
+        return results
+
+
+word_search_index = WordSearchIndex()
@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .lookup import word_lookup
+from .models import Word
+from .search import word_search_index
+
+
+@receiver(post_save, sender=Word)
+def update_search_index(sender, instance, **kwargs):
+    """단어가 추가/수정되면 검색 인덱스에서 해당 단어만 갱신"""
+    word_search_index.update(instance)
+
+
+@receiver(post_delete, sender=Word)
+def remove_from_search_index(sender, instance, **kwargs):
+    """단어가 삭제되면 검색 인덱스에서 제거"""
+    word_search_index.remove(instance.pk)
+
+
+@receiver(post_save, sender=Word)
+@receiver(post_delete, sender=Word)
+def invalidate_word_lookup(sender, **kwargs):
+    """단어가 추가/수정/삭제되면 영어/한글 -> id 사전을 다시 만들도록 표시"""
+    word_lookup.invalidate()
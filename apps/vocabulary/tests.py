@@ -1,3 +1,83 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from .lookup import word_lookup
+from .search import WordSearchIndex
+from .models import Word
+
+
+class ImportWordsTests(TestCase):
+    """import_words 명령 (청크 단위 bulk_create/bulk_update, --upsert, --dry-run)"""
+
+    def setUp(self):
+        Word.objects.create(english='banana', korean='바나나', part_of_speech='noun', difficulty='easy')
+        word_lookup.invalidate()
+
+    def _import(self, rows, *args):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as file:
+            file.write('english,korean,part_of_speech,difficulty\n')
+            file.writelines(f'{line}\n' for line in rows)
+        self.addCleanup(os.remove, file.name)
+        out = StringIO()
+        call_command('import_words', file.name, *args, stdout=out)
+        word_lookup.invalidate()
+        return out.getvalue()
+
+    def test_creates_lowercased_words_and_counts(self):
+        # 같은 파일 안의 중복은 나중 행을 쓰고, 이미 있는 단어는 건너뛴다
+        output = self._import([
+            'apple,사과,noun,easy', 'Banana,바나나 (과일),noun,easy', 'Apple,사과,noun,easy', ',빈 행,noun,easy',
+        ])
+
+        self.assertIn('추가 1개, 갱신 0개, 건너뜀 1개, 잘못된 행 1개', output)
+        apple = Word.objects.get(english_key='apple')
+        self.assertEqual(apple.english, 'apple')
+        self.assertEqual(Word.objects.get(english='banana').korean, '바나나')
+
+    def test_upsert_updates_existing_words(self):
+        output = self._import(['Banana,바나나 (과일),noun,medium', 'Cherry,체리,noun,easy'], '--upsert')
+
+        self.assertIn('추가 1개, 갱신 1개', output)
+        banana = Word.objects.get(english='banana')
+        self.assertEqual((banana.korean, banana.difficulty), ('바나나 (과일)', 'medium'))
+        self.assertTrue(Word.objects.filter(english='cherry').exists())
+
+    def test_dry_run_writes_nothing(self):
+        output = self._import(['Apple,사과,noun,easy', 'Banana,바나나 (과일),noun,medium'], '--upsert', '--dry-run')
+
+        self.assertIn('[dry-run] 추가 1개, 갱신 1개', output)
+        self.assertEqual(list(Word.objects.values_list('english', 'korean')), [('banana', '바나나')])
+
+
+class WordSearchIndexTests(TestCase):
+    """검색 색인의 정렬 조회"""
+
+    def test_sorted_ids_loads_index_and_keeps_unknown_ids_last(self):
+        words = Word.objects.bulk_create([
+            Word(english=english, english_key=english, korean=korean, difficulty=difficulty)
+            for english, korean, difficulty in (('zebra', '얼룩말', 'easy'), ('apple', '사과', 'hard'),
+                                                ('bread', '빵', 'easy'))
+        ])
+        index = WordSearchIndex()
+
+        self.assertEqual(index.sorted_ids([words[1].id, -1, words[0].id, words[2].id]),
+                         [words[2].id, words[0].id, words[1].id, -1])
+
+    def test_search_skips_ids_removed_after_matching(self):
+        word = Word.objects.create(english='apple', korean='사과')
+        index = WordSearchIndex()
+        match_ids = index.match_ids
+
+        def match_then_remove(query, difficulty=None):
+            # 일치 목록을 구한 직후 다른 스레드가 단어를 지운 경우
+            matched = match_ids(query, difficulty)
+            index.remove(word.id)
+            return matched
+
+        with mock.patch.object(index, 'match_ids', side_effect=match_then_remove):
+            self.assertEqual(index.search('apple'), [])
@@ -5,6 +5,7 @@ app_name = 'vocabulary'
 
 urlpatterns = [
     path('words/', views.word_list, name='word_list'),  # 단어 목록
+    path('words/autocomplete/', views.word_autocomplete, name='word_autocomplete'),  # 검색 자동완성
     path('words/add/', views.word_add, name='word_add'),
     path('words/<int:word_id>/edit/', views.word_edit, name='word_edit'),
     path('words/<int:word_id>/delete/', views.word_delete, name='word_delete'),
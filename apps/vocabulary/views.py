@@ -2,15 +2,28 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.db.models import Q, Case, When, Value, IntegerField
+from django.db.models import Case, When, Value, IntegerField, Exists, OuterRef
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 from .models import Word, WordBookmark, PersonalWordList
+from .search import word_search_index
 
 def is_admin(user):
     """관리자 권한 체크"""
     return user.is_superuser or user.is_staff
 
+def _annotate_user_flags(words, user):
+    """북마크 상태와 나만의 단어장 상태를 단어마다 조회하지 않고 서브쿼리로 함께 가져옴
+    (Word.is_bookmarked 필드와 이름이 겹치지 않도록 별도 이름으로 주석을 단다)"""
+    return words.annotate(
+        user_bookmarked=Exists(
+            WordBookmark.objects.filter(user=user, word=OuterRef('pk'))
+        ),
+        is_in_personal_list=Exists(
+            PersonalWordList.objects.filter(user=user, word=OuterRef('pk'))
+        ),
+    )
+
 # Create your views here.
 
 @login_required
@@ -23,44 +36,49 @@ def word_list(request):
     # 사용자의 현재 레벨 가져오기
     user_level = request.user.userlevel.current_level if hasattr(request.user, 'userlevel') else 1
     
-    # 기본 쿼리셋
-    words = Word.objects.all()
-    
-    # 검색어가 있는 경우
     if search_query:
-        words = words.filter(
-            Q(english__icontains=search_query) |
-            Q(korean__icontains=search_query)
-        )
-    
-    # 난이도 필터링
-    if difficulty:
-        words = words.filter(difficulty=difficulty)
-    # 난이도 전체 선택 시에는 필터링하지 않음 (모든 단어 표시)
-    
-    # 난이도 순서로 정렬 (easy -> medium -> hard)
-    words = words.annotate(
-        difficulty_order=Case(
-            When(difficulty='easy', then=Value(1)),
-            When(difficulty='medium', then=Value(2)),
-            When(difficulty='hard', then=Value(3)),
-            default=Value(0),
-            output_field=IntegerField(),
-        )
-    ).order_by('difficulty_order', 'english')
+        # 검색어가 있으면 검색 인덱스에서 (난이도 필터까지 적용해) 정렬된 id 목록을 받아
+        # 페이지네이션하고, 현재 페이지의 단어만 DB 에서 가져온다 (icontains 전체 스캔 없음)
+        matched_ids = word_search_index.match_ids(search_query, difficulty=difficulty)
+        paginator = Paginator(word_search_index.sorted_ids(matched_ids), 20)
+    else:
+        # 기본 쿼리셋
+        words = Word.objects.all()
+        
+        # 난이도 필터링
+        if difficulty:
+            words = words.filter(difficulty=difficulty)
+        # 난이도 전체 선택 시에는 필터링하지 않음 (모든 단어 표시)
+        
+        # 난이도 순서로 정렬 (easy -> medium -> hard)
+        words = words.annotate(
+            difficulty_order=Case(
+                When(difficulty='easy', then=Value(1)),
+                When(difficulty='medium', then=Value(2)),
+                When(difficulty='hard', then=Value(3)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+        ).order_by('difficulty_order', 'english')
+        paginator = Paginator(_annotate_user_flags(words, request.user), 20)  # 페이지당 20개
     
     # 페이지네이션
-    paginator = Paginator(words, 20)  # 페이지당 20개
     page_number = request.GET.get('page', 1)
     try:
         page_obj = paginator.get_page(page_number)
     except:
         page_obj = paginator.get_page(1)
     
-    # 북마크 상태와 나만의 단어장 상태 추가
+    if search_query:
+        page_words = _annotate_user_flags(
+            Word.objects.filter(id__in=page_obj.object_list), request.user
+        ).in_bulk()
+        page_obj.object_list = [
+            page_words[word_id] for word_id in page_obj.object_list if word_id in page_words
+        ]
+    
     for word in page_obj:
-        word.is_bookmarked = word.bookmarks.filter(user=request.user).exists()
-        word.is_in_personal_list = word.personal_lists.filter(user=request.user).exists()
+        word.is_bookmarked = word.user_bookmarked
     
     # 난이도 선택 옵션
     difficulties = [
@@ -78,7 +96,7 @@ def word_list(request):
         'is_admin': is_admin(request.user),
         'user_level': user_level,
         'show_all': request.GET.get('show_all') == 'true',
-        'total_words': words.count()  # 전체 단어 수 추가
+        'total_words': paginator.count  # 전체 단어 수 (페이지네이터가 계산한 값 재사용)
     }
     
     return render(request, 'vocabulary/word_list.html', context)
@@ -92,6 +110,16 @@ def word_detail(request, word_id):
     }
     return render(request, 'vocabulary/word_detail.html', context)
 
+@login_required
+def word_autocomplete(request):
+    """검색창 자동완성 (영어 접두어 또는 한글 뜻 접두어)"""
+    query = request.GET.get('q', '')
+    results = [
+        {'id': word_id, 'english': english, 'korean': korean}
+        for word_id, english, korean in word_search_index.autocomplete(query, limit=10)
+    ]
+    return JsonResponse({'results': results})
+
 @login_required
 def bookmarked_words(request):
     """즐겨찾기한 단어 목록 뷰"""
@@ -106,9 +134,12 @@ def bookmarked_words(request):
     
     # 검색어가 있는 경우
     if search_query:
+        # 사용자 단어 id 와 검색 인덱스 결과의 교집합만 IN 조건으로 사용
+        user_word_ids = set(
+            WordBookmark.objects.filter(user=request.user).values_list('word_id', flat=True)
+        )
         bookmarked_words = bookmarked_words.filter(
-            Q(english__icontains=search_query) |
-            Q(korean__icontains=search_query)
+            id__in=user_word_ids & word_search_index.match_ids(search_query)
         )
     
     # 난이도 필터링
@@ -153,7 +184,7 @@ def bookmarked_words(request):
         'difficulties': difficulties,
         'is_admin': is_admin(request.user),
         'show_bookmarked_only': True,
-        'total_words': bookmarked_words.count()
+        'total_words': paginator.count
     }
     
     return render(request, 'vocabulary/word_list.html', context)
@@ -273,9 +304,12 @@ def personal_word_list(request):
     
     # 검색어가 있는 경우
     if search_query:
+        # 사용자 단어 id 와 검색 인덱스 결과의 교집합만 IN 조건으로 사용
+        user_word_ids = set(
+            PersonalWordList.objects.filter(user=request.user).values_list('word_id', flat=True)
+        )
         personal_words = personal_words.filter(
-            Q(english__icontains=search_query) |
-            Q(korean__icontains=search_query)
+            id__in=user_word_ids & word_search_index.match_ids(search_query)
         )
     
     # 난이도 필터링
@@ -320,7 +354,7 @@ def personal_word_list(request):
         'difficulties': difficulties,
         'is_admin': is_admin(request.user),
         'show_personal_only': True,
-        'total_words': personal_words.count()
+        'total_words': paginator.count
     }
     
     return render(request, 'vocabulary/word_list.html', context)
@@ -50,6 +50,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.study.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -145,6 +146,30 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 MEDIA_URL = 'media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# TTS 음성 합성기 (테스트/오프라인 환경에서는 apps.study.audio.FakeSynthesizer)
+TTS_SYNTHESIZER = os.getenv('TTS_SYNTHESIZER', 'apps.study.audio.GTTSSynthesizer')
+
+# 간격 반복 복습 스케줄러
+SRS_SCHEDULER = os.getenv('SRS_SCHEDULER', 'apps.study.srs.SM2Scheduler')
+
+# 학습 시간 하트비트를 DB 에 반영하는 최소 간격 (초) - apps.study.heartbeats
+STUDY_HEARTBEAT_FLUSH_INTERVAL = int(os.getenv('STUDY_HEARTBEAT_FLUSH_INTERVAL', '120'))
+
+# 배치 작업 예약 시각 변경 {'작업 이름': 'cron 식'} - apps.study.jobs (run_jobs --list 로 확인)
+JOB_SCHEDULES = {}
+
+# 요청 측정 (apps.study.middleware.RequestTimingMiddleware)
+# 쿼리/템플릿까지 측정할 요청 비율 - 나머지는 전체 시간만 잰다
+REQUEST_TIMING_SAMPLE_RATE = float(os.getenv('REQUEST_TIMING_SAMPLE_RATE', '1.0' if DEBUG else '0.1'))
+REQUEST_TIMING_SLOW_MS = int(os.getenv('REQUEST_TIMING_SLOW_MS', '500'))  # 이보다 느린 요청은 로그로 남김
+REQUEST_TIMING_HEADER = os.getenv('REQUEST_TIMING_HEADER', 'True') == 'True'  # Server-Timing 헤더
+
+# 지표 (apps.study.metrics) - 워커가 여러 프로세스면 공유 디렉터리를 지정 (배포 시 비울 것)
+METRICS_DIR = os.getenv('METRICS_DIR') or None
+METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', '5'))  # 초
+METRICS_GAUGE_MAX_AGE = 300  # 이보다 오래 기록이 없는 프로세스의 게이지는 합치지 않음 (초)
+METRICS_ALLOWED_IPS = os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')  # /metrics 수집 허용 IP
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -157,11 +182,31 @@ LOGIN_REDIRECT_URL = 'accounts:home'
 LOGOUT_REDIRECT_URL = 'accounts:home'
 
 # Cache settings
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+# 캐시 설정 (기본: 프로세스 로컬 메모리)
+# CACHE_BACKEND=file 로 지정하면 같은 서버의 여러 워커가 공유하는 파일 캐시를 사용
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+if CACHE_BACKEND == 'file':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_LOCATION', os.path.join(BASE_DIR, 'cache')),
+            'TIMEOUT': 300,
+            'OPTIONS': {
+                'MAX_ENTRIES': 10000,
+            },
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'toeicvoca',
+            'TIMEOUT': 300,
+            'OPTIONS': {
+                'MAX_ENTRIES': 10000,
+            },
+        }
     }
-}
 
 # Email settings
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
@@ -194,6 +239,11 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': True,
         },
+        'apps.study.middleware': {
+            'handlers': ['console', 'file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
         'django.db.backends': {
             'handlers': ['console'],
             'level': 'DEBUG',
@@ -19,6 +19,7 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.views.generic import TemplateView
+from apps.study.views import metrics
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -27,6 +28,7 @@ urlpatterns = [
     path('quiz/', include('apps.quiz.urls')),  # 퀴즈
     path('study/', include('apps.study.urls')),  # 학습 관리
     path('admin-home/', TemplateView.as_view(template_name='admin_home.html'), name='admin_home'),
+    path('metrics', metrics, name='metrics'),  # Prometheus 지표
 ]
 
 